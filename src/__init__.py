@@ -3,13 +3,43 @@ Markdown2Notion MCP Server Package
 
 A FastMCP-based server for uploading Markdown files to Notion.
 Uses filename as page title and supports various Markdown elements.
+
+The public names are imported on first access (PEP 562), so parse-only
+users of MarkdownProcessor do not load fastmcp, notion_client or dotenv.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "0.1.0"
 __author__ = "Markdown2Notion Team"
 
-from .server import main
-from .notion_uploader import NotionUploader
-from .markdown_processor import MarkdownProcessor
+if TYPE_CHECKING:
+    from .markdown_processor import MarkdownProcessor
+    from .notion_uploader import AsyncNotionUploader, NotionUploader
+    from .server import main
+
+# Public name -> submodule defining it
+_LAZY_ATTRIBUTES = {
+    "main": "server",
+    "NotionUploader": "notion_uploader",
+    "AsyncNotionUploader": "notion_uploader",
+    "MarkdownProcessor": "markdown_processor",
+}
+
+__all__ = ["main", "NotionUploader", "AsyncNotionUploader", "MarkdownProcessor"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access and cache it."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Later lookups (and unittest.mock.patch) see a plain module attribute
+    globals()[name] = value
+    return value
+
 
-__all__ = ["main", "NotionUploader", "MarkdownProcessor"]
\ No newline at end of file
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
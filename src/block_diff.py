@@ -0,0 +1,179 @@
+"""
+Block diff module for updating existing Notion pages in place.
+Compares freshly parsed blocks with a page's current children and plans the
+minimal set of update, delete and insert-after operations.
+"""
+
+import json
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Tuple
+
+# Keys of a block body that are compared as content rather than attributes
+_CONTENT_KEYS = ("rich_text", "children")
+
+
+def _rich_text_signature(rich_text: List[Dict[str, Any]]) -> Tuple[Any, ...]:
+    """
+    Reduce a rich_text array to comparable runs.
+    Works for both locally generated runs and runs returned by the API, and
+    merges adjacent runs with equal formatting since Notion may re-split them.
+    """
+    runs: List[List[Any]] = []
+    for item in rich_text:
+        text = item.get("text") or {}
+        content = text.get("content", item.get("plain_text", ""))
+        link = (text.get("link") or {}).get("url")
+        annotations = tuple(sorted(
+            (key, value)
+            for key, value in (item.get("annotations") or {}).items()
+            if value and value != "default"
+        ))
+        style = (link, annotations)
+        if runs and runs[-1][0] == style:
+            runs[-1][1] += content
+        else:
+            runs.append([style, content])
+    return tuple((style, content) for style, content in runs)
+
+
+def block_signature(block: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Compute a hashable signature of a block's visible content.
+    Default-valued attributes (False, "default", empty lists) are ignored so a
+    block fetched from Notion matches the block it was created from.
+
+    Args:
+        block: Block dict, either parsed locally or returned by the API
+            (API blocks may carry fetched children in their body)
+
+    Returns:
+        Tuple of (type, attributes, rich text runs, children signatures)
+    """
+    block_type = block.get("type")
+    body = block.get(block_type) or {}
+
+    attributes = tuple(sorted(
+        (key, json.dumps(value, sort_keys=True))
+        for key, value in body.items()
+        if key not in _CONTENT_KEYS and value not in (None, False, "default", [], {})
+    ))
+    children = tuple(block_signature(child) for child in body.get("children") or ())
+    return (block_type, attributes, _rich_text_signature(body.get("rich_text") or []), children)
+
+
+def can_update_in_place(current: Dict[str, Any], desired: Dict[str, Any]) -> bool:
+    """
+    Check whether blocks.update can turn current into desired.
+    The API cannot change a block's type or its children through an update.
+    """
+    block_type = desired.get("type")
+    if current.get("type") != block_type:
+        return False
+
+    current_body = current.get(block_type) or {}
+    desired_body = desired.get(block_type) or {}
+    has_children = current.get("has_children") or current_body.get("children")
+    return "rich_text" in desired_body and not has_children and not desired_body.get("children")
+
+
+def plan_block_updates(
+    current: List[Dict[str, Any]],
+    desired: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Plan the operations that turn a page's current children into desired.
+
+    Args:
+        current: Current top-level children, each with an "id"
+        desired: Newly parsed top-level blocks in document order
+
+    Returns:
+        Plan dict with:
+            "deletes": block IDs to delete
+            "updates": (block ID, desired block) pairs for blocks.update
+            "inserts": (after block ID or None, blocks) groups in document order;
+                None only occurs when no current block survives, in which case
+                the group is appended to the (emptied) page
+            "layout": one entry per desired block, either the ID of a kept or
+                updated block or None for an inserted block
+            "unchanged": number of blocks kept as they are
+    """
+    old_signatures = [block_signature(block) for block in current]
+    new_signatures = [block_signature(block) for block in desired]
+
+    # For every desired block: ("keep" | "update", index into current) or None (insert)
+    refs: List[Optional[Tuple[str, int]]] = [None] * len(desired)
+    matcher = SequenceMatcher(None, old_signatures, new_signatures, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            for k in range(i2 - i1):
+                refs[j1 + k] = ("keep", i1 + k)
+        elif tag == "replace":
+            for k in range(min(i2 - i1, j2 - j1)):
+                if can_update_in_place(current[i1 + k], desired[j1 + k]):
+                    refs[j1 + k] = ("update", i1 + k)
+
+    _anchor_leading_inserts(current, desired, refs)
+
+    referenced = {ref[1] for ref in refs if ref}
+    deletes = [block["id"] for i, block in enumerate(current) if i not in referenced]
+    updates = [
+        (current[ref[1]]["id"], desired[j])
+        for j, ref in enumerate(refs)
+        if ref and ref[0] == "update"
+    ]
+
+    inserts: List[Tuple[Optional[str], List[Dict[str, Any]]]] = []
+    layout: List[Optional[str]] = []
+    anchor: Optional[str] = None
+    group: List[Dict[str, Any]] = []
+    for j, ref in enumerate(refs):
+        if ref:
+            if group:
+                inserts.append((anchor, group))
+                group = []
+            anchor = current[ref[1]]["id"]
+            layout.append(anchor)
+        else:
+            group.append(desired[j])
+            layout.append(None)
+    if group:
+        inserts.append((anchor, group))
+
+    return {
+        "deletes": deletes,
+        "updates": updates,
+        "inserts": inserts,
+        "layout": layout,
+        "unchanged": sum(1 for ref in refs if ref and ref[0] == "keep"),
+    }
+
+
+def _anchor_leading_inserts(
+    current: List[Dict[str, Any]],
+    desired: List[Dict[str, Any]],
+    refs: List[Optional[Tuple[str, int]]]
+) -> None:
+    """
+    Make sure no block has to be inserted before the first surviving block.
+    The append endpoint can only insert after an existing block, so the first
+    desired block must reuse a current block (updated in place). Matches are
+    dropped from the front until that is possible; in the worst case every
+    block is re-created.
+    """
+    while True:
+        first = next((j for j, ref in enumerate(refs) if ref), None)
+        if first is None or first == 0:
+            return
+
+        first_old = refs[first][1]
+        # Current blocks before first_old are unreferenced and about to be deleted
+        for i in range(first_old):
+            if can_update_in_place(current[i], desired[0]):
+                refs[0] = ("update", i)
+                return
+
+        refs[first] = None
+        if can_update_in_place(current[first_old], desired[0]):
+            refs[0] = ("update", first_old)
+            return
@@ -0,0 +1,148 @@
+"""
+Compact block model for parsed Markdown.
+Blocks are held as small __slots__ objects while parsing and caching, and
+only expanded into Notion JSON dicts right before they are sent.
+"""
+
+import gc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Block types whose body has no rich_text (e.g. {"divider": {}})
+_TEXTLESS_TYPES = frozenset({"divider", "table"})
+# Attributes that replace the plain text run or nest blocks
+_STRUCTURED_ATTRS = ("rich_text", "children")
+
+# Compact rich text run: (content, annotation names, link URL or None)
+Run = Tuple[str, Tuple[str, ...], Optional[str]]
+
+
+class Block:
+    """
+    A parsed block holding only its type, plain text and non-default attributes.
+    A Block uses a single small object where the equivalent Notion dict needs
+    four dicts and a list, and it is never mutated after parsing, so the same
+    instance can be shared between callers (e.g. through the parse cache).
+    """
+
+    __slots__ = ("type", "text", "attrs")
+
+    def __init__(self, block_type: str, text: str, attrs: Optional[Tuple[Tuple[str, Any], ...]] = None):
+        """
+        Initialize the Block.
+
+        Args:
+            block_type: Notion block type (e.g. "paragraph", "code")
+            text: Plain text content of the block
+            attrs: Extra body attributes as (key, value) pairs, such as
+                (("language", "python"),) for code or (("checked", True),) for to-dos.
+                A "rich_text" attribute holds compact runs (see Run) replacing
+                the single plain run (text is then its plain text), and
+                "children" holds nested block dicts
+        """
+        self.type = block_type
+        self.text = text
+        self.attrs = attrs
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Expand the block into the Notion API representation.
+
+        Returns:
+            A freshly allocated Notion block dict
+        """
+        if self.type in _TEXTLESS_TYPES:
+            body: Dict[str, Any] = {}
+        else:
+            body = {"rich_text": [{"type": "text", "text": {"content": self.text}}]}
+        if self.attrs:
+            for key, value in self.attrs:
+                body[key] = expand_runs(value) if key == "rich_text" else value
+        return {"type": self.type, self.type: body}
+
+    @property
+    def is_plain(self) -> bool:
+        """Whether the block is one unformatted text run without nested blocks."""
+        return not self.attrs or all(key not in _STRUCTURED_ATTRS for key, _ in self.attrs)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Cheaper to pickle than the default __slots__ state dict (used when
+        # blocks are returned from parser worker processes)
+        return (Block, (self.type, self.text, self.attrs))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Block):
+            return NotImplemented
+        return (self.type, self.text, self.attrs) == (other.type, other.text, other.attrs)
+
+    def __hash__(self) -> int:
+        return hash((self.type, self.text, self.attrs))
+
+    def __repr__(self) -> str:
+        return f"Block({self.type!r}, {self.text!r}, {self.attrs!r})"
+
+
+def expand_runs(runs: Iterable[Run]) -> List[Dict[str, Any]]:
+    """
+    Expand compact rich text runs into a Notion rich_text array.
+
+    Args:
+        runs: (content, annotation names, link URL or None) tuples
+
+    Returns:
+        Freshly allocated rich_text items
+    """
+    items = []
+    for content, annotations, link in runs:
+        text: Dict[str, Any] = {"content": content}
+        if link:
+            text["link"] = {"url": link}
+        item: Dict[str, Any] = {"type": "text", "text": text}
+        if annotations:
+            item["annotations"] = dict.fromkeys(annotations, True)
+        items.append(item)
+    return items
+
+
+def to_notion(block: Union[Block, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return the Notion dict of a block, accepting already expanded dicts.
+
+    Args:
+        block: Compact Block or Notion block dict
+
+    Returns:
+        Notion block dict
+    """
+    if isinstance(block, Block):
+        return block.to_dict()
+    return block
+
+
+def expand_blocks(blocks: Iterable[Union[Block, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Expand a batch of blocks into Notion dicts, e.g. one API request's children.
+
+    Args:
+        blocks: Compact Blocks and/or Notion block dicts
+
+    Returns:
+        List of Notion block dicts
+    """
+    return [to_notion(block) for block in blocks]
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Suspend the cyclic garbage collector while bulk-creating blocks.
+    Blocks never form reference cycles, so collections triggered by
+    allocating hundreds of thousands of them would only cost time.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
@@ -0,0 +1,192 @@
+"""
+HTTP connection pool module for Notion API calls.
+Provides a process-wide pooled transport with keep-alive, so every uploader
+reuses the same warm TLS connections instead of opening its own.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+NOTION_API_URL = "https://api.notion.com"
+
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+# Same default as notion-client
+DEFAULT_TIMEOUT = 60.0
+
+
+def env_flag(name: str) -> bool:
+    """Read a boolean environment variable ("1", "true", "yes" or "on")."""
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """
+    Connection pool settings.
+
+    Attributes:
+        max_connections: Maximum number of open connections
+        max_keepalive: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept open
+        timeout: Request timeout in seconds
+        http2: Negotiate HTTP/2 (requires the optional h2 package)
+    """
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY
+    timeout: float = DEFAULT_TIMEOUT
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls) -> "PoolSettings":
+        """
+        Read the settings from the NOTION_HTTP_* environment variables.
+
+        Returns:
+            PoolSettings with defaults for unset variables
+        """
+        return cls(
+            max_connections=int(os.getenv("NOTION_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)),
+            max_keepalive=int(os.getenv("NOTION_HTTP_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE)),
+            keepalive_expiry=float(os.getenv("NOTION_HTTP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY)),
+            timeout=float(os.getenv("NOTION_HTTP_TIMEOUT", DEFAULT_TIMEOUT)),
+            http2=env_flag("NOTION_HTTP2"),
+        )
+
+    @property
+    def timeout_ms(self) -> int:
+        """Request timeout in milliseconds, as notion-client expects it."""
+        return int(self.timeout * 1000)
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """The settings as httpx pool limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+def _use_http2(settings: PoolSettings) -> bool:
+    """Whether HTTP/2 is requested and the optional h2 package is installed."""
+    if not settings.http2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def create_transport(settings: PoolSettings) -> httpx.HTTPTransport:
+    """
+    Create a pooled synchronous transport.
+    Falls back to HTTP/1.1 if HTTP/2 is requested but h2 is not installed.
+
+    Args:
+        settings: Pool settings
+
+    Returns:
+        A new HTTPTransport
+    """
+    return httpx.HTTPTransport(limits=settings.limits, http2=_use_http2(settings))
+
+
+def create_async_transport(settings: PoolSettings) -> httpx.AsyncHTTPTransport:
+    """
+    Create a pooled asynchronous transport.
+    Async connections belong to the event loop that opened them, so these are
+    not shared process-wide; each async uploader owns one.
+
+    Args:
+        settings: Pool settings
+
+    Returns:
+        A new AsyncHTTPTransport
+    """
+    return httpx.AsyncHTTPTransport(limits=settings.limits, http2=_use_http2(settings))
+
+
+_shared_settings: Optional[PoolSettings] = None
+_shared_transport: Optional[httpx.HTTPTransport] = None
+_shared_lock = threading.Lock()
+
+
+def get_pool_settings() -> PoolSettings:
+    """
+    Get the process-wide pool settings, read from the environment once.
+
+    Returns:
+        The shared PoolSettings
+    """
+    global _shared_settings
+    with _shared_lock:
+        if _shared_settings is None:
+            _shared_settings = PoolSettings.from_env()
+        return _shared_settings
+
+
+def get_shared_transport() -> httpx.HTTPTransport:
+    """
+    Get the process-wide pooled transport shared by all synchronous uploaders.
+    Each notion-client Client still gets its own httpx.Client (it stores the
+    token and base URL on it), but they all send through this connection pool.
+
+    Returns:
+        The shared HTTPTransport
+    """
+    global _shared_transport
+    settings = get_pool_settings()
+    with _shared_lock:
+        if _shared_transport is None:
+            _shared_transport = create_transport(settings)
+        return _shared_transport
+
+
+def close_shared_transport() -> None:
+    """Close the shared connection pool; the next use creates a new one."""
+    global _shared_settings, _shared_transport
+    with _shared_lock:
+        transport, _shared_transport = _shared_transport, None
+        _shared_settings = None
+    if transport is not None:
+        transport.close()
+
+
+def warm_up(base_url: str = NOTION_API_URL, timeout: float = 5.0) -> bool:
+    """
+    Open a keep-alive connection to the Notion API ahead of the first call.
+    The TLS handshake is paid here instead of by the first upload. Any HTTP
+    response counts as success; no token is sent.
+
+    Args:
+        base_url: API root to connect to
+        timeout: Connection timeout in seconds
+
+    Returns:
+        True if a connection was established, False otherwise
+    """
+    request = httpx.Request(
+        "HEAD", base_url,
+        extensions={"timeout": httpx.Timeout(timeout).as_dict()}
+    )
+    try:
+        response = get_shared_transport().handle_request(request)
+        response.read()
+        response.close()
+    except httpx.HTTPError as e:
+        logger.warning("Could not warm up connection to %s: %s", base_url, e)
+        return False
+    return True
@@ -0,0 +1,311 @@
+"""
+Inline formatting module for the line parser.
+Turns **bold**, *italic*, ~~strikethrough~~, `code` and [links](url) into
+Notion rich_text runs in a single left-to-right pass over the text.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import handling for direct execution vs module import
+try:
+    from .blocks import Block, Run
+except ImportError:
+    from blocks import Block, Run
+
+# Characters that can start or end markup
+_SPECIAL_RE = re.compile(r"[\\`*_~\[\]]")
+_BACKTICKS_RE = re.compile(r"`+")
+_WHITESPACE_RE = re.compile(r"\s")
+
+_ESCAPABLE = frozenset("!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~")
+
+# (delimiter character, run length) -> annotations it switches on
+_STYLES = {
+    ("*", 1): ("italic",),
+    ("_", 1): ("italic",),
+    ("*", 2): ("bold",),
+    ("_", 2): ("bold",),
+    ("*", 3): ("bold", "italic"),
+    ("_", 3): ("bold", "italic"),
+    ("~", 2): ("strikethrough",),
+}
+
+# Notion rejects links it cannot resolve, so relative links stay plain text
+LINK_SCHEMES = ("http://", "https://", "mailto:")
+
+
+class _Marker:
+    """A delimiter run or link bracket; rendered as its source text unless it was matched."""
+
+    __slots__ = ("source", "kind", "value", "opening", "depth", "alive")
+
+    def __init__(self, source: str, kind: Optional[str] = None, value: Any = None, opening: bool = False):
+        self.source = source
+        # None (literal), "style" (value: annotations), "code" (value: code text) or "link" (value: URL or None)
+        self.kind = kind
+        self.value = value
+        self.opening = opening
+        # Position in the opener stack, and whether it may still be matched
+        self.depth = 0
+        self.alive = True
+
+
+def append_run(runs: List[Run], content: str, annotations: Tuple[str, ...], link: Optional[str]) -> None:
+    """
+    Append a compact run, or extend the last run if it has the same formatting.
+
+    Args:
+        runs: Runs built so far
+        content: Text of the run (empty text is ignored)
+        annotations: Sorted names of the annotations switched on for the run
+        link: URL the run links to, if any
+    """
+    if not content:
+        return
+    if runs and runs[-1][1] == annotations and runs[-1][2] == link:
+        runs[-1] = (runs[-1][0] + content, annotations, link)
+    else:
+        runs.append((content, annotations, link))
+
+
+def with_annotation(annotations: Tuple[str, ...], name: str) -> Tuple[str, ...]:
+    """Sorted annotation names with one more switched on."""
+    return annotations if name in annotations else tuple(sorted(annotations + (name,)))
+
+
+def text_block(block_type: str, runs: List[Run], attrs: Tuple[Tuple[str, Any], ...] = ()) -> Block:
+    """
+    Build a block from compact runs, keeping them only when there is formatting.
+
+    Args:
+        block_type: Notion block type
+        runs: Compact runs of the block
+        attrs: Further body attributes
+
+    Returns:
+        A plain Block if the runs are at most one unformatted run, otherwise a
+        Block with a "rich_text" attribute
+    """
+    text = "".join(content for content, _, _ in runs)
+    if len(runs) > 1 or any(annotations or link for _, annotations, link in runs):
+        attrs = (("rich_text", tuple(runs)),) + attrs
+    return Block(block_type, text, attrs or None)
+
+
+def inline_block(block_type: str, text: str, attrs: Tuple[Tuple[str, Any], ...] = ()) -> Block:
+    """
+    Build a block from Markdown text with inline formatting.
+
+    Args:
+        block_type: Notion block type
+        text: Markdown source of the block's text
+        attrs: Further body attributes
+
+    Returns:
+        The block; text that cannot contain markup costs a few substring
+        searches, which are several times faster than a regex over the text
+    """
+    if not ("*" in text or "_" in text or "`" in text or "](" in text or "~~" in text or "\\" in text):
+        return Block(block_type, text, attrs or None)
+    return text_block(block_type, format_inline(text), attrs)
+
+
+def format_inline(text: str) -> List[Run]:
+    """
+    Convert Markdown inline formatting into compact rich text runs.
+    Runs of '*' or '_' (one to three) and '~~' are matched with the nearest
+    open run of the same character and length; unmatched delimiters stay
+    literal text. Code spans take precedence, links need an absolute URL
+    (others keep only their text), and backslash escapes are honoured.
+    Every character is looked at a bounded number of times, so long
+    paragraphs with many unmatched delimiters stay linear.
+
+    Args:
+        text: Markdown source of one block's text
+
+    Returns:
+        Compact runs (see blocks.Run), adjacent runs with the same formatting merged
+    """
+    return _render(_scan(text))
+
+
+def _scan(text: str) -> List[Any]:
+    """Split text into literal strings and markers, matching delimiters as they are closed."""
+    pieces: List[Any] = []
+    stack: List[_Marker] = []
+    openers: Dict[Tuple[str, int], List[_Marker]] = {}
+    bracket: Optional[_Marker] = None
+    bracket_bottom = 0
+    closing_backticks = _BacktickIndex(text) if "`" in text else None
+    # Brackets are plain text unless some "](" could close a link
+    links = "](" in text
+    # Monotonic lookahead positions, so failed link candidates never rescan text
+    next_paren = next_space = -2
+    length = len(text)
+    search = _SPECIAL_RE.search
+    pos = i = 0
+
+    while True:
+        match = search(text, i)
+        if match is None:
+            break
+        j = match.start()
+        char = text[j]
+
+        if char == "\\":
+            if j + 1 < length and text[j + 1] in _ESCAPABLE:
+                pieces.append(text[pos:j])
+                pieces.append(text[j + 1])
+                pos = i = j + 2
+            else:
+                i = j + 1
+            continue
+
+        end = j + 1
+        if char != "[" and char != "]":
+            while end < length and text[end] == char:
+                end += 1
+
+        if char == "`":
+            close = closing_backticks.find(end, end - j)
+            if close is not None:
+                pieces.append(text[pos:j])
+                pieces.append(_Marker(text[j:close + end - j], "code", text[end:close]))
+                pos = i = close + end - j
+            else:
+                i = end
+            continue
+
+        if not links and (char == "[" or char == "]"):
+            i = end
+            continue
+
+        if char == "[":
+            pieces.append(text[pos:j])
+            bracket = _Marker("[")
+            bracket_bottom = len(stack)
+            pieces.append(bracket)
+            pos = i = end
+            continue
+
+        if char == "]":
+            i = end
+            if bracket is None or not text.startswith("(", end):
+                continue
+            if next_paren < end + 1:
+                next_paren = text.find(")", end + 1)
+                if next_paren == -1:
+                    next_paren = length
+            if next_space < end + 1:
+                space = _WHITESPACE_RE.search(text, end + 1)
+                next_space = space.start() if space else length
+            if next_paren == length or next_paren == end + 1 or next_space < next_paren:
+                continue
+            url = text[end + 1:next_paren]
+            bracket.kind, bracket.value, bracket.opening = "link", url if url.startswith(LINK_SCHEMES) else None, True
+            # Delimiters opened inside the link text cannot be closed after it
+            for marker in stack[bracket_bottom:]:
+                marker.alive = False
+            del stack[bracket_bottom:]
+            pieces.append(text[pos:j])
+            pieces.append(_Marker(text[j:next_paren + 1], "link", bracket.value))
+            bracket = None
+            pos = i = next_paren + 1
+            continue
+
+        # Emphasis or strikethrough delimiter run
+        i = end
+        key = (char, end - j)
+        if key not in _STYLES:
+            continue
+        before = text[j - 1] if j else " "
+        after = text[end] if end < length else " "
+        can_open = not after.isspace()
+        can_close = not before.isspace()
+        if char == "_":
+            # snake_case words are not emphasis
+            can_open = can_open and not before.isalnum()
+            can_close = can_close and not after.isalnum()
+
+        candidates = openers.get(key)
+        while candidates and not candidates[-1].alive:
+            candidates.pop()
+        if can_close and candidates:
+            opener = candidates.pop()
+            for marker in stack[opener.depth:]:
+                marker.alive = False
+            del stack[opener.depth:]
+            if bracket is not None and opener.depth < bracket_bottom:
+                # The emphasis spans the '[', which therefore cannot start a link
+                bracket = None
+            opener.kind, opener.value, opener.opening = "style", _STYLES[key], True
+            pieces.append(text[pos:j])
+            pieces.append(_Marker(text[j:end], "style", _STYLES[key]))
+            pos = end
+        elif can_open:
+            marker = _Marker(text[j:end])
+            marker.depth = len(stack)
+            stack.append(marker)
+            openers.setdefault(key, []).append(marker)
+            pieces.append(text[pos:j])
+            pieces.append(marker)
+            pos = end
+
+    pieces.append(text[pos:])
+    return pieces
+
+
+def _render(pieces: List[Any]) -> List[Run]:
+    """Turn scanned pieces into runs, tracking which styles and link are active."""
+    runs: List[Run] = []
+    active: Dict[str, int] = {}
+    annotations: Tuple[str, ...] = ()
+    link: Optional[str] = None
+    # Text of the run being built, joined once its formatting changes
+    parts: List[str] = []
+    run_style: Tuple[Tuple[str, ...], Optional[str]] = ((), None)
+    for piece in pieces:
+        if type(piece) is str:
+            content, style = piece, (annotations, link)
+        elif piece.kind is None:
+            content, style = piece.source, (annotations, link)
+        elif piece.kind == "code":
+            content, style = piece.value, (with_annotation(annotations, "code"), link)
+        elif piece.kind == "link":
+            link = piece.value if piece.opening else None
+            continue
+        else:
+            for name in piece.value:
+                active[name] = active.get(name, 0) + (1 if piece.opening else -1)
+            annotations = tuple(sorted(name for name, count in active.items() if count > 0))
+            continue
+        if not content:
+            continue
+        if style != run_style and parts:
+            runs.append(("".join(parts),) + run_style)
+            parts = []
+        parts.append(content)
+        run_style = style
+    if parts:
+        runs.append(("".join(parts),) + run_style)
+    return runs
+
+
+class _BacktickIndex:
+    """Finds closing backtick runs; each length's candidates are consumed front to back."""
+
+    def __init__(self, text: str):
+        self._starts: Dict[int, List[int]] = {}
+        for match in _BACKTICKS_RE.finditer(text):
+            self._starts.setdefault(match.end() - match.start(), []).append(match.start())
+        self._next: Dict[int, int] = {}
+
+    def find(self, position: int, run_length: int) -> Optional[int]:
+        """Start of the first run of exactly run_length backticks at or after position."""
+        starts = self._starts.get(run_length, ())
+        index = self._next.get(run_length, 0)
+        while index < len(starts) and starts[index] < position:
+            index += 1
+        self._next[run_length] = index
+        return starts[index] if index < len(starts) else None
@@ -0,0 +1,117 @@
+"""
+JSON Lines store module for the local upload state files.
+Keeps records keyed by source file in an append-only JSON Lines file, shared
+by the upload manifest and the upload journal.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class JsonlStore:
+    """
+    Records keyed by their "source" field, persisted as one JSON line each.
+    Writing a record costs O(1) regardless of the file size; later lines
+    supersede earlier ones and a line with "finished": true removes the record.
+    The file is compacted on load when it holds many stale lines.
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        """
+        Initialize the JsonlStore, loading existing records if present.
+
+        Args:
+            path: Location of the file (created on first write)
+            fsync: Flush every line to disk before returning from a write
+        """
+        self.path = Path(path).expanduser()
+        self.fsync = fsync
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def get(self, source: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the current record of a source.
+
+        Args:
+            source: Record key
+
+        Returns:
+            A copy of the record, or None if there is none
+        """
+        with self._lock:
+            entry = self._entries.get(source)
+        return dict(entry) if entry else None
+
+    def put(self, entry: Dict[str, Any]) -> None:
+        """
+        Persist a record, replacing the previous one of the same source.
+
+        Args:
+            entry: Record with a "source" key
+        """
+        with self._lock:
+            self._append(entry)
+            self._entries[entry["source"]] = entry
+
+    def remove(self, source: str) -> None:
+        """
+        Remove the record of a source, if it has one.
+
+        Args:
+            source: Record key
+        """
+        with self._lock:
+            if self._entries.pop(source, None) is None:
+                return
+            self._append({"source": source, "finished": True})
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """Append one line (called with the lock held)."""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _load(self) -> None:
+        """Replay the file, compacting it when it holds many stale lines."""
+        if not self.path.exists():
+            return
+
+        line_count = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line_count += 1
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted write is ignored
+                    continue
+                if not isinstance(entry, dict) or "source" not in entry:
+                    continue
+                if entry.get("finished"):
+                    self._entries.pop(entry["source"], None)
+                else:
+                    self._entries[entry["source"]] = entry
+
+        if line_count > 2 * len(self._entries) + 100:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the file with one line per current record."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
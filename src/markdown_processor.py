@@ -3,10 +3,122 @@ Markdown processor module for converting Markdown to Notion blocks.
 Handles parsing of Markdown files and conversion to Notion API format.
 """
 
+import os
 import re
-from typing import List, Dict, Any, Tuple
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import TYPE_CHECKING, List, Dict, Any, Callable, Iterable, Iterator, Optional, TextIO, Tuple
 from pathlib import Path
 
+if TYPE_CHECKING:
+    # Imported where the parser pool is used; most documents never need it
+    from concurrent.futures import ProcessPoolExecutor
+
+# Import handling for direct execution vs module import
+try:
+    from .blocks import Block, gc_paused
+    from .inline_formatter import inline_block
+    from .metrics import Metrics, get_default_metrics
+    from .parse_cache import ParseCache
+except ImportError:
+    from blocks import Block, gc_paused
+    from inline_formatter import inline_block
+    from metrics import Metrics, get_default_metrics
+    from parse_cache import ParseCache
+
+# Built-in line-by-line parser; the default unless NOTION_MARKDOWN_PARSER says otherwise
+LINE_BACKEND = "line"
+
+
+class ParserBackend(ABC):
+    """
+    Interface of an alternative Markdown parser selectable in MarkdownProcessor.
+    A backend turns a whole document into compact blocks. Like the line
+    parser's blocks, these may carry formatted "rich_text" runs in their
+    attrs, and unlike them also nested "children".
+    """
+
+    # Bump whenever the blocks produced for the same input change (see PARSER_VERSION)
+    VERSION = "1"
+
+    @abstractmethod
+    def parse(self, content: str) -> List[Block]:
+        """
+        Parse a Markdown document.
+
+        Args:
+            content: The Markdown content to parse
+
+        Returns:
+            Compact blocks in document order
+        """
+
+
+def _load_mistune_backend() -> ParserBackend:
+    try:
+        from .mistune_backend import MistuneBackend
+    except ImportError:
+        from mistune_backend import MistuneBackend
+    return MistuneBackend()
+
+
+# Backend name -> factory; backends are created (and their modules imported) on first use
+_BACKEND_FACTORIES: Dict[str, Callable[[], ParserBackend]] = {"mistune": _load_mistune_backend}
+_backends: Dict[str, ParserBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def register_backend(name: str, factory: Callable[[], ParserBackend]) -> None:
+    """
+    Make a parser backend selectable by name.
+
+    Args:
+        name: Name used in MarkdownProcessor(backend=...), per-call backend
+            arguments and NOTION_MARKDOWN_PARSER
+        factory: Creates the backend on first use
+    """
+    if name == LINE_BACKEND:
+        raise ValueError(f"'{LINE_BACKEND}' is the built-in parser and cannot be replaced")
+    with _backends_lock:
+        _BACKEND_FACTORIES[name] = factory
+        _backends.pop(name, None)
+
+
+def available_backends() -> List[str]:
+    """
+    List the selectable parser backends.
+
+    Returns:
+        Backend names, the built-in line parser first
+    """
+    return [LINE_BACKEND] + sorted(_BACKEND_FACTORIES)
+
+
+def get_backend(name: str) -> ParserBackend:
+    """
+    Get the shared instance of a parser backend.
+
+    Args:
+        name: Backend name (see available_backends)
+
+    Returns:
+        The backend
+
+    Raises:
+        ValueError: If no backend of that name is registered
+    """
+    with _backends_lock:
+        backend = _backends.get(name)
+        if backend is None:
+            factory = _BACKEND_FACTORIES.get(name)
+            if factory is None:
+                raise ValueError(
+                    f"Unknown Markdown parser '{name}' (available: {', '.join(available_backends())})"
+                )
+            backend = _backends[name] = factory()
+        return backend
+
 
 class MarkdownProcessor:
     """
@@ -14,9 +126,55 @@ class MarkdownProcessor:
     Uses filename as page title instead of H1 tags.
     """
 
-    def __init__(self):
-        """Initialize the MarkdownProcessor."""
-        pass
+    # Bump whenever the blocks produced for the same input change, so cached
+    # results and upload manifests built with an older parser are invalidated
+    PARSER_VERSION = "3"
+
+    def __init__(
+        self,
+        cache: Optional[ParseCache] = None,
+        parallel_threshold: Optional[int] = None,
+        metrics: Optional[Metrics] = None,
+        backend: Optional[str] = None
+    ):
+        """
+        Initialize the MarkdownProcessor.
+        
+        Args:
+            cache: Cache of compact blocks consulted by parse_compact and
+                parse_markdown_to_blocks (optional)
+            parallel_threshold: Content length (in characters) from which
+                parse_compact splits the document across worker processes
+                (None keeps parsing serial)
+            metrics: Registry the "read_file" and "parse" stage timings are
+                recorded in (defaults to the process-wide registry)
+            backend: Default parser backend, "line" or a registered backend
+                such as "mistune" (defaults to NOTION_MARKDOWN_PARSER, else "line")
+            
+        Raises:
+            ValueError: If the backend is unknown
+        """
+        self.cache = cache
+        self.parallel_threshold = parallel_threshold
+        self.metrics = metrics or get_default_metrics()
+        self.backend = backend or os.getenv("NOTION_MARKDOWN_PARSER") or LINE_BACKEND
+        if self.backend != LINE_BACKEND:
+            get_backend(self.backend)
+
+    def parser_version(self, backend: Optional[str] = None) -> str:
+        """
+        Version of the blocks a backend produces, for cache keys and upload manifests.
+        
+        Args:
+            backend: Backend name (defaults to the processor's backend)
+            
+        Returns:
+            PARSER_VERSION for the line parser, "<name>-<VERSION>" otherwise
+        """
+        name = backend or self.backend
+        if name == LINE_BACKEND:
+            return self.PARSER_VERSION
+        return f"{name}-{get_backend(name).VERSION}"
 
     def extract_title_from_filepath(self, filepath: str) -> str:
         """
@@ -31,167 +189,291 @@ class MarkdownProcessor:
         path_obj = Path(filepath)
         return path_obj.stem
 
-    def parse_markdown_to_blocks(self, markdown_content: str, title: str = "") -> Tuple[List[Dict[str, Any]], str]:
+    def parse_markdown_to_blocks(
+        self,
+        markdown_content: str,
+        title: str = "",
+        backend: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], str]:
         """
         Parse Markdown content and convert to Notion blocks.
         
         Args:
             markdown_content: The Markdown content to parse
             title: The page title (from filename)
+            backend: Parser backend for this call (defaults to the processor's)
             
         Returns:
             Tuple of (blocks list, title)
         """
-        lines = markdown_content.strip().split('\n')
-        blocks = []
+        blocks, _ = self.parse_compact(markdown_content, backend=backend)
+        return [block.to_dict() for block in blocks], title
+
+    def parse_compact(
+        self,
+        markdown_content: str,
+        title: str = "",
+        backend: Optional[str] = None
+    ) -> Tuple[List[Block], str]:
+        """
+        Parse Markdown content into compact blocks.
+        Blocks are expanded into Notion dicts only when they are sent, which
+        keeps large documents small in memory and cheap to cache.
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].rstrip()
+        Args:
+            markdown_content: The Markdown content to parse
+            title: The page title (from filename)
+            backend: Parser backend for this call (defaults to the processor's)
             
-            # Skip empty lines
-            if not line:
-                i += 1
-                continue
+        Returns:
+            Tuple of (compact blocks list, title)
+        """
+        backend = backend or self.backend
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(markdown_content, self.parser_version(backend))
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached, title
+        
+        with self.metrics.timer("parse"):
+            content = markdown_content.strip()
+            if backend != LINE_BACKEND:
+                blocks = get_backend(backend).parse(content)
+            elif self._use_parallel(content):
+                blocks = self._parse_parallel(content)
+            else:
+                blocks = list(self._iter_compact_from_lines(content.split('\n')))
+        
+        if key is not None:
+            self.cache.put(key, blocks, len(markdown_content))
+        return blocks, title
+
+    def _use_parallel(self, content: str) -> bool:
+        """Decide whether a document is large enough to be worth a process pool."""
+        return (
+            self.parallel_threshold is not None
+            and len(content) >= self.parallel_threshold
+            and (os.cpu_count() or 1) > 1
+        )
+
+    def _parse_parallel(self, content: str) -> List[Block]:
+        """
+        Parse a stripped document in worker processes and stitch the results in order.
+        Falls back to the serial parser if the pool cannot be used.
+        
+        Args:
+            content: Document already stripped like parse_compact does
             
-            # Handle headings (H1-H6) - all treated as content, not page title
-            if line.startswith('#'):
-                level = len(line) - len(line.lstrip('#'))
-                if level <= 6:
-                    heading_text = line[level:].strip()
-                    
-                    if level == 1:
-                        block_type = "heading_1"
-                        block_key = "heading_1"
-                    elif level == 2:
-                        block_type = "heading_2"
-                        block_key = "heading_2"
-                    elif level == 3:
-                        block_type = "heading_3"
-                        block_key = "heading_3"
-                    else:
-                        # For H4-H6, use H3 format in Notion
-                        block_type = "heading_3"
-                        block_key = "heading_3"
-                        heading_text = f"{'#' * (level - 3)} {heading_text}"
-                    
-                    blocks.append({
-                        "type": block_type,
-                        block_key: {
-                            "rich_text": [{"type": "text", "text": {"content": heading_text}}]
-                        }
-                    })
-                    i += 1
-                    continue
-            
-            # Handle code blocks
-            if line.startswith('```'):
-                language = line[3:].strip() or "plain text"
-                code_lines = []
-                i += 1
-                
-                while i < len(lines) and not lines[i].startswith('```'):
-                    code_lines.append(lines[i])
-                    i += 1
-                
-                if i < len(lines):  # Skip the closing ```
-                    i += 1
-                
-                code_content = '\n'.join(code_lines)
-                blocks.append({
-                    "type": "code",
-                    "code": {
-                        "rich_text": [{"type": "text", "text": {"content": code_content}}],
-                        "language": language
-                    }
-                })
-                continue
+        Returns:
+            Exactly the blocks the serial parser produces for content
+        """
+        workers = os.cpu_count() or 1
+        segments = split_at_safe_boundaries(content, workers * _SEGMENTS_PER_WORKER)
+        if len(segments) < 2:
+            return list(self._iter_compact_from_lines(content.split('\n')))
+        
+        from concurrent.futures.process import BrokenProcessPool
+        
+        blocks: List[Block] = []
+        try:
+            # Covers unpickling the results, which happens while map is consumed
+            with gc_paused():
+                for types, texts, attrs in _get_parse_pool().map(_parse_segment, segments):
+                    blocks.extend(map(Block, types, texts, attrs))
+            return blocks
+        except (BrokenProcessPool, OSError):
+            _reset_parse_pool()
+            return list(self._iter_compact_from_lines(content.split('\n')))
+
+    def iter_blocks(self, lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily parse Markdown lines into Notion blocks.
+        Produces exactly the blocks parse_markdown_to_blocks would produce for
+        the joined lines, but holds only the block being built in memory.
+        
+        Args:
+            lines: Markdown lines, with or without their trailing newline
             
-            # Handle bulleted lists
-            if line.startswith('- ') or line.startswith('* '):
-                content = line[2:].strip()
-                blocks.append({
-                    "type": "bulleted_list_item",
-                    "bulleted_list_item": {
-                        "rich_text": [{"type": "text", "text": {"content": content}}]
-                    }
-                })
-                i += 1
-                continue
+        Yields:
+            Notion blocks in document order
+        """
+        return (block.to_dict() for block in self.iter_compact_blocks(lines))
+
+    def iter_compact_blocks(self, lines: Iterable[str]) -> Iterator[Block]:
+        """
+        Lazily parse Markdown lines into compact blocks (see iter_blocks).
+        
+        Args:
+            lines: Markdown lines, with or without their trailing newline
+            
+        Yields:
+            Compact blocks in document order
+        """
+        stripped = (line[:-1] if line.endswith('\n') else line for line in lines)
+        return self._iter_compact_from_lines(self._strip_document(stripped))
+
+    def stream_file(self, filepath: str, backend: Optional[str] = None) -> Tuple[Iterator[Dict[str, Any]], str]:
+        """
+        Stream a Markdown file as Notion blocks, reading it line by line.
+        
+        Args:
+            filepath: Path to the Markdown file
+            backend: Parser backend for this call (defaults to the processor's)
+            
+        Returns:
+            Tuple of (lazy block iterator, page title from filename)
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        blocks, title = self.stream_file_compact(filepath, backend)
+        return (block.to_dict() for block in blocks), title
+
+    def stream_file_compact(self, filepath: str, backend: Optional[str] = None) -> Tuple[Iterator[Block], str]:
+        """
+        Stream a Markdown file as compact blocks (see stream_file).
+        Backends other than the line parser need the whole document, so the
+        file is read completely when the first block is requested.
+        
+        Args:
+            filepath: Path to the Markdown file
+            backend: Parser backend for this call (defaults to the processor's)
+            
+        Returns:
+            Tuple of (lazy compact block iterator, page title from filename)
             
-            # Handle numbered lists
-            numbered_match = re.match(r'^(\d+)\.\s+(.+)$', line)
-            if numbered_match:
-                content = numbered_match.group(2)
-                blocks.append({
-                    "type": "numbered_list_item",
-                    "numbered_list_item": {
-                        "rich_text": [{"type": "text", "text": {"content": content}}]
-                    }
-                })
-                i += 1
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        path_obj = Path(filepath)
+        if not path_obj.exists():
+            raise FileNotFoundError(f"File not found: {filepath}")
+        
+        title = self.extract_title_from_filepath(filepath)
+        return self._stream_path(path_obj, backend or self.backend), title
+
+    def _stream_path(self, path_obj: Path, backend: str) -> Iterator[Block]:
+        """
+        Yield the compact blocks of a file, keeping it open only while iterating.
+        Reading is interleaved with parsing, so both count towards the "parse" stage.
+        """
+        with open(path_obj, 'r', encoding='utf-8') as f:
+            if backend == LINE_BACKEND:
+                blocks = self.iter_compact_blocks(f)
+            else:
+                blocks = self._iter_parsed(f, get_backend(backend))
+            yield from self.metrics.timed_iter(blocks, "parse")
+
+    @staticmethod
+    def _iter_parsed(f: TextIO, backend: ParserBackend) -> Iterator[Block]:
+        """Read a whole file and parse it with a backend once the first block is requested."""
+        yield from backend.parse(f.read().strip())
+
+    @staticmethod
+    def _strip_document(lines: Iterable[str]) -> Iterator[str]:
+        """
+        Apply str.strip() semantics to a document given line by line.
+        Drops leading and trailing blank lines, strips the start of the first
+        line and the end of the last line, holding back at most the trailing
+        blank lines seen so far.
+        """
+        held = None
+        pending_blank: List[str] = []
+        for line in lines:
+            if held is None:
+                if line.strip():
+                    held = line.lstrip()
                 continue
+            if not line.strip():
+                pending_blank.append(line)
+                continue
+            yield held
+            yield from pending_blank
+            pending_blank = []
+            held = line
+        
+        if held is not None:
+            yield held.rstrip()
+
+    def _iter_compact_from_lines(self, lines: Iterable[str]) -> Iterator[Block]:
+        """
+        Convert already-stripped Markdown lines into compact blocks, one line at a time.
+        Every line outside a code block is classified exactly once through _LINE_CLASSIFIERS.
+        
+        Args:
+            lines: Document lines without trailing newlines
             
-            # Handle blockquotes
-            if line.startswith('> '):
-                content = line[2:].strip()
-                blocks.append({
-                    "type": "quote",
-                    "quote": {
-                        "rich_text": [{"type": "text", "text": {"content": content}}]
-                    }
-                })
-                i += 1
+        Yields:
+            Compact blocks in document order
+        """
+        paragraph_lines: List[str] = []
+        code_lines: Optional[List[str]] = None
+        language = "plain text"
+        classifiers = _LINE_CLASSIFIERS
+        
+        for raw_line in lines:
+            # Inside a code block everything up to the closing fence is kept verbatim
+            if code_lines is not None:
+                if raw_line.startswith('```'):
+                    yield self._code_block(code_lines, language)
+                    code_lines = None
+                else:
+                    code_lines.append(raw_line)
                 continue
             
-            # Handle todo items
-            if line.startswith('- [ ]') or line.startswith('- [x]'):
-                checked = line.startswith('- [x]')
-                content = line[5:].strip()
-                blocks.append({
-                    "type": "to_do",
-                    "to_do": {
-                        "rich_text": [{"type": "text", "text": {"content": content}}],
-                        "checked": checked
-                    }
-                })
-                i += 1
+            line = raw_line.rstrip()
+            if not line:
+                if paragraph_lines:
+                    yield self._paragraph_block(paragraph_lines)
+                    paragraph_lines = []
                 continue
             
-            # Handle regular paragraphs
-            # Collect consecutive non-empty lines as a single paragraph
-            paragraph_lines = []
-            while i < len(lines):
-                current_line = lines[i].rstrip()
-                if (not current_line or 
-                    current_line.startswith('#') or 
-                    current_line.startswith('```') or 
-                    current_line.startswith('- ') or 
-                    current_line.startswith('* ') or 
-                    current_line.startswith('> ') or
-                    re.match(r'^\d+\.\s+', current_line)):
-                    break
-                paragraph_lines.append(current_line)
-                i += 1
+            classifier = classifiers.get(line[0])
+            kind = classifier(line) if classifier else None
+            
+            # Plain text starts or continues a paragraph
+            if kind is None:
+                paragraph_lines.append(line)
+                continue
             
             if paragraph_lines:
-                paragraph_content = ' '.join(line for line in paragraph_lines if line)
-                if paragraph_content:
-                    blocks.append({
-                        "type": "paragraph",
-                        "paragraph": {
-                            "rich_text": [{"type": "text", "text": {"content": paragraph_content}}]
-                        }
-                    })
+                yield self._paragraph_block(paragraph_lines)
+                paragraph_lines = []
             
-        return blocks, title
+            block_type, value = kind
+            if block_type == "code":
+                language = value
+                code_lines = []
+            elif block_type == "to_do":
+                checked, content = value
+                yield inline_block("to_do", content, (("checked", checked),))
+            else:
+                yield inline_block(block_type, value)
+        
+        # An unterminated code block runs to the end of the document
+        if code_lines is not None:
+            yield self._code_block(code_lines, language)
+        if paragraph_lines:
+            yield self._paragraph_block(paragraph_lines)
+
+    @staticmethod
+    def _code_block(code_lines: List[str], language: str) -> Block:
+        """Build a code block from the lines between its fences."""
+        return Block("code", '\n'.join(code_lines), (("language", language),))
+
+    @staticmethod
+    def _paragraph_block(paragraph_lines: List[str]) -> Block:
+        """Build a paragraph block joining its (non-empty) lines with spaces."""
+        return inline_block("paragraph", ' '.join(paragraph_lines))
 
-    def process_file(self, filepath: str) -> Tuple[List[Dict[str, Any]], str]:
+    def process_file(self, filepath: str, backend: Optional[str] = None) -> Tuple[List[Dict[str, Any]], str]:
         """
         Process a Markdown file and return Notion blocks and title.
         
         Args:
             filepath: Path to the Markdown file
+            backend: Parser backend for this call (defaults to the processor's)
             
         Returns:
             Tuple of (blocks list, page title from filename)
@@ -207,8 +489,178 @@ class MarkdownProcessor:
         title = self.extract_title_from_filepath(filepath)
         
         # Read and process file content
-        with open(path_obj, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with self.metrics.timer("read_file"):
+            with open(path_obj, 'r', encoding='utf-8') as f:
+                content = f.read()
+        
+        blocks, _ = self.parse_markdown_to_blocks(content, title, backend)
+        return blocks, title
+
+
+# Line classification. Each classifier receives a non-empty, right-stripped line
+# whose first character selected it and returns (block_type, value), or None
+# when the line is plain paragraph text.
+
+_NUMBERED_ITEM_RE = re.compile(r'(\d+)\.\s+(.+)')
+
+_HEADING_TYPES = {1: "heading_1", 2: "heading_2", 3: "heading_3"}
+
+
+def _classify_hash(line: str) -> Optional[Tuple[str, Any]]:
+    """Headings H1-H6; H4-H6 become heading_3 keeping the extra '#' as a prefix."""
+    level = len(line) - len(line.lstrip('#'))
+    if level > 6:
+        return None
+    
+    heading_text = line[level:].strip()
+    if level > 3:
+        heading_text = f"{'#' * (level - 3)} {heading_text}"
+    return _HEADING_TYPES.get(level, "heading_3"), heading_text
+
+
+def _classify_backtick(line: str) -> Optional[Tuple[str, Any]]:
+    """Opening code fence; the value is the language."""
+    if line.startswith('```'):
+        return "code", line[3:].strip() or "plain text"
+    return None
+
+
+def _classify_dash(line: str) -> Optional[Tuple[str, Any]]:
+    """To-do items (checked before bullets, which share the '- ' prefix) and bullets."""
+    if line.startswith('- [ ]'):
+        return "to_do", (False, line[5:].strip())
+    if line.startswith('- [x]') or line.startswith('- [X]'):
+        return "to_do", (True, line[5:].strip())
+    if line.startswith('- '):
+        return "bulleted_list_item", line[2:].strip()
+    return None
+
+
+def _classify_star(line: str) -> Optional[Tuple[str, Any]]:
+    """Bullets written with '* '."""
+    if line.startswith('* '):
+        return "bulleted_list_item", line[2:].strip()
+    return None
+
+
+def _classify_gt(line: str) -> Optional[Tuple[str, Any]]:
+    """Blockquotes."""
+    if line.startswith('> '):
+        return "quote", line[2:].strip()
+    return None
+
+
+def _classify_digit(line: str) -> Optional[Tuple[str, Any]]:
+    """Numbered list items such as '1. First'."""
+    match = _NUMBERED_ITEM_RE.match(line)
+    if match:
+        return "numbered_list_item", match.group(2)
+    return None
+
+
+_LINE_CLASSIFIERS: Dict[str, Callable[[str], Optional[Tuple[str, Any]]]] = {
+    '#': _classify_hash,
+    '`': _classify_backtick,
+    '-': _classify_dash,
+    '*': _classify_star,
+    '>': _classify_gt,
+}
+_LINE_CLASSIFIERS.update({digit: _classify_digit for digit in '0123456789'})
+
+
+# Parallel parsing. A blank line outside a code fence ends every open block and
+# carries no state into the next line, so a document cut at such lines parses
+# into exactly the concatenation of its segments' blocks.
+
+# More segments than workers keeps the pool busy when segments differ in cost
+_SEGMENTS_PER_WORKER = 4
+
+_FENCE_RE = re.compile(r'^```', re.MULTILINE)
+# A line holding nothing but (non-newline) whitespace, with its surrounding newlines
+_BLANK_LINE_RE = re.compile(r'\n[^\S\n]*\n')
+
+
+def split_at_safe_boundaries(content: str, segments: int) -> List[str]:
+    """
+    Split a stripped document into about the given number of segments.
+    Cuts are only made at blank lines outside code fences; the blank lines
+    themselves are dropped since they produce no blocks.
+    
+    Args:
+        content: Document already stripped like parse_compact does
+        segments: Desired number of segments
+        
+    Returns:
+        Segments in document order (a single segment if no safe cut exists)
+    """
+    # Every line starting with ``` toggles between text and code, whichever it was
+    fences = [match.start() for match in _FENCE_RE.finditer(content)]
+    target = max(1, len(content) // max(1, segments))
+    
+    parts: List[str] = []
+    start = 0
+    search_from = target
+    while search_from < len(content):
+        match = _BLANK_LINE_RE.search(content, search_from)
+        if match is None:
+            break
         
-        blocks, _ = self.parse_markdown_to_blocks(content, title)
-        return blocks, title
\ No newline at end of file
+        blank_line_start = match.start() + 1
+        open_fences = bisect_left(fences, blank_line_start)
+        if open_fences % 2:
+            # Inside a code block: retry after its closing fence
+            if open_fences == len(fences):
+                break
+            search_from = fences[open_fences]
+            continue
+        
+        parts.append(content[start:match.start()])
+        start = match.end()
+        search_from = start + target
+    
+    parts.append(content[start:])
+    return parts
+
+
+def _parse_segment(segment: str) -> Tuple[List[str], List[str], List[Any]]:
+    """
+    Parse one segment in a worker process.
+    Blocks are returned as parallel lists of types, texts and attributes,
+    which pickle several times faster than the Block objects themselves.
+    """
+    with gc_paused():
+        blocks = list(MarkdownProcessor()._iter_compact_from_lines(segment.split('\n')))
+        return (
+            [block.type for block in blocks],
+            [block.text for block in blocks],
+            [block.attrs for block in blocks],
+        )
+
+
+_parse_pool: Optional["ProcessPoolExecutor"] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> "ProcessPoolExecutor":
+    """Get the process-wide parser pool, starting it on first use."""
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+    
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # spawn: forking a process that runs server threads is unsafe
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=get_context("spawn")
+            )
+        return _parse_pool
+
+
+def _reset_parse_pool() -> None:
+    """Drop a broken pool so the next parallel parse starts a fresh one."""
+    global _parse_pool
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,389 @@
+"""
+Metrics module for finding upload bottlenecks.
+Collects per-stage timings and per-endpoint Notion API latency, call, 429 and
+byte counts in a process-wide registry, rendered as a summary or in the
+Prometheus text format (optionally written to a file for node_exporter).
+"""
+
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    # Only the hooks touch httpx; keep it out of parse-only imports of this module
+    import httpx
+
+T = TypeVar("T")
+
+PREFIX = "markdown2notion_"
+
+# Upper bounds in seconds; suits both sub-millisecond parses and slow API calls
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Seconds between a metric change and the next write of the Prometheus text file
+DEFAULT_EXPORT_INTERVAL = 5.0
+
+# name -> (type, help)
+_DEFINITIONS = {
+    "stage_seconds": ("histogram", "Time spent in each processing stage"),
+    "api_request_seconds": ("histogram", "Notion API latency until the response headers arrive"),
+    "api_requests_total": ("counter", "Notion API requests by endpoint, method and status"),
+    "api_rate_limited_total": ("counter", "Notion API responses with status 429"),
+    "api_request_bytes_total": ("counter", "Request body bytes sent to the Notion API"),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_ID_SEGMENT = re.compile(r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$")
+
+# Key of the request start time in httpx request extensions
+_START_KEY = "markdown2notion_start"
+
+
+def endpoint_name(path: str) -> str:
+    """
+    Turn an API path into a low-cardinality endpoint label.
+
+    Args:
+        path: URL path such as "/v1/blocks/<uuid>/children"
+
+    Returns:
+        The path without version prefix and with IDs replaced, e.g. "blocks/{id}/children"
+    """
+    segments = [segment for segment in path.split("/") if segment]
+    if segments and segments[0] == "v1":
+        segments = segments[1:]
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in segments)
+
+
+class Histogram:
+    """Cumulative bucket counts, sum and count of observed values (not thread-safe)."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile from the buckets, interpolating linearly like Prometheus does.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            The estimate (the largest bucket bound if it falls above all buckets)
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        previous_bound, previous_count = 0.0, 0
+        for bound, cumulative in zip(self.buckets, self.counts):
+            if cumulative >= rank:
+                in_bucket = cumulative - previous_count
+                fraction = (rank - previous_count) / in_bucket if in_bucket else 1.0
+                return previous_bound + (bound - previous_bound) * fraction
+            previous_bound, previous_count = bound, cumulative
+        return self.buckets[-1]
+
+
+class Metrics:
+    """
+    Thread-safe registry of counters and histograms.
+    Changes schedule a write of the Prometheus text file, if one is configured,
+    at most once per export interval.
+    """
+
+    def __init__(self, textfile: Optional[str] = None, export_interval: float = DEFAULT_EXPORT_INTERVAL):
+        """
+        Initialize the Metrics registry.
+
+        Args:
+            textfile: Path the Prometheus text format is written to (optional)
+            export_interval: Seconds between a change and the next write of textfile
+        """
+        self.textfile = textfile
+        self.export_interval = export_interval
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._lock = threading.Lock()
+        self._export_pending = False
+
+    def inc(self, name: str, labels: Labels = (), amount: float = 1) -> None:
+        """Add amount to a counter."""
+        with self._lock:
+            key = (name, labels)
+            self._counters[key] = self._counters.get(key, 0) + amount
+            schedule = self._mark_dirty()
+        if schedule:
+            self._schedule_export()
+
+    def observe(self, name: str, value: float, labels: Labels = ()) -> None:
+        """Record a value in a histogram."""
+        with self._lock:
+            key = (name, labels)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+            schedule = self._mark_dirty()
+        if schedule:
+            self._schedule_export()
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """
+        Time a block of code as one observation of a stage.
+
+        Args:
+            stage: Stage name (e.g. "parse", "create_page")
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("stage_seconds", time.perf_counter() - start, (("stage", stage),))
+
+    def timed_iter(self, iterable: Iterable[T], stage: str) -> Iterator[T]:
+        """
+        Time the work done producing the items of a lazy iterable as one stage observation.
+        Only the time spent inside the iterable counts, not the consumer's time
+        between items; the observation is recorded when iteration ends.
+
+        Args:
+            iterable: Iterable to wrap (e.g. a streaming parser)
+            stage: Stage name
+
+        Yields:
+            The items of iterable
+        """
+        iterator = iter(iterable)
+        elapsed = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    elapsed += time.perf_counter() - start
+                    return
+                elapsed += time.perf_counter() - start
+                yield item
+        finally:
+            self.observe("stage_seconds", elapsed, (("stage", stage),))
+
+    def _on_request(self, request: "httpx.Request") -> None:
+        """httpx request hook: stamp the start time and count the body size."""
+        import httpx
+
+        request.extensions[_START_KEY] = time.perf_counter()
+        try:
+            size = len(request.content)
+        except httpx.RequestNotRead:
+            size = 0
+        if size:
+            self.inc("api_request_bytes_total", (("endpoint", endpoint_name(request.url.path)),), size)
+
+    def _on_response(self, response: "httpx.Response") -> None:
+        """httpx response hook: record latency, status and rate limiting."""
+        request = response.request
+        endpoint = endpoint_name(request.url.path)
+        start = request.extensions.get(_START_KEY)
+        labels = (("endpoint", endpoint), ("method", request.method))
+        if start is not None:
+            self.observe("api_request_seconds", time.perf_counter() - start, labels)
+        self.inc("api_requests_total", labels + (("status", str(response.status_code)),))
+        if response.status_code == 429:
+            self.inc("api_rate_limited_total", (("endpoint", endpoint),))
+
+    def event_hooks(self) -> Dict[str, List[Any]]:
+        """
+        Event hooks recording API metrics for an httpx.Client.
+
+        Returns:
+            Value for httpx.Client(event_hooks=...)
+        """
+        return {"request": [self._on_request], "response": [self._on_response]}
+
+    def async_event_hooks(self) -> Dict[str, List[Any]]:
+        """
+        Event hooks recording API metrics for an httpx.AsyncClient.
+
+        Returns:
+            Value for httpx.AsyncClient(event_hooks=...)
+        """
+        async def on_request(request: "httpx.Request") -> None:
+            self._on_request(request)
+
+        async def on_response(response: "httpx.Response") -> None:
+            self._on_response(response)
+
+        return {"request": [on_request], "response": [on_response]}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a copy of all metrics.
+
+        Returns:
+            Dictionary with "counters" ({(name, labels): value}) and
+            "histograms" ({(name, labels): {"count", "sum", "p50", "p95"}})
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "histograms": {
+                    key: {
+                        "count": h.count, "sum": h.sum,
+                        "p50": h.quantile(0.5), "p95": h.quantile(0.95),
+                    }
+                    for key, h in self._histograms.items()
+                },
+            }
+
+    def summary(self) -> str:
+        """
+        Render a human readable overview: stages, then API endpoints.
+
+        Returns:
+            Multi-line text
+        """
+        snapshot = self.snapshot()
+        histograms, counters = snapshot["histograms"], snapshot["counters"]
+        lines = ["Stages:"]
+        for (name, labels), h in sorted(histograms.items()):
+            if name == "stage_seconds":
+                lines.append(
+                    f"- {dict(labels)['stage']}: {h['count']} runs, {h['sum']:.3f}s total, "
+                    f"p50 {h['p50'] * 1000:.1f}ms, p95 {h['p95'] * 1000:.1f}ms"
+                )
+        lines.append("API endpoints:")
+        for (name, labels), h in sorted(histograms.items()):
+            if name != "api_request_seconds":
+                continue
+            endpoint, method = dict(labels)["endpoint"], dict(labels)["method"]
+            rate_limited = counters.get(("api_rate_limited_total", (("endpoint", endpoint),)), 0)
+            sent = counters.get(("api_request_bytes_total", (("endpoint", endpoint),)), 0)
+            lines.append(
+                f"- {method} {endpoint}: {h['count']} calls, p50 {h['p50'] * 1000:.1f}ms, "
+                f"p95 {h['p95'] * 1000:.1f}ms, {int(rate_limited)} rate limited, {int(sent)} bytes sent"
+            )
+        return "\n".join(lines)
+
+    def render_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text
+        """
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                (key, (h.buckets, list(h.counts), h.sum, h.count)) for key, h in self._histograms.items()
+            )
+
+        lines: List[str] = []
+        declared = set()
+
+        def declare(name: str) -> str:
+            full = PREFIX + name
+            if name not in declared:
+                kind, help_text = _DEFINITIONS.get(name, ("untyped", name))
+                lines.append(f"# HELP {full} {help_text}")
+                lines.append(f"# TYPE {full} {kind}")
+                declared.add(name)
+            return full
+
+        for (name, labels), value in counters:
+            lines.append(f"{declare(name)}{_format_labels(labels)} {_format_value(value)}")
+        for (name, labels), (buckets, counts, total, count) in histograms:
+            full = declare(name)
+            for bound, cumulative in zip(buckets, counts):
+                lines.append(f"{full}_bucket{_format_labels(labels + (('le', repr(bound)),))} {cumulative}")
+            lines.append(f"{full}_bucket{_format_labels(labels + (('le', '+Inf'),))} {count}")
+            lines.append(f"{full}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{full}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def export(self) -> None:
+        """Write the Prometheus text file now (atomically), if one is configured."""
+        with self._lock:
+            self._export_pending = False
+        if self.textfile is None:
+            return
+        path = os.path.expanduser(self.textfile)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+    def reset(self) -> None:
+        """Forget all recorded values."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _mark_dirty(self) -> bool:
+        """Flag a pending export; returns True if a write must be scheduled (lock held)."""
+        if self.textfile is None or self._export_pending:
+            return False
+        self._export_pending = True
+        return True
+
+    def _schedule_export(self) -> None:
+        """Write the text file after the export interval on a daemon timer."""
+        timer = threading.Timer(self.export_interval, self.export)
+        timer.daemon = True
+        timer.start()
+
+
+def _format_labels(labels: Labels) -> str:
+    """Render labels as {key="value",...} with Prometheus escaping."""
+    if not labels:
+        return ""
+    escaped = (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        for _, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value, without a decimal point for whole numbers."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+_default_metrics: Optional[Metrics] = None
+_default_metrics_lock = threading.Lock()
+
+
+def get_default_metrics() -> Metrics:
+    """
+    Get the process-wide Metrics registry shared by all uploaders.
+    Set NOTION_METRICS_FILE to also write the metrics in the Prometheus text
+    format to that file (e.g. for node_exporter's textfile collector).
+
+    Returns:
+        The shared Metrics instance
+    """
+    global _default_metrics
+    with _default_metrics_lock:
+        if _default_metrics is None:
+            _default_metrics = Metrics(textfile=os.getenv("NOTION_METRICS_FILE") or None)
+        return _default_metrics
@@ -0,0 +1,226 @@
+"""
+mistune parser backend.
+Parses Markdown into mistune's AST and renders it as Notion blocks with
+inline formatting and links like the line parser, plus nested list items,
+multi-paragraph quotes and tables, which the line parser keeps flat.
+"""
+
+import html
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import mistune
+
+# Import handling for direct execution vs module import
+try:
+    from .blocks import Block, Run, expand_runs
+    from .inline_formatter import LINK_SCHEMES, append_run, text_block, with_annotation
+    from .markdown_processor import ParserBackend
+    from .payload_normalizer import split_rich_text
+except ImportError:
+    from blocks import Block, Run, expand_runs
+    from inline_formatter import LINK_SCHEMES, append_run, text_block, with_annotation
+    from markdown_processor import ParserBackend
+    from payload_normalizer import split_rich_text
+
+Token = Dict[str, Any]
+
+_PLUGINS = ["strikethrough", "table", "task_lists", "url"]
+
+_HEADING_TYPES = {1: "heading_1", 2: "heading_2", 3: "heading_3"}
+
+# Inline token type -> Notion annotation it switches on
+_ANNOTATIONS = {"strong": "bold", "emphasis": "italic", "strikethrough": "strikethrough"}
+
+# Notion requires a table's rows in the request creating it, at most 100 per
+# children array; longer tables are continued in further tables
+_MAX_TABLE_ROWS = 100
+
+
+class MistuneBackend(ParserBackend):
+    """
+    Renders mistune's AST as compact blocks.
+    Formatted text is kept as "rich_text" runs (built with the inline
+    formatter's helpers) and nested blocks (list item contents, further quote
+    paragraphs, table rows) as "children" dicts.
+    """
+
+    VERSION = "3"
+
+    def __init__(self):
+        """Initialize the MistuneBackend."""
+        # mistune parsers are not documented as thread-safe; uploads parse concurrently
+        self._local = threading.local()
+
+    def parse(self, content: str) -> List[Block]:
+        """
+        Parse a Markdown document.
+
+        Args:
+            content: The Markdown content to parse
+
+        Returns:
+            Compact blocks in document order
+        """
+        markdown = getattr(self._local, "markdown", None)
+        if markdown is None:
+            markdown = self._local.markdown = mistune.create_markdown(renderer=None, plugins=_PLUGINS)
+        return list(_render_blocks(markdown(content)))
+
+
+def _render_blocks(tokens: Iterable[Token]) -> Iterator[Block]:
+    """Render block-level tokens in order."""
+    for token in tokens:
+        yield from _render_block(token)
+
+
+def _render_block(token: Token) -> Iterator[Block]:
+    """Render one block-level token as zero or more blocks."""
+    kind = token["type"]
+    if kind in ("paragraph", "block_text"):
+        yield _text_block("paragraph", token["children"])
+    elif kind == "heading":
+        level = token["attrs"]["level"]
+        # Like the line parser: H4-H6 become heading_3 keeping the extra '#' as a prefix
+        prefix = f"{'#' * (level - 3)} " if level > 3 else ""
+        yield _text_block(_HEADING_TYPES.get(level, "heading_3"), token["children"], prefix=prefix)
+    elif kind == "block_code":
+        yield _code_block(token)
+    elif kind == "block_quote":
+        yield _container_block("quote", token["children"])
+    elif kind == "list":
+        yield from _list_items(token)
+    elif kind == "thematic_break":
+        yield Block("divider", "")
+    elif kind == "table":
+        yield from _tables(token)
+    elif kind == "block_html":
+        text = token["raw"].strip()
+        if text:
+            yield Block("paragraph", text)
+    elif "children" in token:
+        yield from _render_blocks(token["children"])
+    # blank_line and unknown tokens without content produce nothing
+
+
+def _code_block(token: Token) -> Block:
+    """Build a code block; fenced code keeps its language, indented code is plain text."""
+    info = ((token.get("attrs") or {}).get("info") or "").split()
+    code = token["raw"]
+    if code.endswith("\n"):
+        code = code[:-1]
+    return Block("code", code, (("language", info[0] if info else "plain text"),))
+
+
+def _list_items(token: Token) -> Iterator[Block]:
+    """Render the items of a list as bulleted, numbered or to-do blocks."""
+    ordered = token["attrs"].get("ordered", False)
+    for item in token["children"]:
+        if item["type"] == "task_list_item":
+            yield _container_block("to_do", item["children"], (("checked", bool(item["attrs"]["checked"])),))
+        else:
+            yield _container_block("numbered_list_item" if ordered else "bulleted_list_item", item["children"])
+
+
+def _container_block(block_type: str, tokens: List[Token], attrs: Tuple[Tuple[str, Any], ...] = ()) -> Block:
+    """
+    Build a block whose text is its first paragraph and whose other content
+    becomes nested children (list items and quotes).
+    """
+    tokens = [token for token in tokens if token["type"] != "blank_line"]
+    inline: List[Token] = []
+    if tokens and tokens[0]["type"] in ("paragraph", "block_text"):
+        inline = tokens.pop(0)["children"]
+    children = [block.to_dict() for block in _render_blocks(tokens)]
+    if children:
+        attrs += (("children", children),)
+    return _text_block(block_type, inline, attrs)
+
+
+def _tables(token: Token) -> Iterator[Block]:
+    """Render a table, repeating the header row in continuation tables."""
+    header: Optional[Dict[str, Any]] = None
+    rows: List[Dict[str, Any]] = []
+    width = 0
+    for section in token["children"]:
+        if section["type"] == "table_head":
+            width = len(section["children"])
+            header = _table_row(section["children"], width)
+        else:
+            rows.extend(_table_row(row["children"], width) for row in section["children"])
+
+    per_table = _MAX_TABLE_ROWS - (header is not None)
+    for start in range(0, max(len(rows), 1), per_table):
+        table_rows = ([header] if header is not None else []) + rows[start:start + per_table]
+        yield Block("table", "", (
+            ("table_width", width),
+            ("has_column_header", header is not None),
+            ("has_row_header", False),
+            ("children", table_rows),
+        ))
+
+
+def _table_row(cells: List[Token], width: int) -> Dict[str, Any]:
+    """
+    Build a table_row dict, padding or cutting the cells to the table width.
+    normalize_blocks() does not look into table cells, so long runs are split here.
+    """
+    rendered = [split_rich_text(expand_runs(_rich_text(cell["children"]))) for cell in cells[:width]]
+    rendered.extend([] for _ in range(width - len(rendered)))
+    return {"type": "table_row", "table_row": {"cells": rendered}}
+
+
+def _text_block(
+    block_type: str,
+    inline: List[Token],
+    attrs: Tuple[Tuple[str, Any], ...] = (),
+    prefix: str = ""
+) -> Block:
+    """Build a block from inline tokens, keeping formatted runs only when there is formatting."""
+    runs: List[Run] = []
+    append_run(runs, prefix, (), None)
+    _append_inline(inline, (), None, runs)
+    return text_block(block_type, runs, attrs)
+
+
+def _rich_text(tokens: List[Token]) -> List[Run]:
+    """Render inline tokens as compact runs, merging runs with equal formatting."""
+    runs: List[Run] = []
+    _append_inline(tokens, (), None, runs)
+    return runs
+
+
+def _append_inline(
+    tokens: List[Token],
+    annotations: Tuple[str, ...],
+    link: Optional[str],
+    runs: List[Run]
+) -> None:
+    """Append the runs of inline tokens rendered with the given formatting."""
+    for token in tokens:
+        kind = token["type"]
+        if kind == "text":
+            append_run(runs, html.unescape(token["raw"]), annotations, link)
+        elif kind == "codespan":
+            # Code span text is literal, so entities in it are kept as written
+            append_run(runs, token["raw"], with_annotation(annotations, "code"), link)
+        elif kind == "softbreak":
+            # Like the line parser, lines of a paragraph are joined with spaces
+            append_run(runs, " ", annotations, link)
+        elif kind == "linebreak":
+            append_run(runs, "\n", annotations, link)
+        elif kind in _ANNOTATIONS:
+            _append_inline(token["children"], with_annotation(annotations, _ANNOTATIONS[kind]), link, runs)
+        elif kind in ("link", "image"):
+            url = token["attrs"]["url"]
+            target = url if url.startswith(LINK_SCHEMES) else link
+            if token.get("children"):
+                _append_inline(token["children"], annotations, target, runs)
+            else:
+                append_run(runs, url, annotations, target)
+        elif "children" in token:
+            _append_inline(token["children"], annotations, link, runs)
+        elif "raw" in token:
+            # inline_html and tokens of unknown plugins are kept as text
+            append_run(runs, token["raw"], annotations, link)
+
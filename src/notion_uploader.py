@@ -3,85 +3,1232 @@ Notion API client module for uploading Markdown content to Notion.
 Handles communication with Notion API and page creation.
 """
 
+import asyncio
+import functools
+import logging
 import os
-from typing import List, Dict, Any, Optional
-from notion_client import Client
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from itertools import chain, islice
+from typing import (
+    Callable, Generator, List, Dict, Any, Iterable, Iterator, NamedTuple, Optional, Sequence, Tuple, TypeVar,
+    Union
+)
+import httpx
+from notion_client import AsyncClient, Client
+from notion_client.client import ClientOptions
+from notion_client.errors import RequestTimeoutError
 from dotenv import load_dotenv
 
 # Import handling for direct execution vs module import
 try:
+    from .block_diff import block_signature, plan_block_updates
+    from .blocks import Block
+    from .http_pool import create_async_transport, get_pool_settings, get_shared_transport
     from .markdown_processor import MarkdownProcessor
+    from .metrics import Metrics, get_default_metrics
+    from .parse_cache import ParseCache, get_default_parse_cache
+    from .payload_normalizer import normalize_blocks, split_rich_text
+    from .payload_packer import PayloadPacker
+    from .profiling import profiled
+    from .rate_limiter import RateLimiter, get_default_limiter
+    from .ttl_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL, TTLCache
+    from .upload_journal import UploadJournal
+    from .upload_manifest import UploadManifest
 except ImportError:
+    from block_diff import block_signature, plan_block_updates
+    from blocks import Block
+    from http_pool import create_async_transport, get_pool_settings, get_shared_transport
     from markdown_processor import MarkdownProcessor
+    from metrics import Metrics, get_default_metrics
+    from parse_cache import ParseCache, get_default_parse_cache
+    from payload_normalizer import normalize_blocks, split_rich_text
+    from payload_packer import PayloadPacker
+    from profiling import profiled
+    from rate_limiter import RateLimiter, get_default_limiter
+    from ttl_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL, TTLCache
+    from upload_journal import UploadJournal
+    from upload_manifest import UploadManifest
 
+logger = logging.getLogger(__name__)
 
-class NotionUploader:
+# Manifest "content hash" used for pages that mirror a folder
+_FOLDER_HASH = "folder"
+
+# Attempts per journaled append when the outcome of a request is unknown
+_RESUME_ATTEMPTS = 3
+
+# Called after every confirmed API call with the number of blocks it added
+ProgressCallback = Callable[[int], None]
+
+# Called once before the first API call with the (API calls, blocks sent) totals
+PlanCallback = Callable[[int, int], None]
+
+# Files up to this size are parsed into a list when totals are wanted, so they
+# can be planned without parsing twice; larger files are streamed unplanned
+PLAN_MAX_FILE_BYTES = 4 * 1024 * 1024
+
+# notion-client 3.x retries 429 responses itself, so RateLimiter would never see them
+# and the shared bucket would never pause; 2.x has no such option and never retries
+_CLIENT_RETRY_OPTIONS: Dict[str, Any] = (
+    {"retry": False} if "retry" in getattr(ClientOptions, "__dataclass_fields__", {}) else {}
+)
+
+T = TypeVar("T")
+
+
+class _Call(NamedTuple):
+    """
+    A call a shared upload routine asks its uploader to make.
+    Notion endpoints go through the rate limiter; other calls (file hashing,
+    parsing, manifest and journal writes) may block.
+    """
+
+    func: Callable[..., Any]
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    api: bool
+
+
+# Upload routine shared by both uploaders: yields the calls to make, is sent
+# their results (or thrown their errors) and returns its own result
+_Steps = Generator[_Call, Any, T]
+
+_env_loaded = False
+
+
+def _load_env_once() -> None:
+    """Load the .env file on first use instead of on every uploader construction."""
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+class _NotionUploaderBase(ABC):
+    """
+    Shared, I/O-free logic for the synchronous and asynchronous uploaders.
+    Handles token loading, target resolution and page payload construction.
+    Uploads, updates and metadata lookups are written once as generators of
+    _Call steps, which each subclass runs with its own client in _run_steps.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        manifest: Optional[UploadManifest] = None,
+        parse_cache: Optional[ParseCache] = None,
+        journal: Optional[UploadJournal] = None,
+        metrics: Optional[Metrics] = None,
+        metadata_cache: Optional[TTLCache] = None
+    ):
+        """
+        Initialize the uploader.
+        
+        Args:
+            token: Notion API token (if not provided, loads from environment)
+            rate_limiter: Limiter every Notion call goes through
+                (defaults to the process-wide limiter)
+            manifest: Manifest used to skip unchanged files (defaults to the
+                file named by NOTION_UPLOAD_MANIFEST, if set)
+            parse_cache: Cache of parsed Markdown content (defaults to the
+                process-wide cache)
+            journal: Journal of upload checkpoints used to resume interrupted
+                file uploads (defaults to the file named by NOTION_UPLOAD_JOURNAL, if set)
+            metrics: Registry for stage timings and API metrics (defaults to
+                the process-wide registry)
+            metadata_cache: Cache of retrieved databases and pages (defaults to
+                a cache sized by NOTION_METADATA_CACHE_TTL and NOTION_METADATA_CACHE_SIZE)
+        """
+        # Load environment variables
+        _load_env_once()
+        
+        self.token = token or os.getenv("NOTION_TOKEN")
+        if not self.token:
+            raise ValueError("NOTION_TOKEN is required. Set it as environment variable or pass as parameter.")
+        
+        self.metrics = metrics or get_default_metrics()
+        self.client = self._create_client()
+        if parse_cache is None:
+            parse_cache = get_default_parse_cache()
+        parallel_threshold = os.getenv("NOTION_PARALLEL_PARSE_THRESHOLD")
+        self.processor = MarkdownProcessor(
+            cache=parse_cache,
+            parallel_threshold=int(parallel_threshold) if parallel_threshold else None,
+            metrics=self.metrics
+        )
+        self.rate_limiter = rate_limiter or get_default_limiter()
+        self.packer = PayloadPacker()
+        
+        manifest_path = os.getenv("NOTION_UPLOAD_MANIFEST")
+        if manifest is None and manifest_path:
+            manifest = UploadManifest(manifest_path)
+        self.manifest = manifest
+        
+        journal_path = os.getenv("NOTION_UPLOAD_JOURNAL")
+        if journal is None and journal_path:
+            journal = UploadJournal(journal_path)
+        self.journal = journal
+        
+        if metadata_cache is None:
+            metadata_cache = TTLCache(
+                ttl=float(os.getenv("NOTION_METADATA_CACHE_TTL", DEFAULT_TTL)),
+                max_entries=int(os.getenv("NOTION_METADATA_CACHE_SIZE", DEFAULT_MAX_ENTRIES))
+            )
+        self.metadata_cache = metadata_cache
+        
+        # Locally cached children of pages written by update_page, keyed by page ID
+        self._page_mirrors: Dict[str, List[Dict[str, Any]]] = {}
+
+    @abstractmethod
+    def _create_client(self) -> Any:
+        """Create the underlying Notion API client."""
+
+    @staticmethod
+    def _api(endpoint: Any, *args: Any, **kwargs: Any) -> _Call:
+        """Describe a call of a Notion endpoint (e.g. self.client.pages.create)."""
+        return _Call(endpoint, args, kwargs, True)
+
+    @staticmethod
+    def _blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> _Call:
+        """Describe a local call that may block (run in the default executor by the async uploader)."""
+        return _Call(func, args, kwargs, False)
+
+    def _resolve_parent_page_id(
+        self,
+        parent_url: Optional[str],
+        database_id: Optional[str],
+        parent_page_id: Optional[str]
+    ) -> Optional[str]:
+        """
+        Resolve the parent page ID and validate that a target was given.
+        
+        Args:
+            parent_url: Notion page URL (optional)
+            database_id: Target database ID (optional)
+            parent_page_id: Parent page ID (optional)
+            
+        Returns:
+            The parent page ID (None when uploading into a database)
+            
+        Raises:
+            ValueError: If neither database_id nor parent_page_id is provided
+        """
+        # Extract parent_page_id from URL if provided
+        if parent_url:
+            parent_page_id = self.extract_page_id_from_url(parent_url)
+        
+        if not database_id and not parent_page_id:
+            raise ValueError("Either parent_url, database_id or parent_page_id must be provided")
+        
+        return parent_page_id
+
+    @staticmethod
+    def _metadata_key(kind: str, object_id: str) -> str:
+        """Cache key of a database, data source or page; IDs with and without hyphens share it."""
+        return f"{kind}:{object_id.replace('-', '').lower()}"
+
+    def invalidate_metadata(self, object_id: Optional[str] = None) -> None:
+        """
+        Drop cached database and page information, e.g. after changing a schema
+        outside this uploader.
+        
+        Args:
+            object_id: Database, data source or page ID to drop (drops
+                everything if omitted); a database's data sources are dropped with it
+        """
+        if object_id is None:
+            self.metadata_cache.clear()
+            return
+        database = self.metadata_cache.get(self._metadata_key("database", object_id)) or {}
+        for source in database.get("data_sources") or []:
+            self.metadata_cache.invalidate(self._metadata_key("data_source", source["id"]))
+        for kind in ("database", "data_source", "page"):
+            self.metadata_cache.invalidate(self._metadata_key(kind, object_id))
+
+    @staticmethod
+    def _title_property(schema: Dict[str, Any], database_id: str) -> str:
+        """
+        Find the name of a database's title property.
+        
+        Args:
+            schema: The database's data source as returned by data_sources.retrieve
+                (or, before API version 2025-09-03, the database itself)
+            database_id: The database ID, for the error message
+            
+        Returns:
+            The property name
+            
+        Raises:
+            ValueError: If the schema lists no title property
+        """
+        properties = schema.get("properties") if isinstance(schema, dict) else None
+        if isinstance(properties, dict):
+            for name, prop in properties.items():
+                if isinstance(prop, dict) and prop.get("type") == "title":
+                    return name
+        raise ValueError(f"Could not find the title property of database {database_id}")
+
+    @staticmethod
+    def _build_page_payload(
+        title: str,
+        database_id: Optional[str] = None,
+        parent_page_id: Optional[str] = None,
+        title_property: str = "title"
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Build the parent and properties arguments for pages.create.
+        
+        Args:
+            title: Page title
+            database_id: Target database ID (optional)
+            parent_page_id: Parent page ID (optional)
+            title_property: Name of the database's title property
+            
+        Returns:
+            Tuple of (parent, properties)
+        """
+        # Create page properties
+        properties = {
+            title_property: {
+                "title": split_rich_text([{"text": {"content": title}}])
+            }
+        }
+        
+        # Determine the parent
+        if database_id:
+            parent = {"database_id": database_id}
+        else:
+            parent = {"page_id": parent_page_id}
+        
+        return parent, properties
+
+    def _find_unchanged(
+        self,
+        filepath: str,
+        database_id: Optional[str],
+        parent_page_id: Optional[str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Hash a file and look it up in the manifest.
+        
+        Args:
+            filepath: Path to the Markdown file
+            database_id: Target database ID (optional)
+            parent_page_id: Parent page ID (optional)
+            
+        Returns:
+            Tuple of (content hash, page ID of an identical earlier upload);
+            both are None when no manifest is configured
+            
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        if self.manifest is None:
+            return None, None
+        
+        content_hash = UploadManifest.hash_file(filepath)
+        page_id = self.manifest.lookup(
+            filepath,
+            content_hash,
+            self.processor.parser_version(),
+            UploadManifest.target_key(database_id, parent_page_id)
+        )
+        return content_hash, page_id
+
+    def _find_folder_page(self, folder_path: str, parent_page_id: Optional[str]) -> Optional[str]:
+        """Look up the page previously created for a mirrored folder."""
+        if self.manifest is None:
+            return None
+        
+        return self.manifest.lookup(
+            folder_path,
+            _FOLDER_HASH,
+            self.processor.parser_version(),
+            UploadManifest.target_key(None, parent_page_id)
+        )
+
+    def _record_upload(
+        self,
+        filepath: str,
+        content_hash: Optional[str],
+        database_id: Optional[str],
+        parent_page_id: Optional[str],
+        page_id: str
+    ) -> None:
+        """Record a finished upload in the manifest (no-op without a manifest)."""
+        if self.manifest is None or content_hash is None:
+            return
+        
+        self.manifest.record(
+            filepath,
+            content_hash,
+            self.processor.parser_version(),
+            UploadManifest.target_key(database_id, parent_page_id),
+            page_id
+        )
+
+    def _journal_context(
+        self,
+        filepath: str,
+        content_hash: Optional[str],
+        database_id: Optional[str],
+        parent_page_id: Optional[str]
+    ) -> Dict[str, str]:
+        """Identify a file upload in the journal (the hash may already be known from the manifest)."""
+        return {
+            "filepath": filepath,
+            "content_hash": content_hash or UploadManifest.hash_file(filepath),
+            "processor_version": self.processor.parser_version(),
+            "target": UploadManifest.target_key(database_id, parent_page_id),
+        }
+
+    def _find_checkpoint(self, context: Dict[str, str], resume: bool) -> Optional[Dict[str, Any]]:
+        """
+        Look up the checkpoint to resume from.
+        
+        Raises:
+            ValueError: If resume is requested without a journal
+        """
+        if not resume:
+            return None
+        if self.journal is None:
+            raise ValueError("resume=True requires an upload journal (set NOTION_UPLOAD_JOURNAL)")
+        return self.journal.lookup(**context)
+
+    def _save_checkpoint(
+        self,
+        context: Dict[str, str],
+        page_id: str,
+        blocks_done: int,
+        tail_block_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Record confirmed progress of a file upload."""
+        # Only journaled uploads (see _journaled_steps) save checkpoints
+        assert self.journal is not None
+        return self.journal.checkpoint(
+            page_id=page_id, blocks_done=blocks_done, tail_block_id=tail_block_id, **context
+        )
+
+    @staticmethod
+    def _is_ambiguous_error(error: BaseException) -> bool:
+        """Return True if a failed request may still have been applied (timeouts, 5xx)."""
+        if isinstance(error, (RequestTimeoutError, httpx.TransportError)):
+            return True
+        return getattr(error, "status", None) in (500, 502, 503, 504)
+
+    @staticmethod
+    def _has_landed(
+        parent_id: str,
+        children: List[Dict[str, Any]],
+        listed: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Decide whether an append already reached the page (or block).
+        Appends are atomic, so the blocks following the last checkpoint are
+        either absent or exactly the blocks of the request.
+        
+        Args:
+            parent_id: ID of the page or block being filled
+            children: Blocks of the request
+            listed: Blocks found on the parent after the last checkpoint
+            
+        Returns:
+            True if the request landed, False if nothing follows the checkpoint
+            
+        Raises:
+            RuntimeError: If the parent holds other blocks after the checkpoint
+        """
+        if not listed:
+            return False
+        # Listed blocks do not carry their children, so only the blocks themselves are compared
+        if len(listed) == len(children) and all(
+            block_signature(found)[:-1] == block_signature(sent)[:-1] for found, sent in zip(listed, children)
+        ):
+            return True
+        raise RuntimeError(
+            f"Block {parent_id} was changed after the last upload checkpoint; upload again without resume"
+        )
+
+    def plan_upload(self, blocks: Iterable[Union[Block, Dict[str, Any]]]) -> Tuple[int, int]:
+        """
+        Work out the totals a progress callback will add up to for a new page.
+        
+        Args:
+            blocks: Compact blocks or Notion block dicts (a list, or a second
+                stream of the same content; an iterator is consumed)
+            
+        Returns:
+            Tuple of (API calls, blocks sent)
+        """
+        return self.packer.measure(normalize_blocks(blocks))
+
+    def _log_planned_calls(self, blocks: Iterable[Union[Block, Dict[str, Any]]], title: str) -> None:
+        """
+        Log how many API calls uploading blocks as a new page will take.
+        Streamed (iterator) input cannot be planned ahead without reading it
+        twice, so it is only logged once the upload has finished.
+        """
+        if isinstance(blocks, Sequence) and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Uploading %d blocks to page %r in %d API calls",
+                len(blocks), title, self.packer.count_calls(normalize_blocks(blocks))
+            )
+
+    @staticmethod
+    def _update_kwargs(block: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the blocks.update keyword arguments that rewrite a block's content."""
+        block_type = block["type"]
+        body = {key: value for key, value in block[block_type].items() if key != "children"}
+        return {block_type: body}
+
+    @staticmethod
+    def _is_stale_mirror_error(error: BaseException) -> bool:
+        """Return True if an API error suggests the cached mirror no longer matches the page."""
+        return getattr(error, "status", None) in (400, 404)
+
+    def _store_mirror(
+        self,
+        page_id: str,
+        plan: Dict[str, Any],
+        desired: List[Dict[str, Any]],
+        inserted_ids: List[str]
+    ) -> None:
+        """
+        Cache the page's children after an update so the next update needs no fetch.
+        The mirror is dropped if the append responses did not report every new block ID.
+        """
+        if len(inserted_ids) != sum(1 for block_id in plan["layout"] if block_id is None):
+            self._page_mirrors.pop(page_id, None)
+            return
+        
+        new_ids = iter(inserted_ids)
+        self._page_mirrors[page_id] = [
+            dict(block, id=block_id or next(new_ids))
+            for block_id, block in zip(plan["layout"], desired)
+        ]
+
+    @staticmethod
+    def _update_summary(plan: Dict[str, Any], api_calls: int) -> Dict[str, int]:
+        """Summarize an applied update plan."""
+        return {
+            "unchanged": plan["unchanged"],
+            "updated": len(plan["updates"]),
+            "deleted": len(plan["deletes"]),
+            "inserted": sum(len(blocks) for _, blocks in plan["inserts"]),
+            "api_calls": api_calls,
+        }
+
+    @staticmethod
+    def _collect_markdown_files(directory: str, pattern: str) -> List[Path]:
+        """
+        Collect the Markdown files of a directory in a stable order.
+        
+        Args:
+            directory: Directory to scan
+            pattern: Glob pattern relative to the directory (e.g. "**/*.md")
+            
+        Returns:
+            Sorted list of matching file paths
+            
+        Raises:
+            FileNotFoundError: If the directory doesn't exist
+        """
+        root = Path(directory)
+        if not root.is_dir():
+            raise FileNotFoundError(f"Directory not found: {directory}")
+        
+        return sorted(path for path in root.glob(pattern) if path.is_file())
+
+    @staticmethod
+    def _folder_chain(root: Path, filepath: Path) -> List[Path]:
+        """Return the subfolders between root and filepath, outermost first."""
+        relative_parent = filepath.relative_to(root).parent
+        chain = []
+        for part in relative_parent.parts:
+            chain.append(chain[-1] / part if chain else Path(part))
+        return chain
+
+    @staticmethod
+    def _directory_result(
+        filepath: Path,
+        page_id: Optional[str] = None,
+        error: Optional[BaseException] = None,
+        skipped: bool = False
+    ) -> Dict[str, Any]:
+        """Build one row of the per-file result table returned by upload_directory."""
+        if error:
+            status = "failed"
+        elif skipped:
+            status = "skipped"
+        else:
+            status = "uploaded"
+        return {
+            "filepath": str(filepath),
+            "status": status,
+            "page_id": page_id,
+            "error": str(error) if error else None,
+        }
+
+    @staticmethod
+    def _validate_directory_options(
+        max_workers: int,
+        mirror_folders: bool,
+        database_id: Optional[str]
+    ) -> None:
+        """
+        Validate upload_directory options.
+        
+        Raises:
+            ValueError: If max_workers < 1 or mirroring is requested for a database
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if mirror_folders and database_id:
+            raise ValueError("mirror_folders requires a parent page, not a database")
+
+    def _upload_file_steps(
+        self,
+        filepath: str,
+        database_id: Optional[str],
+        parent_page_id: Optional[str],
+        force: bool,
+        resume: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        plan: Optional[PlanCallback] = None
+    ) -> _Steps[Tuple[str, bool]]:
+        """
+        Upload one file, consulting and updating the manifest and the journal.
+        
+        Returns:
+            Tuple of (page ID, whether the upload was skipped as unchanged)
+        """
+        content_hash, unchanged_page_id = yield self._blocking(
+            self._find_unchanged, filepath, database_id, parent_page_id
+        )
+        if unchanged_page_id and not force:
+            return unchanged_page_id, True
+        
+        # Stream the Markdown file: blocks are parsed as the chunks are sent
+        blocks, title = yield self._blocking(self.processor.stream_file_compact, filepath)
+        
+        # A resumed upload only sends what is left, so only new uploads are planned
+        if plan is not None and not resume:
+            size = yield self._blocking(os.path.getsize, filepath)
+            if size <= PLAN_MAX_FILE_BYTES:
+                blocks = yield self._blocking(list, blocks)
+                plan(*(yield self._blocking(self.plan_upload, blocks)))
+        
+        if self.journal is None and not resume:
+            # Create the page with blocks (handles 100+ block limitation automatically)
+            page_id = yield from self._create_page_steps(blocks, title, database_id, parent_page_id, progress)
+        else:
+            context = yield self._blocking(
+                self._journal_context, filepath, content_hash, database_id, parent_page_id
+            )
+            checkpoint = yield self._blocking(self._find_checkpoint, context, resume)
+            page_id = yield from self._journaled_steps(
+                context, checkpoint, blocks, title, database_id, parent_page_id, progress
+            )
+        yield self._blocking(self._record_upload, filepath, content_hash, database_id, parent_page_id, page_id)
+        return page_id, False
+
+    def _upload_content_steps(
+        self,
+        content: str,
+        title: str,
+        database_id: Optional[str],
+        parent_page_id: Optional[str],
+        progress: Optional[ProgressCallback] = None,
+        plan: Optional[PlanCallback] = None
+    ) -> _Steps[str]:
+        """Parse Markdown content and upload it as a new page."""
+        blocks, _ = yield self._blocking(self.processor.parse_compact, content, title)
+        if plan is not None:
+            plan(*(yield self._blocking(self.plan_upload, blocks)))
+        
+        # Create the page with blocks (handles 100+ block limitation automatically)
+        return (yield from self._create_page_steps(blocks, title, database_id, parent_page_id, progress))
+
+    def _folder_pages_steps(
+        self,
+        root: Path,
+        files: List[Path],
+        parent_page_id: Optional[str],
+        force: bool
+    ) -> _Steps[Dict[Path, str]]:
+        """
+        Find or create the (empty) pages mirroring the subfolders that hold files.
+        Folders are handled outermost first, so each page is created under its parent folder's page.
+        
+        Returns:
+            Dict of folder (relative to root) -> page ID
+        """
+        folder_pages: Dict[Path, str] = {}
+        for filepath in files:
+            parent_id = parent_page_id
+            for folder in self._folder_chain(root, filepath):
+                if folder not in folder_pages:
+                    folder_path = str(root / folder)
+                    page_id = None
+                    if not force:
+                        page_id = yield self._blocking(self._find_folder_page, folder_path, parent_id)
+                    if not page_id:
+                        page_id = yield from self._create_page_steps([], folder.name, parent_page_id=parent_id)
+                        yield self._blocking(self._record_upload, folder_path, _FOLDER_HASH, None, parent_id, page_id)
+                    folder_pages[folder] = page_id
+                parent_id = folder_pages[folder]
+        return folder_pages
+
+    def _update_page_steps(self, page_id: str, markdown: str, use_mirror: bool) -> _Steps[Dict[str, int]]:
+        """
+        Diff markdown's blocks against the page's children and apply the differences.
+        The locally cached mirror is used when allowed and available; if it turns
+        out to be stale, the children are fetched and the diff is planned again.
+        The mirror is only stored back once a whole plan has been applied.
+        """
+        desired, _ = yield self._blocking(self.processor.parse_markdown_to_blocks, markdown)
+        desired = list(normalize_blocks(desired))
+        # The page's last_edited_time changes with its content
+        self.invalidate_metadata(page_id)
+        
+        # A plan that fails part way leaves the page between the mirror and desired
+        mirror = self._page_mirrors.pop(page_id, None)
+        if mirror is not None and use_mirror:
+            try:
+                return (yield from self._block_update_steps(page_id, desired, mirror, 0))
+            except Exception as e:
+                if not self._is_stale_mirror_error(e):
+                    raise
+        
+        current, fetch_calls = yield from self._children_steps(page_id)
+        return (yield from self._block_update_steps(page_id, desired, current, fetch_calls))
+
+    def _list_children_steps(self, block_id: str) -> _Steps[Tuple[List[Dict[str, Any]], int]]:
+        """
+        Fetch the direct children of a block.
+        
+        Returns:
+            Tuple of (children, number of API calls made)
+        """
+        children: List[Dict[str, Any]] = []
+        calls = 0
+        cursor = None
+        while True:
+            kwargs: Dict[str, Any] = {"block_id": block_id, "page_size": 100}
+            if cursor:
+                kwargs["start_cursor"] = cursor
+            response = yield self._api(self.client.blocks.children.list, **kwargs)
+            calls += 1
+            children.extend(response["results"])
+            if not response.get("has_more"):
+                break
+            cursor = response.get("next_cursor")
+        return children, calls
+
+    def _children_steps(self, block_id: str) -> _Steps[Tuple[List[Dict[str, Any]], int]]:
+        """
+        Fetch all children of a block, including nested children.
+        
+        Returns:
+            Tuple of (children, number of API calls made)
+        """
+        children, calls = yield from self._list_children_steps(block_id)
+        
+        for child in children:
+            if child.get("has_children"):
+                nested, nested_calls = yield from self._children_steps(child["id"])
+                child.setdefault(child["type"], {})["children"] = nested
+                calls += nested_calls
+        
+        return children, calls
+
+    def _block_update_steps(
+        self,
+        page_id: str,
+        desired: List[Dict[str, Any]],
+        current: List[Dict[str, Any]],
+        api_calls: int
+    ) -> _Steps[Dict[str, int]]:
+        """Plan and apply the update of a page's children, then refresh the mirror."""
+        plan = plan_block_updates(current, desired)
+        
+        for block_id in plan["deletes"]:
+            yield self._api(self.client.blocks.delete, block_id=block_id)
+            api_calls += 1
+        
+        for block_id, block in plan["updates"]:
+            yield self._api(self.client.blocks.update, block_id=block_id, **self._update_kwargs(block))
+            api_calls += 1
+        
+        inserted_ids: List[str] = []
+        for after, blocks in plan["inserts"]:
+            # Packed like any other append, so request limits hold and deep children are deferred
+            for request in self.packer.pack(blocks, create=False):
+                kwargs: Dict[str, Any] = {"block_id": page_id, "children": request["children"]}
+                if after:
+                    kwargs["after"] = after
+                response = yield self._api(self.client.blocks.children.append, **kwargs)
+                api_calls += 1
+                results = response.get("results", [])
+                new_ids = [result["id"] for result in results]
+                inserted_ids.extend(new_ids)
+                after = new_ids[-1] if new_ids else after
+                for index, nested in request["deferred"]:
+                    api_calls += yield from self._append_steps(
+                        results[index]["id"], self.packer.pack(nested, create=False)
+                    )
+        
+        self._store_mirror(page_id, plan, desired, inserted_ids)
+        return self._update_summary(plan, api_calls)
+
+    def _info_steps(
+        self,
+        kind: str,
+        object_id: str,
+        endpoint: Any,
+        refresh: bool = False
+    ) -> _Steps[Dict[str, Any]]:
+        """
+        Retrieve a database, data source or page through the metadata cache.
+        
+        Args:
+            kind: "database", "data_source" or "page"
+            object_id: The database or page ID
+            endpoint: The matching retrieve endpoint
+            refresh: Fetch from Notion even if a cached copy exists
+        """
+        key = self._metadata_key(kind, object_id)
+        if not refresh:
+            cached = self.metadata_cache.get(key)
+            if cached is not None:
+                return cached
+        info = yield self._api(endpoint, object_id)
+        self.metadata_cache.put(key, info)
+        return info
+
+    def _title_property_steps(self, database_id: Optional[str]) -> _Steps[str]:
+        """
+        Resolve the title property name for a new page from the cached database schema.
+        
+        Args:
+            database_id: Target database ID (None for pages under a page)
+            
+        Returns:
+            The name of the database's title property, or "title" for pages under a page
+            
+        Raises:
+            ValueError: If the database does not have exactly one data source,
+                or its schema has no title property
+        """
+        if not database_id:
+            return "title"
+        schema = yield from self._info_steps("database", database_id, self.client.databases.retrieve)
+        if "properties" not in schema:
+            # Since API version 2025-09-03 the properties live on the database's data source
+            sources = schema.get("data_sources") or []
+            if len(sources) != 1:
+                raise ValueError(
+                    f"Database {database_id} has {len(sources)} data sources; "
+                    "pages can only be created in a database with exactly one"
+                )
+            schema = yield from self._info_steps("data_source", sources[0]["id"], self.client.data_sources.retrieve)
+        return self._title_property(schema, database_id)
+
+    def _create_page_steps(
+        self,
+        blocks: Iterable[Union[Block, Dict[str, Any]]],
+        title: str,
+        database_id: Optional[str] = None,
+        parent_page_id: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> _Steps[str]:
+        """
+        Create a Notion page with blocks, packing them into as few requests as possible.
+        Blocks are consumed lazily, one request at a time, so a streaming parser
+        reads the file while earlier requests are being sent.
+        
+        Args:
+            blocks: Compact blocks or Notion block dicts to add (list or iterator)
+            title: Page title
+            database_id: Target database ID (optional)
+            parent_page_id: Parent page ID (optional)
+            progress: Called after every confirmed API call with the number of blocks it added
+            
+        Returns:
+            The ID of the created Notion page
+        """
+        title_property = yield from self._title_property_steps(database_id)
+        parent, properties = self._build_page_payload(title, database_id, parent_page_id, title_property)
+        yield self._blocking(self._log_planned_calls, blocks, title)
+        requests = self.packer.pack(normalize_blocks(blocks))
+        
+        # Create the page with the first request's blocks
+        first = (yield self._blocking(next, requests))["children"]
+        with self.metrics.timer("create_page"):
+            page = yield self._api(self.client.pages.create, parent=parent, properties=properties, children=first)
+        if progress:
+            progress(len(first))
+        
+        # Append the remaining requests
+        page_id = page["id"]
+        calls = 1 + (yield from self._append_steps(page_id, requests, progress))
+        logger.info("Uploaded page %r (%s) in %d API calls", title, page_id, calls)
+        
+        return page_id
+
+    def _append_steps(
+        self,
+        block_id: str,
+        requests: Iterator[Dict[str, Any]],
+        progress: Optional[ProgressCallback] = None
+    ) -> _Steps[int]:
+        """
+        Send packed requests as appends to a block, then the children deferred by each.
+        
+        Args:
+            block_id: ID of the page or block to append to
+            requests: Requests from PayloadPacker.pack(..., create=False) or
+                the rest of a page's requests after pages.create
+            progress: Called after every append with the number of blocks it added
+            
+        Returns:
+            Number of API calls made
+        """
+        calls = 0
+        while True:
+            request = yield self._blocking(next, requests, None)
+            if request is None:
+                return calls
+            with self.metrics.timer("append"):
+                response = yield self._api(
+                    self.client.blocks.children.append, block_id=block_id, children=request["children"]
+                )
+            calls += 1
+            if progress:
+                progress(len(request["children"]))
+            for index, nested in request["deferred"]:
+                calls += yield from self._append_steps(
+                    response["results"][index]["id"], self.packer.pack(nested, create=False), progress
+                )
+
+    def _journaled_steps(
+        self,
+        context: Dict[str, str],
+        checkpoint: Optional[Dict[str, Any]],
+        blocks: Iterable[Union[Block, Dict[str, Any]]],
+        title: str,
+        database_id: Optional[str],
+        parent_page_id: Optional[str],
+        progress: Optional[ProgressCallback] = None
+    ) -> _Steps[str]:
+        """
+        Upload a file's blocks, journaling a checkpoint after every confirmed request.
+        
+        Args:
+            context: Journal identity of the upload (see _journal_context)
+            checkpoint: Checkpoint to resume from, or None to create a new page
+            blocks: Compact blocks or Notion block dicts of the whole file
+            title: Page title
+            database_id: Target database ID (optional)
+            parent_page_id: Parent page ID (optional)
+            progress: Called after every confirmed API call with the number of blocks it added
+            
+        Returns:
+            The ID of the filled Notion page
+        """
+        # Only reached with a journal: _find_checkpoint rejects resume=True without one
+        journal = self.journal
+        assert journal is not None
+        blocks = normalize_blocks(blocks)
+        if checkpoint is None:
+            requests = self.packer.pack(blocks)
+            first = (yield self._blocking(next, requests))["children"]
+            title_property = yield from self._title_property_steps(database_id)
+            parent, properties = self._build_page_payload(title, database_id, parent_page_id, title_property)
+            with self.metrics.timer("create_page"):
+                page = yield self._api(self.client.pages.create, parent=parent, properties=properties, children=first)
+            checkpoint = yield self._blocking(self._save_checkpoint, context, page["id"], len(first), None)
+            if progress:
+                progress(len(first))
+            verify = False
+        else:
+            logger.info(
+                "Resuming upload of %s into page %s after %d blocks",
+                context["filepath"], checkpoint["page_id"], checkpoint["blocks_done"]
+            )
+            requests = self.packer.pack(islice(blocks, checkpoint["blocks_done"], None), create=False)
+            # The previous run may have stopped between an append and its checkpoint
+            verify = True
+        
+        while True:
+            request = yield self._blocking(next, requests, None)
+            if request is None:
+                break
+            checkpoint = yield from self._checkpointed_steps(context, checkpoint, request, verify, progress)
+            verify = False
+        
+        yield self._blocking(journal.finish, context["filepath"])
+        return checkpoint["page_id"]
+
+    def _checkpointed_steps(
+        self,
+        context: Dict[str, str],
+        checkpoint: Dict[str, Any],
+        request: Dict[str, Any],
+        verify: bool,
+        progress: Optional[ProgressCallback] = None
+    ) -> _Steps[Dict[str, Any]]:
+        """
+        Append one packed request exactly once and journal the new checkpoint.
+        When a request times out or fails with a 5xx error it may still have
+        been applied, so the blocks after the checkpoint are checked before it
+        is sent again.
+        
+        Returns:
+            The new checkpoint
+        """
+        page_id = checkpoint["page_id"]
+        children = request["children"]
+        for attempt in range(_RESUME_ATTEMPTS):
+            if verify:
+                results = yield from self._after_checkpoint_steps(checkpoint, len(children))
+                if self._has_landed(page_id, children, results):
+                    break
+            try:
+                with self.metrics.timer("append"):
+                    results = (yield self._api(
+                        self.client.blocks.children.append, block_id=page_id, children=children
+                    ))["results"]
+                break
+            except Exception as e:
+                if attempt + 1 == _RESUME_ATTEMPTS or not self._is_ambiguous_error(e):
+                    raise
+                verify = True
+        if progress:
+            progress(len(children))
+        
+        for index, nested in request["deferred"]:
+            yield from self._deferred_steps(results[index], nested, progress)
+        
+        return (yield self._blocking(
+            self._save_checkpoint, context, page_id, checkpoint["blocks_done"] + len(children), results[-1]["id"]
+        ))
+
+    def _deferred_steps(
+        self,
+        block: Dict[str, Any],
+        nested: List[Dict[str, Any]],
+        progress: Optional[ProgressCallback] = None
+    ) -> _Steps[None]:
+        """
+        Append the children a request deferred to a block it created.
+        If the block already has children, an interrupted run was appending them:
+        appends are atomic, so the children found end at a request boundary. The
+        requests up to there are skipped (finishing the children they deferred
+        in turn) and the rest are sent.
+        
+        Args:
+            block: The created block as returned by the append or found on the page
+            nested: Its children, as deferred by the packer
+            progress: Called after every append with the number of blocks it added
+            
+        Raises:
+            RuntimeError: If the block holds children other than the ones being appended
+        """
+        requests = self.packer.pack(nested, create=False)
+        if not block.get("has_children"):
+            yield from self._append_steps(block["id"], requests, progress)
+            return
+        
+        found, _ = yield from self._list_children_steps(block["id"])
+        done = 0
+        for request in requests:
+            children = request["children"]
+            if not self._has_landed(block["id"], children, found[done:done + len(children)]):
+                yield from self._append_steps(block["id"], chain([request], requests), progress)
+                return
+            for index, grandchildren in request["deferred"]:
+                yield from self._deferred_steps(found[done + index], grandchildren, progress)
+            done += len(children)
+        if done < len(found):
+            raise RuntimeError(
+                f"Block {block['id']} was changed after the last upload checkpoint; upload again without resume"
+            )
+
+    def _after_checkpoint_steps(self, checkpoint: Dict[str, Any], count: int) -> _Steps[List[Dict[str, Any]]]:
+        """
+        Fetch up to count top-level blocks following a checkpoint.
+        Listing starts at the journaled tail block, so this usually takes one call.
+        
+        Returns:
+            The blocks found after the checkpoint (empty if the page ends there)
+        """
+        tail_block_id = checkpoint["tail_block_id"]
+        # A listing from the tail includes the tail itself; without one, skip the confirmed blocks
+        skip = 1 if tail_block_id else checkpoint["blocks_done"]
+        wanted = skip + count
+        found: List[Dict[str, Any]] = []
+        cursor = tail_block_id
+        while len(found) < wanted:
+            kwargs: Dict[str, Any] = {"block_id": checkpoint["page_id"], "page_size": min(100, wanted - len(found))}
+            if cursor:
+                kwargs["start_cursor"] = cursor
+            response = yield self._api(self.client.blocks.children.list, **kwargs)
+            found.extend(response["results"])
+            if not response.get("has_more"):
+                break
+            cursor = response.get("next_cursor")
+        return found[skip:wanted]
+
+    @staticmethod
+    def extract_page_id_from_url(url: str) -> str:
+        """
+        Extract page ID from a Notion URL.
+        
+        Args:
+            url: Notion page URL (e.g., https://www.notion.so/16132a3709e4816cb512e4d73d345003)
+            
+        Returns:
+            The extracted page ID
+            
+        Raises:
+            ValueError: If URL is invalid or doesn't contain a page ID
+        """
+        import re
+        
+        # Remove any query parameters and fragments
+        url = url.split('?')[0].split('#')[0]
+        
+        # Pattern to match Notion page URLs
+        patterns = [
+            # Standard format: https://notion.so/page-title-32chars
+            r'notion\.so/[^/]*?([a-f0-9]{32})/?$',
+            # Direct ID format: https://notion.so/32chars
+            r'notion\.so/([a-f0-9]{32})/?$',
+            # With subdomain: https://workspace.notion.site/page-title-32chars
+            r'notion\.site/[^/]*?([a-f0-9]{32})/?$',
+        ]
+        
+        for pattern in patterns:
+            match = re.search(pattern, url, re.IGNORECASE)
+            if match:
+                page_id = match.group(1)
+                # Format as UUID with hyphens
+                return f"{page_id[:8]}-{page_id[8:12]}-{page_id[12:16]}-{page_id[16:20]}-{page_id[20:]}"
+        
+        raise ValueError(f"Invalid Notion URL format: {url}")
+
+
+class NotionUploader(_NotionUploaderBase):
     """
     Handles uploading Markdown content to Notion pages.
     Uses Notion API v1 for page creation and content management.
     """
 
-    def __init__(self, token: Optional[str] = None):
+    def _create_client(self) -> Client:
+        """Create the synchronous Notion API client on the shared connection pool."""
+        settings = get_pool_settings()
+        return Client(
+            auth=self.token,
+            client=httpx.Client(transport=get_shared_transport(), event_hooks=self.metrics.event_hooks()),
+            timeout_ms=settings.timeout_ms,
+            **_CLIENT_RETRY_OPTIONS
+        )
+
+    def _request(self, endpoint: Any, *args: Any, **kwargs: Any) -> Any:
         """
-        Initialize the NotionUploader.
+        Call a Notion endpoint through the rate limiter.
         
         Args:
-            token: Notion API token (if not provided, loads from environment)
+            endpoint: Bound notion_client endpoint method (e.g. self.client.pages.create)
+            *args, **kwargs: Arguments forwarded to the endpoint
+            
+        Returns:
+            The endpoint's response
         """
-        # Load environment variables
-        load_dotenv()
-        
-        self.token = token or os.getenv("NOTION_TOKEN")
-        if not self.token:
-            raise ValueError("NOTION_TOKEN is required. Set it as environment variable or pass as parameter.")
+        return self.rate_limiter.call(endpoint, *args, **kwargs)
+
+    def _run_steps(self, steps: _Steps[T]) -> T:
+        """
+        Run a shared upload routine, making each call it asks for in this thread.
         
-        self.client = Client(auth=self.token)
-        self.processor = MarkdownProcessor()
+        Returns:
+            The routine's result
+        """
+        result: Any = None
+        error: Optional[Exception] = None
+        while True:
+            try:
+                call = steps.throw(error) if error is not None else steps.send(result)
+            except StopIteration as done:
+                return done.value
+            try:
+                if call.api:
+                    result = self._request(call.func, *call.args, **call.kwargs)
+                else:
+                    result = call.func(*call.args, **call.kwargs)
+                error = None
+            except Exception as e:
+                result, error = None, e
 
+    @profiled("NotionUploader.upload_markdown_file")
     def upload_markdown_file(
         self, 
         filepath: str, 
         parent_url: Optional[str] = None,
         database_id: Optional[str] = None, 
-        parent_page_id: Optional[str] = None
+        parent_page_id: Optional[str] = None,
+        force: bool = False,
+        resume: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        plan: Optional[PlanCallback] = None
     ) -> str:
         """
         Upload a Markdown file to Notion as a new page.
         Automatically handles files with more than 100 blocks by splitting them.
+        When a manifest is configured, a file that is unchanged since its last
+        upload to the same target is skipped without any API call.
         
         Args:
             filepath: Path to the Markdown file
             parent_url: Notion page URL (optional)
             database_id: Target database ID (optional)
             parent_page_id: Parent page ID (optional, used if database_id not provided)
+            force: Upload even if the manifest says the file is unchanged
+            resume: Continue an interrupted upload of the same file to the same
+                target from its last journaled checkpoint instead of creating a new page
+            progress: Called after every confirmed API call with the number of
+                blocks it added (see plan_upload for the totals)
+            plan: Called with the totals progress will add up to before the
+                first API call (new uploads of files up to PLAN_MAX_FILE_BYTES only)
             
         Returns:
-            The ID of the created Notion page
+            The ID of the created Notion page (or of the earlier page if skipped)
             
         Raises:
-            ValueError: If neither database_id nor parent_page_id is provided
+            ValueError: If no target is provided, or resume without a journal
             FileNotFoundError: If the file doesn't exist
         """
-        # Extract parent_page_id from URL if provided
-        if parent_url:
-            parent_page_id = self.extract_page_id_from_url(parent_url)
-        
-        if not database_id and not parent_page_id:
-            raise ValueError("Either parent_url, database_id or parent_page_id must be provided")
+        parent_page_id = self._resolve_parent_page_id(parent_url, database_id, parent_page_id)
         
-        # Process the Markdown file
-        blocks, title = self.processor.process_file(filepath)
-        
-        # Create the page with blocks (handles 100+ block limitation automatically)
-        return self._create_page_with_blocks(blocks, title, database_id, parent_page_id)
+        page_id, _ = self._run_steps(
+            self._upload_file_steps(filepath, database_id, parent_page_id, force, resume, progress, plan)
+        )
+        return page_id
 
+    @profiled("NotionUploader.upload_markdown_content")
     def upload_markdown_content(
         self, 
         content: str, 
         title: str,
         parent_url: Optional[str] = None,
         database_id: Optional[str] = None, 
-        parent_page_id: Optional[str] = None
+        parent_page_id: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        plan: Optional[PlanCallback] = None
     ) -> str:
         """
         Upload Markdown content directly to Notion as a new page.
@@ -93,6 +1240,9 @@ class NotionUploader:
             parent_url: Notion page URL (optional)
             database_id: Target database ID (optional)
             parent_page_id: Parent page ID (optional, used if database_id not provided)
+            progress: Called after every confirmed API call with the number of blocks it added
+            plan: Called with the totals progress will add up to once the
+                content is parsed, before the first API call
             
         Returns:
             The ID of the created Notion page
@@ -100,42 +1250,121 @@ class NotionUploader:
         Raises:
             ValueError: If neither database_id nor parent_page_id is provided
         """
-        # Extract parent_page_id from URL if provided
-        if parent_url:
-            parent_page_id = self.extract_page_id_from_url(parent_url)
+        parent_page_id = self._resolve_parent_page_id(parent_url, database_id, parent_page_id)
         
-        if not database_id and not parent_page_id:
-            raise ValueError("Either parent_url, database_id or parent_page_id must be provided")
+        return self._run_steps(
+            self._upload_content_steps(content, title, database_id, parent_page_id, progress, plan)
+        )
+
+    @profiled("NotionUploader.upload_directory")
+    def upload_directory(
+        self,
+        directory: str,
+        pattern: str = "**/*.md",
+        parent_url: Optional[str] = None,
+        database_id: Optional[str] = None,
+        parent_page_id: Optional[str] = None,
+        max_workers: int = 4,
+        mirror_folders: bool = False,
+        force: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload every Markdown file of a directory, one page per file.
+        Files are parsed and uploaded by a pool of worker threads that keeps at
+        most max_workers uploads in flight. A failing file does not stop the batch.
+        
+        Args:
+            directory: Directory containing the Markdown files
+            pattern: Glob pattern relative to the directory (default: "**/*.md")
+            parent_url: Notion page URL (optional)
+            database_id: Target database ID (optional)
+            parent_page_id: Parent page ID (optional, used if database_id not provided)
+            max_workers: Maximum number of concurrent uploads
+            mirror_folders: Recreate subfolders as nested (empty) parent pages
+            force: Upload files even if the manifest says they are unchanged
+            
+        Returns:
+            List of per-file results in file order, each with the keys
+            "filepath", "status" ("uploaded", "skipped" or "failed"),
+            "page_id" and "error"
+            
+        Raises:
+            ValueError: If no target is provided or the options are invalid
+            FileNotFoundError: If the directory doesn't exist
+        """
+        parent_page_id = self._resolve_parent_page_id(parent_url, database_id, parent_page_id)
+        self._validate_directory_options(max_workers, mirror_folders, database_id)
         
-        # Process the Markdown content
-        blocks, _ = self.processor.parse_markdown_to_blocks(content, title)
+        root = Path(directory)
+        files = self._collect_markdown_files(directory, pattern)
         
-        # Create the page with blocks (handles 100+ block limitation automatically)
-        return self._create_page_with_blocks(blocks, title, database_id, parent_page_id)
+        # Folder pages are created up front (sequentially) so workers only upload files
+        folder_pages: Dict[Path, str] = {}
+        if mirror_folders:
+            folder_pages = self._run_steps(self._folder_pages_steps(root, files, parent_page_id, force))
+        
+        def upload_one(filepath: Path) -> Dict[str, Any]:
+            target_page_id = folder_pages.get(filepath.relative_to(root).parent, parent_page_id)
+            try:
+                page_id, skipped = self._run_steps(
+                    self._upload_file_steps(str(filepath), database_id, target_page_id, force)
+                )
+            except Exception as e:
+                return self._directory_result(filepath, error=e)
+            return self._directory_result(filepath, page_id=page_id, skipped=skipped)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(upload_one, files))
+
+    @profiled("NotionUploader.update_page")
+    def update_page(self, page_id: str, markdown: str, use_mirror: bool = True) -> Dict[str, int]:
+        """
+        Update an existing page in place so its content matches markdown.
+        The parsed blocks are diffed against the page's current children and only
+        the differing blocks are updated, deleted or inserted.
+        
+        Args:
+            page_id: ID of the page to update
+            markdown: The new Markdown content of the page
+            use_mirror: Diff against the locally cached children from the previous
+                update_page call instead of fetching them (falls back to a fetch
+                if the cache turns out to be stale)
+            
+        Returns:
+            Summary with the keys "unchanged", "updated", "deleted", "inserted"
+            and "api_calls"
+        """
+        return self._run_steps(self._update_page_steps(page_id, markdown, use_mirror))
 
-    def get_database_info(self, database_id: str) -> Dict[str, Any]:
+    def get_database_info(self, database_id: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Get information about a Notion database.
+        Results are served from the metadata cache until they expire.
         
         Args:
             database_id: The database ID
+            refresh: Fetch from Notion even if a cached copy exists
             
         Returns:
             Database information
         """
-        return self.client.databases.retrieve(database_id)
+        return self._run_steps(
+            self._info_steps("database", database_id, self.client.databases.retrieve, refresh)
+        )
 
-    def get_page_info(self, page_id: str) -> Dict[str, Any]:
+    def get_page_info(self, page_id: str, refresh: bool = False) -> Dict[str, Any]:
         """
         Get information about a Notion page.
+        Results are served from the metadata cache until they expire.
         
         Args:
             page_id: The page ID
+            refresh: Fetch from Notion even if a cached copy exists
             
         Returns:
             Page information
         """
-        return self.client.pages.retrieve(page_id)
+        return self._run_steps(self._info_steps("page", page_id, self.client.pages.retrieve, refresh))
 
     def list_database_pages(self, database_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -148,7 +1377,8 @@ class NotionUploader:
         Returns:
             List of page information
         """
-        response = self.client.databases.query(
+        response = self._request(
+            self.client.databases.query,
             database_id=database_id,
             page_size=min(limit, 100)
         )
@@ -156,101 +1386,311 @@ class NotionUploader:
 
     def _create_page_with_blocks(
         self,
-        blocks: List[Dict[str, Any]],
+        blocks: Iterable[Union[Block, Dict[str, Any]]],
         title: str,
         database_id: Optional[str] = None,
-        parent_page_id: Optional[str] = None
+        parent_page_id: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> str:
+        """
+        Create a Notion page with blocks, packing them into as few requests as possible.
+        Blocks are consumed lazily, so a streaming parser only ever has one
+        request in memory and the page is created as soon as the first request is ready.
+        
+        Returns:
+            The ID of the created Notion page
+        """
+        return self._run_steps(self._create_page_steps(blocks, title, database_id, parent_page_id, progress))
+
+
+class AsyncNotionUploader(_NotionUploaderBase):
+    """
+    Asynchronous counterpart of NotionUploader built on notion_client.AsyncClient.
+    A single instance shares one AsyncClient (and its connection pool), so many
+    independent uploads can run concurrently on one event loop.
+    """
+
+    def _create_client(self) -> AsyncClient:
+        """Create the asynchronous Notion API client with its own connection pool."""
+        settings = get_pool_settings()
+        return AsyncClient(
+            auth=self.token,
+            client=httpx.AsyncClient(
+                transport=create_async_transport(settings),
+                event_hooks=self.metrics.async_event_hooks()
+            ),
+            timeout_ms=settings.timeout_ms,
+            **_CLIENT_RETRY_OPTIONS
+        )
+
+    async def _request(self, endpoint: Any, *args: Any, **kwargs: Any) -> Any:
+        """
+        Await a Notion endpoint through the rate limiter.
+        
+        Args:
+            endpoint: Bound notion_client AsyncClient endpoint method
+            *args, **kwargs: Arguments forwarded to the endpoint
+            
+        Returns:
+            The endpoint's response
+        """
+        return await self.rate_limiter.call_async(endpoint, *args, **kwargs)
+
+    async def _run_steps(self, steps: _Steps[T]) -> T:
+        """
+        Run a shared upload routine on the event loop.
+        Notion calls are awaited; blocking calls (hashing, parsing, manifest
+        and journal writes) run in the default executor.
+        
+        Returns:
+            The routine's result
+        """
+        loop = asyncio.get_running_loop()
+        result: Any = None
+        error: Optional[Exception] = None
+        while True:
+            try:
+                call = steps.throw(error) if error is not None else steps.send(result)
+            except StopIteration as done:
+                return done.value
+            try:
+                if call.api:
+                    result = await self._request(call.func, *call.args, **call.kwargs)
+                else:
+                    result = await loop.run_in_executor(
+                        None, functools.partial(call.func, *call.args, **call.kwargs)
+                    )
+                error = None
+            except Exception as e:
+                result, error = None, e
+
+    async def __aenter__(self) -> "AsyncNotionUploader":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool of the underlying AsyncClient."""
+        await self.client.aclose()
+
+    async def upload_markdown_file(
+        self, 
+        filepath: str, 
+        parent_url: Optional[str] = None,
+        database_id: Optional[str] = None, 
+        parent_page_id: Optional[str] = None,
+        force: bool = False,
+        resume: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        plan: Optional[PlanCallback] = None
     ) -> str:
         """
-        Create a Notion page with blocks, handling the 100-block limitation automatically.
+        Upload a Markdown file to Notion as a new page.
+        File hashing, reading and parsing and manifest and journal writes run
+        in the default executor so the event loop stays responsive.
         
         Args:
-            blocks: List of Notion blocks to add to the page
-            title: Page title
+            filepath: Path to the Markdown file
+            parent_url: Notion page URL (optional)
             database_id: Target database ID (optional)
-            parent_page_id: Parent page ID (optional)
+            parent_page_id: Parent page ID (optional, used if database_id not provided)
+            force: Upload even if the manifest says the file is unchanged
+            resume: Continue an interrupted upload of the same file to the same
+                target from its last journaled checkpoint instead of creating a new page
+            progress: Called after every confirmed API call with the number of
+                blocks it added (see plan_upload for the totals)
+            plan: Called with the totals progress will add up to before the
+                first API call (new uploads of files up to PLAN_MAX_FILE_BYTES only)
             
         Returns:
-            The ID of the created Notion page
+            The ID of the created Notion page (or of the earlier page if skipped)
+            
+        Raises:
+            ValueError: If no target is provided, or resume without a journal
+            FileNotFoundError: If the file doesn't exist
         """
-        # Create page properties
-        properties = {
-            "title": {
-                "title": [{"text": {"content": title}}]
-            }
-        }
+        parent_page_id = self._resolve_parent_page_id(parent_url, database_id, parent_page_id)
         
-        # Determine the parent
-        if database_id:
-            parent = {"database_id": database_id}
-        else:
-            parent = {"page_id": parent_page_id}
+        page_id, _ = await self._run_steps(
+            self._upload_file_steps(filepath, database_id, parent_page_id, force, resume, progress, plan)
+        )
+        return page_id
+
+    async def upload_markdown_content(
+        self, 
+        content: str, 
+        title: str,
+        parent_url: Optional[str] = None,
+        database_id: Optional[str] = None, 
+        parent_page_id: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        plan: Optional[PlanCallback] = None
+    ) -> str:
+        """
+        Upload Markdown content directly to Notion as a new page.
         
-        # Handle blocks based on count
-        if len(blocks) <= 100:
-            # Can create page with all blocks at once
-            page = self.client.pages.create(
-                parent=parent,
-                properties=properties,
-                children=blocks
-            )
-        else:
-            # Create page with first 100 blocks
-            initial_blocks = blocks[:100]
-            page = self.client.pages.create(
-                parent=parent,
-                properties=properties,
-                children=initial_blocks
-            )
+        Args:
+            content: Markdown content as string
+            title: Page title
+            parent_url: Notion page URL (optional)
+            database_id: Target database ID (optional)
+            parent_page_id: Parent page ID (optional, used if database_id not provided)
+            progress: Called after every confirmed API call with the number of blocks it added
+            plan: Called with the totals progress will add up to once the
+                content is parsed, before the first API call
             
-            # Add remaining blocks in chunks of 100
-            page_id = page["id"]
-            remaining_blocks = blocks[100:]
+        Returns:
+            The ID of the created Notion page
             
-            # Process remaining blocks in chunks
-            for i in range(0, len(remaining_blocks), 100):
-                chunk = remaining_blocks[i:i+100]
-                self.client.blocks.children.append(
-                    block_id=page_id,
-                    children=chunk
-                )
+        Raises:
+            ValueError: If neither database_id nor parent_page_id is provided
+        """
+        parent_page_id = self._resolve_parent_page_id(parent_url, database_id, parent_page_id)
         
-        return page["id"]
+        return await self._run_steps(
+            self._upload_content_steps(content, title, database_id, parent_page_id, progress, plan)
+        )
 
-    @staticmethod
-    def extract_page_id_from_url(url: str) -> str:
+    async def upload_directory(
+        self,
+        directory: str,
+        pattern: str = "**/*.md",
+        parent_url: Optional[str] = None,
+        database_id: Optional[str] = None,
+        parent_page_id: Optional[str] = None,
+        max_workers: int = 4,
+        mirror_folders: bool = False,
+        force: bool = False
+    ) -> List[Dict[str, Any]]:
         """
-        Extract page ID from a Notion URL.
+        Upload every Markdown file of a directory, one page per file.
+        At most max_workers uploads are in flight at once; parsing runs in the
+        default executor. A failing file does not stop the batch.
         
         Args:
-            url: Notion page URL (e.g., https://www.notion.so/16132a3709e4816cb512e4d73d345003)
+            directory: Directory containing the Markdown files
+            pattern: Glob pattern relative to the directory (default: "**/*.md")
+            parent_url: Notion page URL (optional)
+            database_id: Target database ID (optional)
+            parent_page_id: Parent page ID (optional, used if database_id not provided)
+            max_workers: Maximum number of concurrent uploads
+            mirror_folders: Recreate subfolders as nested (empty) parent pages
+            force: Upload files even if the manifest says they are unchanged
             
         Returns:
-            The extracted page ID
+            List of per-file results in file order (see NotionUploader.upload_directory)
             
         Raises:
-            ValueError: If URL is invalid or doesn't contain a page ID
+            ValueError: If no target is provided or the options are invalid
+            FileNotFoundError: If the directory doesn't exist
         """
-        import re
+        parent_page_id = self._resolve_parent_page_id(parent_url, database_id, parent_page_id)
+        self._validate_directory_options(max_workers, mirror_folders, database_id)
         
-        # Remove any query parameters and fragments
-        url = url.split('?')[0].split('#')[0]
+        root = Path(directory)
+        files = self._collect_markdown_files(directory, pattern)
         
-        # Pattern to match Notion page URLs
-        patterns = [
-            # Standard format: https://notion.so/page-title-32chars
-            r'notion\.so/[^/]*?([a-f0-9]{32})/?$',
-            # Direct ID format: https://notion.so/32chars
-            r'notion\.so/([a-f0-9]{32})/?$',
-            # With subdomain: https://workspace.notion.site/page-title-32chars
-            r'notion\.site/[^/]*?([a-f0-9]{32})/?$',
-        ]
+        folder_pages: Dict[Path, str] = {}
+        if mirror_folders:
+            folder_pages = await self._run_steps(self._folder_pages_steps(root, files, parent_page_id, force))
         
-        for pattern in patterns:
-            match = re.search(pattern, url, re.IGNORECASE)
-            if match:
-                page_id = match.group(1)
-                # Format as UUID with hyphens
-                return f"{page_id[:8]}-{page_id[8:12]}-{page_id[12:16]}-{page_id[16:20]}-{page_id[20:]}"
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def upload_one(filepath: Path) -> Dict[str, Any]:
+            target_page_id = folder_pages.get(filepath.relative_to(root).parent, parent_page_id)
+            async with semaphore:
+                try:
+                    page_id, skipped = await self._run_steps(
+                        self._upload_file_steps(str(filepath), database_id, target_page_id, force)
+                    )
+                except Exception as e:
+                    return self._directory_result(filepath, error=e)
+            return self._directory_result(filepath, page_id=page_id, skipped=skipped)
+        
+        return list(await asyncio.gather(*(upload_one(filepath) for filepath in files)))
+
+    async def update_page(self, page_id: str, markdown: str, use_mirror: bool = True) -> Dict[str, int]:
+        """
+        Update an existing page in place so its content matches markdown.
+        See NotionUploader.update_page.
+        
+        Args:
+            page_id: ID of the page to update
+            markdown: The new Markdown content of the page
+            use_mirror: Diff against the locally cached children when available
+            
+        Returns:
+            Summary with the keys "unchanged", "updated", "deleted", "inserted"
+            and "api_calls"
+        """
+        return await self._run_steps(self._update_page_steps(page_id, markdown, use_mirror))
+
+    async def get_database_info(self, database_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get information about a Notion database.
+        Results are served from the metadata cache until they expire.
+        
+        Args:
+            database_id: The database ID
+            refresh: Fetch from Notion even if a cached copy exists
+            
+        Returns:
+            Database information
+        """
+        return await self._run_steps(
+            self._info_steps("database", database_id, self.client.databases.retrieve, refresh)
+        )
+
+    async def get_page_info(self, page_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get information about a Notion page.
+        Results are served from the metadata cache until they expire.
         
-        raise ValueError(f"Invalid Notion URL format: {url}")
\ No newline at end of file
+        Args:
+            page_id: The page ID
+            refresh: Fetch from Notion even if a cached copy exists
+            
+        Returns:
+            Page information
+        """
+        return await self._run_steps(self._info_steps("page", page_id, self.client.pages.retrieve, refresh))
+
+    async def list_database_pages(self, database_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        List pages in a database.
+        
+        Args:
+            database_id: The database ID
+            limit: Maximum number of pages to return
+            
+        Returns:
+            List of page information
+        """
+        response = await self._request(
+            self.client.databases.query,
+            database_id=database_id,
+            page_size=min(limit, 100)
+        )
+        return response["results"]
+
+    async def _create_page_with_blocks(
+        self,
+        blocks: Iterable[Union[Block, Dict[str, Any]]],
+        title: str,
+        database_id: Optional[str] = None,
+        parent_page_id: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> str:
+        """
+        Create a Notion page with blocks, packing them into as few requests as possible.
+        Appends for one page stay sequential to preserve block order. Each request
+        is pulled from the packer in the default executor, so a streaming
+        parser reads the file while earlier requests are being sent.
+        
+        Returns:
+            The ID of the created Notion page
+        """
+        return await self._run_steps(
+            self._create_page_steps(blocks, title, database_id, parent_page_id, progress)
+        )
@@ -0,0 +1,250 @@
+"""
+Parse cache module for skipping repeated Markdown parsing.
+Keeps recently parsed documents in a bounded in-memory LRU, keyed by content
+hash and parser version, with an optional on-disk tier shared across runs.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Import handling for direct execution vs module import
+try:
+    from .blocks import Block, gc_paused
+except ImportError:
+    from blocks import Block, gc_paused
+
+DEFAULT_MAX_ENTRIES = 128
+# Budget in characters of cached source Markdown; compact blocks take roughly
+# six times as much memory as their source
+DEFAULT_MAX_CHARS = 16 << 20
+
+
+class ParseCache:
+    """
+    Thread-safe cache of parsed block lists.
+    A hit returns a new list holding the cached compact blocks, so it costs
+    O(number of blocks) instead of a re-parse. The blocks are shared between
+    callers, which is safe because they are never mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_chars: int = DEFAULT_MAX_CHARS,
+        directory: Optional[str] = None
+    ):
+        """
+        Initialize the ParseCache.
+
+        Args:
+            max_entries: Maximum number of documents kept in memory
+            max_chars: Maximum total length of the source documents kept in memory
+            directory: Folder for the on-disk tier (disabled if None)
+        """
+        if max_entries < 1 or max_chars < 1:
+            raise ValueError("max_entries and max_chars must be positive")
+
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.directory = Path(directory).expanduser() if directory else None
+        # key -> (blocks, source length)
+        self._entries: "OrderedDict[str, Tuple[List[Block], int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(content: str, parser_version: str) -> str:
+        """
+        Build the cache key of a document.
+
+        Args:
+            content: Markdown content
+            parser_version: Version of the parser producing the blocks
+
+        Returns:
+            Key combining the SHA-256 of the content and the parser version
+        """
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return f"{digest}-v{parser_version}"
+
+    def get(self, key: str) -> Optional[List[Block]]:
+        """
+        Look up parsed blocks, falling back to the on-disk tier.
+
+        Args:
+            key: Cache key (see make_key)
+
+        Returns:
+            A new list of the cached blocks, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(entry[0])
+
+        loaded = self._read_disk(key)
+
+        with self._lock:
+            if loaded is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store(key, *loaded)
+        return list(loaded[0])
+
+    def put(self, key: str, blocks: List[Block], source_length: int) -> None:
+        """
+        Cache parsed blocks in memory and, if enabled, on disk.
+        The cache keeps its own list, so the caller may keep using blocks.
+
+        Args:
+            key: Cache key (see make_key)
+            blocks: Blocks produced by the parser
+            source_length: Length of the parsed Markdown (counts against max_chars)
+        """
+        with self._lock:
+            self._store(key, list(blocks), source_length)
+        self._write_disk(key, blocks, source_length)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the on-disk tier is left untouched)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters and current usage.
+
+        Returns:
+            Dict with hits, disk_hits, misses, evictions, entries and chars
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "chars": self._size,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _store(self, key: str, blocks: List[Block], source_length: int) -> None:
+        """Insert an entry and evict least recently used ones; caller holds the lock."""
+        if source_length > self.max_chars:
+            # Would evict everything else and still not fit
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= previous[1]
+        self._entries[key] = (blocks, source_length)
+        self._size += source_length
+
+        while len(self._entries) > self.max_entries or self._size > self.max_chars:
+            _, (_, evicted_length) = self._entries.popitem(last=False)
+            self._size -= evicted_length
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        """Location of an entry in the on-disk tier."""
+        if self.directory is None:
+            return None
+        return self.directory / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Tuple[List[Block], int]]:
+        """Load an entry from disk; missing, unreadable or corrupt files count as misses."""
+        path = self._disk_path(key)
+        if path is None:
+            return None
+
+        try:
+            data = path.read_text(encoding='utf-8')
+        except (OSError, ValueError):
+            return None
+
+        try:
+            with gc_paused():
+                entry = json.loads(data)
+                blocks = [
+                    Block(block_type, text, _decode_attrs(attrs) if attrs else None)
+                    for block_type, text, attrs in entry["blocks"]
+                ]
+            return blocks, int(entry["source_length"])
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def _write_disk(self, key: str, blocks: List[Block], source_length: int) -> None:
+        """Write an entry atomically so concurrent readers never see partial files."""
+        path = self._disk_path(key)
+        if path is None:
+            return
+
+        data = json.dumps(
+            {
+                "source_length": source_length,
+                "blocks": [[block.type, block.text, block.attrs] for block in blocks],
+            },
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(data, encoding='utf-8')
+            os.replace(tmp_path, path)
+        except OSError:
+            # The disk tier is best effort; the in-memory entry is still valid
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+def _decode_attrs(attrs: List[List[Any]]) -> Tuple[Tuple[str, Any], ...]:
+    """Rebuild a block's attribute pairs and compact rich_text runs, which JSON stores as lists."""
+    return tuple(
+        (key, tuple((content, tuple(annotations), link) for content, annotations, link in value))
+        if key == "rich_text" else (key, value)
+        for key, value in attrs
+    )
+
+
+_default_cache: Optional[ParseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_parse_cache() -> ParseCache:
+    """
+    Get the process-wide ParseCache shared by all uploaders.
+    NOTION_PARSE_CACHE_SIZE sets the number of in-memory entries and
+    NOTION_PARSE_CACHE_DIR enables the on-disk tier.
+
+    Returns:
+        The shared ParseCache instance
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            max_entries = int(os.getenv("NOTION_PARSE_CACHE_SIZE", DEFAULT_MAX_ENTRIES))
+            _default_cache = ParseCache(
+                max_entries=max_entries,
+                directory=os.getenv("NOTION_PARSE_CACHE_DIR") or None
+            )
+        return _default_cache
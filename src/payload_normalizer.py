@@ -0,0 +1,192 @@
+"""
+Payload normalization module for Notion's rich text limits.
+Splits oversized text into several rich_text runs, and runs that do not fit
+into one block into continuation blocks, before anything is sent.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+try:
+    from .blocks import Block, to_notion
+    from .payload_packer import encoded_size
+except ImportError:
+    from blocks import Block, to_notion
+    from payload_packer import encoded_size
+
+# Documented Notion limits, measured in UTF-16 code units like the API does
+MAX_RICH_TEXT_LENGTH = 2000
+MAX_RICH_TEXT_RUNS = 100
+# Encoded size of one block's rich_text: 100 runs of 2000 CJK characters take
+# about 600 KB, more than a whole 500 KB request, so blocks are also split by bytes
+MAX_RICH_TEXT_BYTES = 400 * 1000
+# Upper bound for the JSON of a text run besides its content and link URL
+_RUN_OVERHEAD_BYTES = 512
+
+
+def utf16_length(text: str) -> int:
+    """
+    Length of text as Notion counts it (UTF-16 code units).
+    Characters outside the Basic Multilingual Plane, such as most emoji, count twice.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Number of UTF-16 code units
+    """
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+def split_text(text: str, limit: int = MAX_RICH_TEXT_LENGTH) -> List[str]:
+    """
+    Split text into pieces of at most limit UTF-16 code units.
+    Surrogate pairs are never split.
+
+    Args:
+        text: Text to split
+        limit: Maximum UTF-16 length of a piece
+
+    Returns:
+        The pieces in order (a single piece if text already fits)
+    """
+    if len(text) * 2 <= limit:
+        return [text]
+    units = utf16_length(text)
+    if units <= limit:
+        return [text]
+    if units == len(text):
+        # Only BMP characters: code points and code units coincide
+        return [text[i:i + limit] for i in range(0, len(text), limit)]
+
+    pieces = []
+    start = units = 0
+    for i, char in enumerate(text):
+        width = 2 if ord(char) > 0xFFFF else 1
+        if units + width > limit:
+            pieces.append(text[start:i])
+            start, units = i, 0
+        units += width
+    pieces.append(text[start:])
+    return pieces
+
+
+def split_rich_text(rich_text: List[Dict[str, Any]], limit: int = MAX_RICH_TEXT_LENGTH) -> List[Dict[str, Any]]:
+    """
+    Split text runs whose content is too long into consecutive runs with the same formatting.
+
+    Args:
+        rich_text: Notion rich_text array
+        limit: Maximum UTF-16 length of a run's content
+
+    Returns:
+        The original list if nothing had to be split, otherwise a new list
+    """
+    result = None
+    for i, run in enumerate(rich_text):
+        text = run.get("text")
+        pieces = split_text(text.get("content", ""), limit) if text else None
+        if pieces is None or len(pieces) == 1:
+            if result is not None:
+                result.append(run)
+            continue
+        if result is None:
+            result = list(rich_text[:i])
+        for piece in pieces:
+            result.append({**run, "text": {**text, "content": piece}})
+    return rich_text if result is None else result
+
+
+def _size_bound(runs: List[Dict[str, Any]]) -> int:
+    """Upper bound of the encoded size of runs; a JSON-escaped character takes at most 6 bytes."""
+    total = 0
+    for run in runs:
+        text = run.get("text")
+        if text is None or len(run) > 3:
+            total += encoded_size(run) + 1
+            continue
+        link = text.get("link") or {}
+        total += 6 * (len(text.get("content", "")) + len(link.get("url") or "")) + _RUN_OVERHEAD_BYTES
+    return total
+
+
+def _group_runs(runs: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    Group runs into blocks of at most MAX_RICH_TEXT_RUNS runs and MAX_RICH_TEXT_BYTES encoded bytes.
+    Runs are only encoded for blocks whose cheap size bound exceeds the limit.
+    """
+    if len(runs) <= MAX_RICH_TEXT_RUNS and _size_bound(runs) <= MAX_RICH_TEXT_BYTES:
+        return [runs]
+    groups: List[List[Dict[str, Any]]] = []
+    group: List[Dict[str, Any]] = []
+    size = 0
+    for run in runs:
+        run_size = encoded_size(run) + 1
+        if group and (len(group) >= MAX_RICH_TEXT_RUNS or size + run_size > MAX_RICH_TEXT_BYTES):
+            groups.append(group)
+            group, size = [], 0
+        group.append(run)
+        size += run_size
+    groups.append(group)
+    return groups
+
+
+def normalize_block(block: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Make a block and its nested children fit Notion's rich text limits.
+    Long runs are split into several runs. If that yields more than 100 runs,
+    or runs encoding to more than MAX_RICH_TEXT_BYTES, the block is continued
+    in further blocks of the same type, and nested children move to the last
+    of them so they still follow all of the text.
+
+    Args:
+        block: Notion block dict (not modified)
+
+    Returns:
+        The block itself if it already fits, otherwise its replacement blocks
+    """
+    block_type = block.get("type")
+    body = block.get(block_type)
+    if not isinstance(body, dict):
+        return [block]
+
+    rich_text = body.get("rich_text") or []
+    runs = split_rich_text(rich_text)
+    children = body.get("children") or []
+    new_children = list(normalize_blocks(children))
+    children_changed = len(new_children) != len(children) or any(
+        new is not old for new, old in zip(new_children, children)
+    )
+
+    groups = _group_runs(runs)
+    if runs is rich_text and len(groups) == 1 and not children_changed:
+        return [block]
+
+    blocks = []
+    for group in groups:
+        new_body = {key: value for key, value in body.items() if key != "children"}
+        if "rich_text" in body:
+            new_body["rich_text"] = group
+        blocks.append({**block, block_type: new_body})
+    if children:
+        blocks[-1][block_type]["children"] = new_children
+    return blocks
+
+
+def normalize_blocks(blocks: Iterable[Union[Block, Dict[str, Any]]]) -> Iterator[Union[Block, Dict[str, Any]]]:
+    """
+    Normalize blocks lazily, passing short compact blocks through unexpanded.
+
+    Args:
+        blocks: Compact blocks or Notion block dicts (list or lazy iterator)
+
+    Yields:
+        Blocks that fit Notion's rich text limits, in order
+    """
+    for block in blocks:
+        if isinstance(block, Block) and block.is_plain and len(block.text) * 2 <= MAX_RICH_TEXT_LENGTH:
+            # A single run of at most 1000 characters always fits
+            yield block
+        else:
+            yield from normalize_block(to_notion(block))
@@ -0,0 +1,200 @@
+"""
+Payload packing module for uploading blocks in as few API calls as possible.
+Plans pages.create and blocks.children.append requests against Notion's
+request limits instead of sending fixed chunks of 100 top-level blocks.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+try:
+    from .blocks import Block, to_notion
+except ImportError:
+    from blocks import Block, to_notion
+
+# Documented Notion limits for a single request
+MAX_CHILDREN = 100
+MAX_BLOCKS_PER_REQUEST = 1000
+MAX_PAYLOAD_BYTES = 500 * 1000
+# Levels of nested children below a top-level block of the request
+MAX_NESTING_DEPTH = 2
+# Room left for the rest of the body (parent, title property, "after")
+REQUEST_OVERHEAD_BYTES = 16 * 1024
+
+
+def _shape(block: Dict[str, Any]) -> Tuple[int, int, int]:
+    """
+    Measure the nesting of a block.
+
+    Returns:
+        Tuple of (blocks in the subtree, nesting depth counting the block
+        itself, so 1 for a leaf, longest children array)
+    """
+    body = block.get(block.get("type")) or {}
+    children = body.get("children") or []
+    count, depth, widest = 1, 1, len(children)
+    for child in children:
+        child_count, child_depth, child_widest = _shape(child)
+        count += child_count
+        depth = max(depth, child_depth + 1)
+        widest = max(widest, child_widest)
+    return count, depth, widest
+
+
+# Same settings as httpx uses for request bodies (json.dumps would build a new encoder per call)
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def encoded_size(block: Dict[str, Any]) -> int:
+    """Size of a block (or any JSON value) in bytes as httpx encodes the request body."""
+    encoded = _ENCODER.encode(block)
+    return len(encoded) if encoded.isascii() else len(encoded.encode("utf-8"))
+
+
+def _without_children(block: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Split a block into a childless copy and its children."""
+    block_type = block["type"]
+    body = dict(block[block_type])
+    children = body.pop("children", None) or []
+    return {**block, block_type: body}, children
+
+
+class PayloadPacker:
+    """
+    Packs blocks into requests that carry as much content as Notion accepts.
+    Each request holds at most max_children top-level blocks, max_blocks blocks
+    in total (nested children included), max_bytes of JSON and max_depth levels
+    of children below a top-level block. A block whose children do not fit into one request is sent
+    without them, and its children are appended to it once its ID is known.
+    """
+
+    def __init__(
+        self,
+        max_children: int = MAX_CHILDREN,
+        max_blocks: int = MAX_BLOCKS_PER_REQUEST,
+        max_bytes: int = MAX_PAYLOAD_BYTES - REQUEST_OVERHEAD_BYTES,
+        max_depth: int = MAX_NESTING_DEPTH
+    ):
+        """
+        Initialize the PayloadPacker.
+
+        Args:
+            max_children: Maximum length of any children array
+            max_blocks: Maximum number of blocks per request
+            max_bytes: Maximum encoded size of the children of one request
+            max_depth: Maximum levels of children below a top-level block
+        """
+        if min(max_children, max_blocks, max_bytes, max_depth) < 1:
+            raise ValueError("Packing limits must be positive")
+        self.max_children = max_children
+        self.max_blocks = max_blocks
+        self.max_bytes = max_bytes
+        self.max_depth = max_depth
+
+    def pack(
+        self,
+        blocks: Iterable[Union[Block, Dict[str, Any]]],
+        create: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Pack blocks into requests, consuming the input lazily.
+
+        Args:
+            blocks: Compact blocks or Notion block dicts (list or lazy iterator)
+            create: The first request is sent with pages.create, whose response
+                holds no block IDs, so it never defers children
+
+        Yields:
+            Requests with the keys "children" (the children array to send) and
+            "deferred" (list of (index into children, children to append to
+            that block once it exists))
+        """
+        children: List[Dict[str, Any]] = []
+        deferred: List[Tuple[int, List[Dict[str, Any]]]] = []
+        count = size = 0
+        ids_known = not create
+
+        for block in blocks:
+            block = to_notion(block)
+            block_count, depth, widest = _shape(block)
+            block_size = encoded_size(block)
+            nested: List[Dict[str, Any]] = []
+            if block_count > 1 and (
+                depth - 1 > self.max_depth
+                or widest > self.max_children
+                or block_count > self.max_blocks
+                or block_size > self.max_bytes
+            ):
+                block, nested = _without_children(block)
+                block_count, block_size = 1, encoded_size(block)
+            if block_size > self.max_bytes:
+                # Notion would reject the request; normalize_blocks() keeps text blocks below this
+                raise ValueError(
+                    f"A {block['type']} block encodes to {block_size} bytes without its children, "
+                    f"more than the {self.max_bytes} bytes one request may carry"
+                )
+            if nested and not ids_known:
+                # Send this block with an append so its ID is returned
+                yield {"children": children, "deferred": deferred}
+                children, deferred, count, size = [], [], 0, 0
+                ids_known = True
+
+            if children and (
+                count + block_count > self.max_blocks
+                or size + block_size + 1 > self.max_bytes
+            ):
+                yield {"children": children, "deferred": deferred}
+                children, deferred, count, size = [], [], 0, 0
+                ids_known = True
+
+            if nested:
+                deferred.append((len(children), nested))
+            children.append(block)
+            count += block_count
+            size += block_size + 1
+
+            # A full request is sent without reading ahead in the input
+            if len(children) >= self.max_children:
+                yield {"children": children, "deferred": deferred}
+                children, deferred, count, size = [], [], 0, 0
+                ids_known = True
+
+        if children or not ids_known:
+            yield {"children": children, "deferred": deferred}
+
+    def count_calls(self, blocks: Iterable[Union[Block, Dict[str, Any]]], create: bool = True) -> int:
+        """
+        Count the API calls an upload of blocks will take, without keeping the requests.
+
+        Args:
+            blocks: Compact blocks or Notion block dicts (must be re-iterable
+                if they are uploaded afterwards)
+            create: See pack()
+
+        Returns:
+            Number of requests, including appends of deferred children
+        """
+        return self.measure(blocks, create)[0]
+
+    def measure(self, blocks: Iterable[Union[Block, Dict[str, Any]]], create: bool = True) -> Tuple[int, int]:
+        """
+        Count the requests and the blocks they carry, without keeping the requests.
+
+        Args:
+            blocks: Compact blocks or Notion block dicts (must be re-iterable
+                if they are uploaded afterwards)
+            create: See pack()
+
+        Returns:
+            Tuple of (requests, blocks sent as request children), both including
+            appends of deferred children
+        """
+        calls = sent = 0
+        for request in self.pack(blocks, create):
+            calls += 1
+            sent += len(request["children"])
+            for _, nested in request["deferred"]:
+                nested_calls, nested_sent = self.measure(nested, create=False)
+                calls += nested_calls
+                sent += nested_sent
+        return calls, sent
@@ -0,0 +1,199 @@
+"""
+Profiling module for investigating slow uploads.
+Wraps tool calls and uploader methods with cProfile and tracemalloc when
+enabled, writing a .prof file and a top-allocation summary per profiled call.
+"""
+
+import cProfile
+import functools
+import itertools
+import logging
+import os
+import random
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+try:
+    from .http_pool import env_flag
+except ImportError:
+    from http_pool import env_flag
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_PROFILE_DIR = "~/.markdown2notion/profiles"
+# Fraction of calls profiled while profiling is enabled
+DEFAULT_SAMPLE_RATE = 1.0
+# Allocation sites listed in each summary
+DEFAULT_TOP_ALLOCATIONS = 25
+
+# Frames of the profiler itself, left out of the allocation summary
+_IGNORED_FRAMES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class Profiler:
+    """
+    Profiles sampled calls with cProfile and tracemalloc.
+    Only one call is profiled at a time: tracemalloc is process-wide and
+    newer Pythons allow a single active cProfile, so a call that starts while
+    another is being profiled (including a nested call) runs unprofiled.
+    cProfile only sees the calling thread; tracemalloc sees all threads.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_PROFILE_DIR,
+        enabled: bool = False,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        top: int = DEFAULT_TOP_ALLOCATIONS,
+        rng: Callable[[], float] = random.random
+    ):
+        """
+        Initialize the Profiler.
+
+        Args:
+            directory: Folder the profiles are written to
+            enabled: Profile sampled calls; when False only forced calls are profiled
+            sample_rate: Fraction of calls profiled while enabled (0 to 1)
+            top: Number of allocation sites listed in each summary
+            rng: Random source for sampling, injectable for tests
+        """
+        self.directory = Path(directory).expanduser()
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.top = top
+        self._rng = rng
+        self._active = threading.Lock()
+        self._sequence = itertools.count(1)
+
+    def should_profile(self, force: bool = False) -> bool:
+        """Whether the next call is profiled (forced, or enabled and sampled)."""
+        return force or (self.enabled and self._rng() < self.sample_rate)
+
+    @contextmanager
+    def profile(self, name: str, force: bool = False) -> Iterator[Optional[Path]]:
+        """
+        Profile the code run inside the with block.
+
+        Args:
+            name: Name of the profiled call, used in the file names
+            force: Profile even if profiling is disabled or the call is not sampled
+
+        Yields:
+            Path of the .prof file written when the block exits, or None if
+            the call is not profiled
+        """
+        if not self.should_profile(force) or not self._active.acquire(blocking=False):
+            yield None
+            return
+        try:
+            base = self._base_path(name)
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot()
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                yield Path(f"{base}.prof")
+            finally:
+                profiler.disable()
+                elapsed = time.perf_counter() - start
+                after = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+                self._write(base, name, profiler, before, after, elapsed, peak)
+        finally:
+            self._active.release()
+
+    def _base_path(self, name: str) -> Path:
+        """Unique path for the files of one profiled call, without suffix (names may contain dots)."""
+        safe_name = re.sub(r"[^\w.-]", "_", name)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return self.directory / f"{stamp}-{safe_name}-{os.getpid()}-{next(self._sequence)}"
+
+    def _write(
+        self,
+        base: Path,
+        name: str,
+        profiler: cProfile.Profile,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+        elapsed: float,
+        peak: int
+    ) -> None:
+        """Write the .prof file and the allocation summary; failures are only logged."""
+        stats = after.filter_traces(_IGNORED_FRAMES).compare_to(before.filter_traces(_IGNORED_FRAMES), "lineno")
+        lines = [
+            f"{name}: {elapsed:.3f}s wall, peak traced memory {peak / 1024 / 1024:.1f} MiB",
+            "",
+            f"Top {self.top} allocation sites by growth:",
+        ]
+        lines.extend(str(stat) for stat in stats[:self.top])
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(f"{base}.prof")
+            Path(f"{base}.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not write profile of %s to %s: %s", name, self.directory, e)
+
+
+_default_profiler: Optional[Profiler] = None
+_default_profiler_lock = threading.Lock()
+
+
+def get_default_profiler() -> Profiler:
+    """
+    Get the process-wide Profiler.
+    Profiling is enabled with NOTION_PROFILE, profiles are written to
+    NOTION_PROFILE_DIR and NOTION_PROFILE_SAMPLE_RATE sets the fraction of
+    calls profiled.
+
+    Returns:
+        The shared Profiler instance
+    """
+    global _default_profiler
+    if _default_profiler is None:
+        with _default_profiler_lock:
+            if _default_profiler is None:
+                _default_profiler = Profiler(
+                    directory=os.getenv("NOTION_PROFILE_DIR") or DEFAULT_PROFILE_DIR,
+                    enabled=env_flag("NOTION_PROFILE"),
+                    sample_rate=float(os.getenv("NOTION_PROFILE_SAMPLE_RATE", DEFAULT_SAMPLE_RATE)),
+                )
+    return _default_profiler
+
+
+def profiled(name: str, force: bool = False) -> Callable[[F], F]:
+    """
+    Decorate a function so its calls are profiled by the process-wide Profiler.
+    While profiling is disabled a call costs one attribute check.
+
+    Args:
+        name: Name of the profiled call, used in the file names
+        force: Profile every call regardless of the profiler settings
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = get_default_profiler()
+            if not (force or profiler.enabled):
+                return func(*args, **kwargs)
+            with profiler.profile(name, force=force):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
@@ -0,0 +1,237 @@
+"""
+Client-side rate limiting for Notion API calls.
+Provides a process-wide token bucket plus retry handling for HTTP 429
+responses that honors Retry-After with jittered exponential backoff.
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Notion documents an average of three requests per second per integration
+DEFAULT_RATE = 3.0
+DEFAULT_BURST = 3
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    Callers reserve a token up front and sleep for the returned delay, so
+    concurrent callers are served in arrival order without busy waiting.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        capacity: float = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the TokenBucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+            clock: Monotonic clock, injectable for tests
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token, borrowing from the future if the bucket is empty.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = self._clock()
+            # No tokens accrue while the bucket is paused by a Retry-After
+            refill_from = max(self._updated, min(self._paused_until, now))
+            self._tokens = min(self.capacity, self._tokens + (now - refill_from) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            # Borrowed tokens only start accruing once a pause has ended
+            deficit = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(0.0, self._paused_until - now) + deficit
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for the given number of seconds.
+        Used when the server signals a rate limit so every caller backs off.
+
+        Args:
+            seconds: Pause duration
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Routes Notion API calls through a token bucket and retries rate-limited calls.
+    Only HTTP 429 responses are retried: the request was rejected before being
+    processed, so re-sending it cannot create duplicate content.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        bucket: Optional[TokenBucket] = None
+    ):
+        """
+        Initialize the RateLimiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Number of requests that may be sent back to back
+            max_retries: Retries per call after a 429 before giving up
+            base_delay: First backoff delay in seconds (doubled per attempt)
+            max_delay: Upper bound for a single backoff delay in seconds
+            bucket: Pre-built token bucket (overrides rate and burst)
+        """
+        self.bucket = bucket or TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @staticmethod
+    def is_rate_limited(error: BaseException) -> bool:
+        """Return True if the error is a Notion HTTP 429 response."""
+        return getattr(error, "status", None) == 429 or getattr(error, "code", None) == "rate_limited"
+
+    @staticmethod
+    def retry_after(error: BaseException) -> Optional[float]:
+        """
+        Read the Retry-After header (in seconds) from an API error.
+
+        Args:
+            error: The exception raised by notion_client
+
+        Returns:
+            Delay in seconds, or None if the header is missing or malformed
+        """
+        headers = getattr(error, "headers", None)
+        if not headers:
+            return None
+
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return None
+
+    def backoff_delay(self, error: BaseException, attempt: int) -> float:
+        """
+        Compute how long to back off before retry number attempt (0-based).
+        Retry-After is treated as a floor; exponential backoff with full
+        jitter spreads out concurrent retries.
+
+        Args:
+            error: The rate limit error
+            attempt: Number of retries already made for this call
+
+        Returns:
+            Delay in seconds
+        """
+        exponential = min(self.max_delay, self.base_delay * (2 ** attempt))
+        jittered = random.uniform(0, exponential)
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            return min(self.max_delay, retry_after) + jittered * 0.5
+        return jittered
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call func once a token is available, retrying on HTTP 429.
+
+        Args:
+            func: The notion_client endpoint method to call
+            *args, **kwargs: Arguments forwarded to func
+
+        Returns:
+            The value returned by func
+        """
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not self.is_rate_limited(e) or attempt >= self.max_retries:
+                    raise
+                self.bucket.pause(self.backoff_delay(e, attempt))
+                attempt += 1
+
+    async def call_async(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Await func once a token is available, retrying on HTTP 429.
+
+        Args:
+            func: The notion_client AsyncClient endpoint method to call
+            *args, **kwargs: Arguments forwarded to func
+
+        Returns:
+            The value returned by func
+        """
+        attempt = 0
+        while True:
+            await self.bucket.acquire_async()
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if not self.is_rate_limited(e) or attempt >= self.max_retries:
+                    raise
+                self.bucket.pause(self.backoff_delay(e, attempt))
+                attempt += 1
+
+
+_default_limiter: Optional[RateLimiter] = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_default_limiter() -> RateLimiter:
+    """
+    Get the process-wide RateLimiter shared by all uploaders.
+    The sustained rate can be tuned with the NOTION_RATE_LIMIT environment
+    variable (requests per second).
+
+    Returns:
+        The shared RateLimiter instance
+    """
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            rate = float(os.getenv("NOTION_RATE_LIMIT", DEFAULT_RATE))
+            _default_limiter = RateLimiter(rate=rate)
+        return _default_limiter
@@ -5,44 +5,302 @@ FastMCP-based server for uploading Markdown files to Notion.
 Uses filename as page title and supports database/parent page targets.
 """
 
+import asyncio
+import contextvars
+import functools
 import os
 import sys
-from typing import Optional
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from pathlib import Path
 
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 # Import handling for direct execution vs module import
-if __name__ == "__main__":
+try:
+    from .http_pool import warm_up
+    from .metrics import get_default_metrics
+    from .profiling import get_default_profiler, profiled
+    from .upload_jobs import UploadJob, get_default_job_manager, get_upload_slots
+except ImportError:
+    from http_pool import warm_up
+    from metrics import get_default_metrics
+    from profiling import get_default_profiler, profiled
+    from upload_jobs import UploadJob, get_default_job_manager, get_upload_slots
+
+
+if TYPE_CHECKING:
     from notion_uploader import NotionUploader
-else:
-    from .notion_uploader import NotionUploader
-
 
 # Initialize FastMCP server
 mcp = FastMCP("Markdown2Notion")
 
 # Global uploader instance
 uploader = None
+_uploader_lock = threading.Lock()
+
+# Uploads allowed to run at the same time; further upload calls wait their turn
+DEFAULT_MAX_CONCURRENT_UPLOADS = 2
+# Threads kept free for quick read-only tools while uploads are running
+_READ_WORKERS = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_max_uploads = DEFAULT_MAX_CONCURRENT_UPLOADS
+_executor_lock = threading.Lock()
+# asyncio.Semaphore belongs to one event loop, so keep one per loop
+_upload_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+# Event loop of the tool call whose body runs on the current executor thread
+_tool_loop: contextvars.ContextVar[Optional[asyncio.AbstractEventLoop]] = contextvars.ContextVar(
+    "_tool_loop", default=None
+)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import NotionUploader on first use (PEP 562).
+    notion_client and the upload stack are not needed to answer the MCP
+    handshake, so they load with the first tool call or in main()'s warm-up
+    thread. Once imported, the class is a plain (patchable) module attribute.
+    """
+    if name != "NotionUploader":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        from .notion_uploader import NotionUploader
+    except ImportError:
+        from notion_uploader import NotionUploader
+    globals()["NotionUploader"] = NotionUploader
+    return NotionUploader
 
 
-def get_uploader() -> NotionUploader:
-    """Get or create NotionUploader instance."""
+def get_uploader() -> "NotionUploader":
+    """Get or create NotionUploader instance (safe for concurrent first calls)."""
     global uploader
     if uploader is None:
-        uploader = NotionUploader()
+        with _uploader_lock:
+            if uploader is None:
+                # Attribute lookup on the module runs the lazy import on first use
+                uploader = getattr(sys.modules[__name__], "NotionUploader")()
     return uploader
 
 
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Get the bounded executor that runs blocking tool bodies.
+    The upload limit is read from NOTION_MAX_CONCURRENT_UPLOADS when the
+    executor is created; a few extra threads stay free for read-only tools.
+
+    Returns:
+        The shared ThreadPoolExecutor
+    """
+    global _executor, _max_uploads
+    with _executor_lock:
+        if _executor is None:
+            _max_uploads = max(1, int(os.getenv("NOTION_MAX_CONCURRENT_UPLOADS", DEFAULT_MAX_CONCURRENT_UPLOADS)))
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_uploads + _READ_WORKERS,
+                thread_name_prefix="notion-tool"
+            )
+        return _executor
+
+
+def _get_upload_semaphore() -> asyncio.Semaphore:
+    """Get the upload semaphore of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _executor_lock:
+        semaphore = _upload_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(_max_uploads)
+            _upload_semaphores[loop] = semaphore
+        return semaphore
+
+
+def _holding_upload_slot(call: Callable[[], str]) -> str:
+    """Run an upload tool body while holding one of the slots it shares with background jobs."""
+    with get_upload_slots():
+        return call()
+
+
+def _run_tool(func: Callable[..., str], force_profile: bool, args: tuple, kwargs: dict) -> str:
+    """Run a tool body, profiled if profiling is enabled or the call asks for it."""
+    profiler = get_default_profiler()
+    if not (force_profile or profiler.enabled):
+        return func(*args, **kwargs)
+    with profiler.profile(f"tool.{func.__name__}", force=force_profile):
+        return func(*args, **kwargs)
+
+
+def _offload(upload: bool) -> Callable[[Callable[..., str]], Callable[..., Any]]:
+    """
+    Turn a blocking tool function into a coroutine run on the tool executor,
+    so one long upload does not stall other tool calls on the event loop.
+    A call is profiled when profiling is enabled or its "profile" argument is True.
+
+    Args:
+        upload: Whether the tool uploads; uploads are capped at
+            NOTION_MAX_CONCURRENT_UPLOADS together with background jobs,
+            read-only tools and background submissions are not
+    """
+    def decorator(func: Callable[..., str]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            executor = _get_executor()
+            loop = asyncio.get_running_loop()
+            # Run the body in a copy of this context, so it can reach the loop (see _ToolProgress)
+            token = _tool_loop.set(loop)
+            context = contextvars.copy_context()
+            _tool_loop.reset(token)
+            force_profile = bool(kwargs.get("profile", False))
+            call = functools.partial(context.run, _run_tool, func, force_profile, args, kwargs)
+            if not upload or kwargs.get("background"):
+                return await loop.run_in_executor(executor, call)
+            # The loop's semaphore keeps waiting uploads from occupying executor threads;
+            # the shared slots count uploads running in background jobs too
+            async with _get_upload_semaphore():
+                return await loop.run_in_executor(executor, _holding_upload_slot, call)
+        return wrapper
+    return decorator
+
+
+def _page_url(page_id: str) -> str:
+    """Build the notion.so URL of a page."""
+    return f"https://www.notion.so/{page_id.replace('-', '')}"
+
+
+class _ToolProgress:
+    """
+    Sends MCP progress notifications for an upload running on the tool executor.
+    Has the plan()/record() interface of UploadJob; progress is counted in API calls.
+    """
+
+    def __init__(self, ctx: Optional[Context]):
+        """
+        Initialize the reporter; a no-op without a context or outside a tool call.
+
+        Args:
+            ctx: FastMCP context of the tool call
+        """
+        self.ctx = ctx
+        self.loop = _tool_loop.get()
+        self.calls_total: Optional[int] = None
+        self.calls_done = 0
+        self.blocks_sent = 0
+
+    def plan(self, calls: int, blocks: int) -> None:
+        """Report that parsing is done."""
+        self.calls_total = calls
+        self._send(f"Parsed {blocks} blocks; uploading in {calls} API calls")
+
+    def record(self, blocks: int) -> None:
+        """Report a confirmed API call (used as the uploader's progress callback)."""
+        self.calls_done += 1
+        self.blocks_sent += blocks
+        if self.calls_done == 1:
+            self._send(f"Page created with {blocks} blocks")
+        elif self.calls_total is None:
+            self._send(f"Appended chunk {self.calls_done - 1} ({self.blocks_sent} blocks sent)")
+        else:
+            total = max(self.calls_total, self.calls_done)
+            self._send(f"Appended chunk {self.calls_done - 1} of {total - 1}")
+
+    def _send(self, message: str) -> None:
+        """Schedule the notification on the tool call's event loop without waiting for it."""
+        if self.ctx is None or self.loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(
+            self.ctx.report_progress(self.calls_done, self.calls_total, message), self.loop
+        )
+
+
+def _upload_file_tracked(
+    tracker: Any,
+    uploader_instance: "NotionUploader",
+    filepath: str,
+    database_id: Optional[str],
+    parent_page_id: Optional[str],
+    force: bool
+) -> str:
+    """
+    Upload a file, reporting its plan and progress to tracker (an UploadJob or _ToolProgress).
+    The uploader plans from its own parse of the file, after the manifest check;
+    files over PLAN_MAX_FILE_BYTES are streamed and reported without totals.
+    """
+    return uploader_instance.upload_markdown_file(
+        filepath=filepath,
+        database_id=database_id,
+        parent_page_id=parent_page_id,
+        force=force,
+        progress=tracker.record,
+        plan=tracker.plan
+    )
+
+
+def _upload_content_tracked(
+    tracker: Any,
+    uploader_instance: "NotionUploader",
+    content: str,
+    title: str,
+    database_id: Optional[str],
+    parent_page_id: Optional[str]
+) -> str:
+    """
+    Upload Markdown content, reporting its plan and progress to tracker.
+    """
+    return uploader_instance.upload_markdown_content(
+        content=content,
+        title=title,
+        database_id=database_id,
+        parent_page_id=parent_page_id,
+        progress=tracker.record,
+        plan=tracker.plan
+    )
+
+
+def _job_started_message(job: UploadJob) -> str:
+    """Format the reply of a tool call that started a background job."""
+    return (
+        f"Started background upload of {job.description}.\nJob ID: {job.id}\n"
+        f"Check progress with get_upload_status(job_id=\"{job.id}\")"
+    )
+
+
+def _format_job(job: UploadJob) -> str:
+    """Format the status of a background job."""
+    state = job.snapshot()
+    lines = [f"Job {state['id']}: {state['status']} ({state['description']})"]
+    if state["blocks_total"] is None:
+        lines.append(f"Progress: {state['blocks_sent']} blocks sent in {state['calls_done']} API calls")
+    else:
+        lines.append(
+            f"Progress: {state['blocks_sent']}/{state['blocks_total']} blocks sent, "
+            f"{state['chunks_remaining']} of {state['calls_total']} chunks remaining"
+        )
+    if state["elapsed"]:
+        lines.append(f"Throughput: {state['blocks_per_second']:.1f} blocks/s over {state['elapsed']:.1f}s")
+    if state["page_id"]:
+        lines.append(f"Page ID: {state['page_id']}\nView at: {_page_url(state['page_id'])}")
+    if state["error"]:
+        lines.append(f"Error: {state['error']}")
+    return "\n".join(lines)
+
+
 @mcp.tool()
+@_offload(upload=True)
 def upload_markdown(
     filepath: str, 
     parent_url: Optional[str] = None,
     database_id: Optional[str] = None, 
-    parent_page_id: Optional[str] = None
+    parent_page_id: Optional[str] = None,
+    force: bool = False,
+    background: bool = False,
+    profile: bool = False,
+    ctx: Optional[Context] = None
 ) -> str:
     """
     Upload a Markdown file to Notion as a new page.
@@ -54,9 +312,15 @@ def upload_markdown(
         parent_url: Notion page URL (e.g., https://notion.so/page-title-abc123...)
         database_id: Target Notion database ID (optional, alternative to parent_url)
         parent_page_id: Parent page ID (optional, alternative to parent_url)
+        force: Upload even if the upload manifest says the file is unchanged
+        background: Return a job ID at once and upload in the background
+            (poll with get_upload_status)
+        profile: Write a cProfile and tracemalloc profile of this upload to
+            NOTION_PROFILE_DIR
+        ctx: MCP context for progress notifications (injected by FastMCP)
         
     Returns:
-        Success message with the created page ID
+        Success message with the created page ID, or the job ID in background mode
         
     Raises:
         Exception: If upload fails
@@ -71,11 +335,30 @@ def upload_markdown(
         if not database_id and not parent_page_id:
             return "Error: Either parent_url, database_id, or parent_page_id must be provided"
         
-        page_id = uploader_instance.upload_markdown_file(
-            filepath=filepath,
-            database_id=database_id,
-            parent_page_id=parent_page_id
-        )
+        if background:
+            if not Path(filepath).is_file():
+                raise FileNotFoundError(filepath)
+            job = get_default_job_manager().submit(
+                f"'{Path(filepath).name}'",
+                profiled("job.upload_markdown", force=profile)(functools.partial(
+                    _upload_file_tracked,
+                    uploader_instance=uploader_instance, filepath=filepath,
+                    database_id=database_id, parent_page_id=parent_page_id, force=force
+                ))
+            )
+            return _job_started_message(job)
+        
+        if ctx is not None:
+            page_id = _upload_file_tracked(
+                _ToolProgress(ctx), uploader_instance, filepath, database_id, parent_page_id, force
+            )
+        else:
+            page_id = uploader_instance.upload_markdown_file(
+                filepath=filepath,
+                database_id=database_id,
+                parent_page_id=parent_page_id,
+                force=force
+            )
         
         filename = Path(filepath).name
         clean_page_id = page_id.replace("-", "")
@@ -92,12 +375,16 @@ def upload_markdown(
 
 
 @mcp.tool()
+@_offload(upload=True)
 def upload_markdown_content(
     content: str,
     title: str,
     parent_url: Optional[str] = None,
     database_id: Optional[str] = None,
-    parent_page_id: Optional[str] = None
+    parent_page_id: Optional[str] = None,
+    background: bool = False,
+    profile: bool = False,
+    ctx: Optional[Context] = None
 ) -> str:
     """
     Upload Markdown content directly to Notion as a new page.
@@ -109,9 +396,14 @@ def upload_markdown_content(
         parent_url: Notion page URL (e.g., https://notion.so/page-title-abc123...)
         database_id: Target Notion database ID (optional, alternative to parent_url)
         parent_page_id: Parent page ID (optional, alternative to parent_url)
+        background: Return a job ID at once and upload in the background
+            (poll with get_upload_status)
+        profile: Write a cProfile and tracemalloc profile of this upload to
+            NOTION_PROFILE_DIR
+        ctx: MCP context for progress notifications (injected by FastMCP)
         
     Returns:
-        Success message with the created page ID
+        Success message with the created page ID, or the job ID in background mode
         
     Raises:
         Exception: If upload fails
@@ -126,12 +418,28 @@ def upload_markdown_content(
         if not database_id and not parent_page_id:
             return "Error: Either parent_url, database_id, or parent_page_id must be provided"
         
-        page_id = uploader_instance.upload_markdown_content(
-            content=content,
-            title=title,
-            database_id=database_id,
-            parent_page_id=parent_page_id
-        )
+        if background:
+            job = get_default_job_manager().submit(
+                f"content '{title}'",
+                profiled("job.upload_markdown_content", force=profile)(functools.partial(
+                    _upload_content_tracked,
+                    uploader_instance=uploader_instance, content=content, title=title,
+                    database_id=database_id, parent_page_id=parent_page_id
+                ))
+            )
+            return _job_started_message(job)
+        
+        if ctx is not None:
+            page_id = _upload_content_tracked(
+                _ToolProgress(ctx), uploader_instance, content, title, database_id, parent_page_id
+            )
+        else:
+            page_id = uploader_instance.upload_markdown_content(
+                content=content,
+                title=title,
+                database_id=database_id,
+                parent_page_id=parent_page_id
+            )
         
         clean_page_id = page_id.replace("-", "")
         page_url = f"https://www.notion.so/{clean_page_id}"
@@ -145,6 +453,142 @@ def upload_markdown_content(
 
 
 @mcp.tool()
+@_offload(upload=True)
+def upload_directory(
+    directory: str,
+    pattern: str = "**/*.md",
+    parent_url: Optional[str] = None,
+    database_id: Optional[str] = None,
+    parent_page_id: Optional[str] = None,
+    max_workers: int = 4,
+    mirror_folders: bool = False,
+    force: bool = False,
+    profile: bool = False
+) -> str:
+    """
+    Upload every Markdown file in a directory (e.g. an Obsidian vault) to Notion.
+    Each file becomes one page titled after its filename. Up to max_workers
+    files are uploaded concurrently, but no more than NOTION_MAX_CONCURRENT_UPLOADS.
+    
+    Args:
+        directory: Path to the directory to upload
+        pattern: Glob pattern relative to the directory (default: "**/*.md")
+        parent_url: Notion page URL (e.g., https://notion.so/page-title-abc123...)
+        database_id: Target Notion database ID (optional, alternative to parent_url)
+        parent_page_id: Parent page ID (optional, alternative to parent_url)
+        max_workers: Maximum number of concurrent uploads (default: 4, capped
+            at NOTION_MAX_CONCURRENT_UPLOADS)
+        mirror_folders: Recreate subfolders as nested pages (parent page targets only)
+        force: Upload files even if the upload manifest says they are unchanged
+        profile: Write a cProfile and tracemalloc profile of this upload to
+            NOTION_PROFILE_DIR
+        
+    Returns:
+        Summary line followed by one result row per file
+    """
+    try:
+        uploader_instance = get_uploader()
+        
+        # Extract parent_page_id from URL if provided
+        if parent_url:
+            parent_page_id = uploader_instance.extract_page_id_from_url(parent_url)
+        
+        if not database_id and not parent_page_id:
+            return "Error: Either parent_url, database_id, or parent_page_id must be provided"
+        
+        # The whole batch holds one upload slot, so it may not run more files than there are slots
+        results = uploader_instance.upload_directory(
+            directory=directory,
+            pattern=pattern,
+            database_id=database_id,
+            parent_page_id=parent_page_id,
+            max_workers=min(max_workers, _max_uploads),
+            mirror_folders=mirror_folders,
+            force=force
+        )
+        
+        if not results:
+            return f"No files matching '{pattern}' found in {directory}"
+        
+        failed = sum(1 for result in results if result["status"] == "failed")
+        skipped = sum(1 for result in results if result["status"] == "skipped")
+        uploaded = len(results) - failed - skipped
+        summary = (
+            f"Uploaded {uploaded} of {len(results)} files "
+            f"({skipped} unchanged, {failed} failed).\n"
+        )
+        rows = []
+        for result in results:
+            detail = result["page_id"] if result["status"] != "failed" else result["error"]
+            rows.append(f"- [{result['status']}] {result['filepath']}: {detail}")
+        
+        return summary + "\n".join(rows)
+        
+    except FileNotFoundError:
+        return f"Error: Directory not found: {directory}"
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        return f"Error uploading directory: {str(e)}"
+
+
+@mcp.tool()
+@_offload(upload=True)
+def update_page(
+    page_url: Optional[str] = None,
+    page_id: Optional[str] = None,
+    filepath: Optional[str] = None,
+    content: Optional[str] = None,
+    profile: bool = False
+) -> str:
+    """
+    Update an existing Notion page in place from Markdown.
+    Only blocks that changed are updated, deleted or inserted, so small edits
+    to large pages need only a few API calls.
+    
+    Args:
+        page_url: URL of the Notion page to update
+        page_id: ID of the page to update (alternative to page_url)
+        filepath: Path to a Markdown file with the new content
+        content: New Markdown content as string (alternative to filepath)
+        profile: Write a cProfile and tracemalloc profile of this update to
+            NOTION_PROFILE_DIR
+        
+    Returns:
+        Summary of the applied changes
+    """
+    try:
+        uploader_instance = get_uploader()
+        
+        if page_url:
+            page_id = uploader_instance.extract_page_id_from_url(page_url)
+        
+        if not page_id:
+            return "Error: Either page_url or page_id must be provided"
+        if (filepath is None) == (content is None):
+            return "Error: Provide exactly one of filepath or content"
+        
+        if filepath is not None:
+            content = Path(filepath).read_text(encoding="utf-8")
+        
+        summary = uploader_instance.update_page(page_id, content)
+        
+        return (
+            f"Updated page {page_id}: {summary['updated']} updated, "
+            f"{summary['inserted']} inserted, {summary['deleted']} deleted, "
+            f"{summary['unchanged']} unchanged ({summary['api_calls']} API calls)"
+        )
+        
+    except FileNotFoundError:
+        return f"Error: File not found: {filepath}"
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    except Exception as e:
+        return f"Error updating page: {str(e)}"
+
+
+@mcp.tool()
+@_offload(upload=False)
 def list_database_pages(database_id: str, limit: int = 10) -> str:
     """
     List pages in a Notion database (for debugging purposes).
@@ -165,8 +609,12 @@ def list_database_pages(database_id: str, limit: int = 10) -> str:
         
         result = f"Found {len(pages)} pages in database:\n"
         for page in pages:
-            title_prop = page.get("properties", {}).get("title", {})
-            if "title" in title_prop and title_prop["title"]:
+            # The title property is named by the database schema (e.g. "Name")
+            title_prop = next(
+                (prop for prop in page.get("properties", {}).values() if prop.get("type") == "title"),
+                {}
+            )
+            if title_prop.get("title"):
                 title = title_prop["title"][0].get("plain_text", "Untitled")
             else:
                 title = "Untitled"
@@ -179,6 +627,7 @@ def list_database_pages(database_id: str, limit: int = 10) -> str:
 
 
 @mcp.tool()
+@_offload(upload=False)
 def get_database_info(database_id: str) -> str:
     """
     Get information about a Notion database.
@@ -204,6 +653,58 @@ def get_database_info(database_id: str) -> str:
         return f"Error getting database info: {str(e)}"
 
 
+@mcp.tool()
+def get_upload_status(job_id: str) -> str:
+    """
+    Get the progress of a background upload started with background=True.
+    
+    Args:
+        job_id: Job ID returned by the upload tool
+        
+    Returns:
+        Status, blocks sent and chunks remaining (or API calls made when the
+        upload was not planned), throughput, and the page URL once finished or
+        the error if it failed
+    """
+    job = get_default_job_manager().get(job_id)
+    if job is None:
+        return f"Error: Unknown upload job: {job_id}"
+    return _format_job(job)
+
+
+@mcp.tool()
+def list_upload_jobs() -> str:
+    """
+    List background uploads of this server, oldest first.
+    
+    Returns:
+        Status of every known job
+    """
+    jobs = get_default_job_manager().jobs()
+    if not jobs:
+        return "No upload jobs"
+    return "\n\n".join(_format_job(job) for job in jobs)
+
+
+@mcp.tool()
+def get_metrics() -> str:
+    """
+    Show where upload time goes in this server process.
+    Lists per-stage timings (read_file, parse, create_page, append) and, per
+    Notion API endpoint, call counts, latency percentiles, 429 responses and bytes sent.
+    
+    Returns:
+        Metrics summary
+    """
+    return get_default_metrics().summary()
+
+
+@mcp.resource("metrics://prometheus", mime_type="text/plain")
+def prometheus_metrics() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    return get_default_metrics().render_prometheus()
+
+
 @mcp.prompt()
 def markdown_upload_guide() -> str:
     """Guide for using the Markdown2Notion MCP server."""
@@ -228,9 +729,32 @@ Upload Markdown content directly:
 - `title`: Page title
 - `database_id` or `parent_page_id`: Target location
 
+### upload_directory
+Upload every Markdown file of a directory (e.g. an Obsidian vault):
+- `directory`: Path to the folder
+- `pattern`: Glob pattern (default `**/*.md`)
+- `max_workers`: Number of concurrent uploads (default 4)
+- `mirror_folders`: Recreate subfolders as nested pages
+- `force`: Re-upload files the upload manifest reports as unchanged
+
+### update_page
+Update an existing page in place (only changed blocks are sent):
+- `page_url` or `page_id`: Page to update
+- `filepath` or `content`: New Markdown content
+
 ### list_database_pages
 List existing pages in a database for reference.
 
+### get_metrics
+Per-stage timings and per-endpoint API latency, 429 and byte counts
+(also available as the `metrics://prometheus` resource).
+
+### Background uploads
+Pass `background=True` to `upload_markdown` or `upload_markdown_content` to get a
+job ID at once instead of waiting for the last chunk:
+- `get_upload_status`: Blocks sent, chunks remaining, throughput and the final page URL or error
+- `list_upload_jobs`: Status of all jobs
+
 ## Setup Requirements
 1. Set NOTION_TOKEN environment variable
 2. Ensure target database/page allows content creation
@@ -244,12 +768,22 @@ This creates a Notion page titled "my-document" with your markdown content.
 """
 
 
+def _warm_up() -> None:
+    """Import NotionUploader and open the first connection to Notion."""
+    __getattr__("NotionUploader")
+    warm_up()
+
+
 def main():
     """Main entry point for the server."""
     # Check for Notion token
     if not os.getenv("NOTION_TOKEN"):
         print("Warning: NOTION_TOKEN environment variable not set", file=sys.stderr)
     
+    # Load the upload stack and open the connection to Notion in the background
+    # before the first tool call needs them
+    threading.Thread(target=_warm_up, name="notion-warm-up", daemon=True).start()
+    
     # Run the server
     mcp.run(transport="stdio")
 
@@ -0,0 +1,132 @@
+"""
+TTL cache module for Notion object metadata.
+Keeps recently retrieved databases and pages in a bounded in-memory LRU whose
+entries expire after a fixed time, so repeated lookups skip the API.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Seconds a retrieved object is served from the cache
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_ENTRIES = 256
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire a fixed time after they were stored.
+    Values are deep-copied on the way in and out, so callers may modify
+    what they put or get without affecting the cached entry.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the TTLCache.
+
+        Args:
+            ttl: Seconds an entry stays valid (0 disables caching)
+            max_entries: Maximum number of entries; the least recently used is evicted
+            clock: Monotonic time source in seconds, injectable for tests
+        """
+        if ttl < 0 or max_entries < 1:
+            raise ValueError("ttl must not be negative and max_entries must be positive")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        # key -> (expiry time, value)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a value that has not expired yet.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            A copy of the cached value, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Cache a value for ttl seconds, replacing any earlier value of the key.
+
+        Args:
+            key: Cache key
+            value: Value to cache (None is not cached, since get returns None on a miss)
+        """
+        if self.ttl == 0 or value is None:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Drop one entry, e.g. after the object it describes was changed.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was dropped
+        """
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters and current usage.
+
+        Returns:
+            Dict with hits, misses, expirations, evictions and entries
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
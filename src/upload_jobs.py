@@ -0,0 +1,250 @@
+"""
+Background upload jobs module.
+Runs uploads on a bounded worker pool and tracks their progress, so a caller
+can get a job ID back at once and poll for the result.
+"""
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Jobs running at the same time; later jobs wait in the queue
+DEFAULT_MAX_WORKERS = 2
+# Finished jobs kept for status queries before the oldest are forgotten
+DEFAULT_MAX_FINISHED = 100
+
+
+class UploadJob:
+    """
+    State and progress of one background upload.
+    Progress is reported from the worker thread through plan() and record()
+    and read from any thread through snapshot().
+    """
+
+    def __init__(self, description: str, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the UploadJob.
+
+        Args:
+            description: Human readable summary of what is uploaded
+            clock: Monotonic clock, injectable for tests
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.description = description
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.status = QUEUED
+        self.calls_total: Optional[int] = None
+        self.blocks_total: Optional[int] = None
+        self.calls_done = 0
+        self.blocks_sent = 0
+        self.page_id: Optional[str] = None
+        self.error: Optional[str] = None
+        self.created_at = clock()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def plan(self, calls: int, blocks: int) -> None:
+        """
+        Set the expected totals (see NotionUploader.plan_upload).
+
+        Args:
+            calls: API calls the upload will make
+            blocks: Blocks the upload will send
+        """
+        with self._lock:
+            self.calls_total = calls
+            self.blocks_total = blocks
+
+    def record(self, blocks: int) -> None:
+        """
+        Record one confirmed API call (usable as the uploader's progress callback).
+
+        Args:
+            blocks: Number of blocks the call added
+        """
+        with self._lock:
+            self.calls_done += 1
+            self.blocks_sent += blocks
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a consistent copy of the job state.
+
+        Returns:
+            Dictionary with the job fields plus "chunks_remaining" (None until
+            planned), "elapsed" (seconds running) and "blocks_per_second"
+        """
+        with self._lock:
+            end = self.finished_at if self.finished_at is not None else self._clock()
+            elapsed = end - self.started_at if self.started_at is not None else 0.0
+            remaining = None
+            if self.calls_total is not None:
+                remaining = max(0, self.calls_total - self.calls_done)
+            return {
+                "id": self.id,
+                "description": self.description,
+                "status": self.status,
+                "blocks_sent": self.blocks_sent,
+                "blocks_total": self.blocks_total,
+                "calls_done": self.calls_done,
+                "calls_total": self.calls_total,
+                "chunks_remaining": remaining,
+                "elapsed": elapsed,
+                "blocks_per_second": self.blocks_sent / elapsed if elapsed > 0 else 0.0,
+                "page_id": self.page_id,
+                "error": self.error,
+            }
+
+    def _set_status(self, status: str, page_id: Optional[str] = None, error: Optional[str] = None) -> None:
+        """Move the job to a new status, stamping start and finish times."""
+        with self._lock:
+            self.status = status
+            if status == RUNNING:
+                self.started_at = self._clock()
+            else:
+                self.finished_at = self._clock()
+                self.page_id = page_id
+                self.error = error
+
+
+class UploadJobManager:
+    """
+    Thread-safe registry of background uploads running on a bounded pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_finished: int = DEFAULT_MAX_FINISHED,
+        slots: Optional[threading.BoundedSemaphore] = None
+    ):
+        """
+        Initialize the UploadJobManager.
+
+        Args:
+            max_workers: Maximum number of jobs running at the same time
+            max_finished: Number of finished jobs kept for status queries
+            slots: Semaphore a job holds while it runs, shared with other
+                uploads of the process (defaults to one of max_workers slots)
+        """
+        self.max_finished = max_finished
+        self._slots = slots or threading.BoundedSemaphore(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="notion-job")
+        self._jobs: Dict[str, UploadJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, description: str, run: Callable[[UploadJob], str]) -> UploadJob:
+        """
+        Queue an upload.
+
+        Args:
+            description: Human readable summary of what is uploaded
+            run: Performs the upload and returns the page ID; receives the job
+                to report its plan and progress
+
+        Returns:
+            The queued job
+        """
+        job = UploadJob(description)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, run)
+        return job
+
+    def get(self, job_id: str) -> Optional[UploadJob]:
+        """
+        Look up a job by ID.
+
+        Returns:
+            The job, or None if it is unknown or was forgotten
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[UploadJob]:
+        """
+        Get all known jobs.
+
+        Returns:
+            Jobs in submission order
+        """
+        with self._lock:
+            return list(self._jobs.values())
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs, optionally waiting for queued and running ones."""
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: UploadJob, run: Callable[[UploadJob], str]) -> None:
+        """Execute a job on a worker thread once an upload slot is free, and record its outcome."""
+        with self._slots:
+            job._set_status(RUNNING)
+            try:
+                page_id = run(job)
+            except Exception as e:
+                job._set_status(FAILED, error=str(e) or type(e).__name__)
+            else:
+                job._set_status(SUCCEEDED, page_id=page_id)
+        self._forget_old_jobs()
+
+    def _forget_old_jobs(self) -> None:
+        """Drop the oldest finished jobs beyond max_finished."""
+        with self._lock:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+            for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+                del self._jobs[job_id]
+
+
+_default_manager: Optional[UploadJobManager] = None
+_upload_slots: Optional[threading.BoundedSemaphore] = None
+_default_manager_lock = threading.Lock()
+
+
+def _max_concurrent_uploads() -> int:
+    """Read NOTION_MAX_CONCURRENT_UPLOADS (at least 1)."""
+    return max(1, int(os.getenv("NOTION_MAX_CONCURRENT_UPLOADS", DEFAULT_MAX_WORKERS)))
+
+
+def get_upload_slots() -> threading.BoundedSemaphore:
+    """
+    Get the process-wide limit on uploads running at once.
+    Background jobs and foreground tool uploads both hold a slot while they
+    upload, so together they stay within NOTION_MAX_CONCURRENT_UPLOADS.
+
+    Returns:
+        The shared BoundedSemaphore
+    """
+    global _upload_slots
+    with _default_manager_lock:
+        if _upload_slots is None:
+            _upload_slots = threading.BoundedSemaphore(_max_concurrent_uploads())
+        return _upload_slots
+
+
+def get_default_job_manager() -> UploadJobManager:
+    """
+    Get the process-wide UploadJobManager.
+    Its jobs take their slots from get_upload_slots().
+
+    Returns:
+        The shared UploadJobManager instance
+    """
+    global _default_manager
+    slots = get_upload_slots()
+    with _default_manager_lock:
+        if _default_manager is None:
+            _default_manager = UploadJobManager(max_workers=_max_concurrent_uploads(), slots=slots)
+        return _default_manager
@@ -0,0 +1,118 @@
+"""
+Upload journal module for resuming interrupted uploads.
+Persists, per source file, the page being filled and how many of its blocks
+the API has confirmed, in a local append-only JSON Lines file.
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from .jsonl_store import JsonlStore
+except ImportError:
+    from jsonl_store import JsonlStore
+
+
+class UploadJournal:
+    """
+    Local checkpoints of uploads in progress.
+    A checkpoint is appended as one JSON line after every confirmed request, so
+    a crash loses at most the request in flight; later lines supersede earlier
+    ones and finished uploads are removed with a tombstone line.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the UploadJournal, loading existing checkpoints if present.
+
+        Args:
+            path: Location of the journal file (created on first checkpoint)
+        """
+        # Each line is flushed to disk before the next request is sent
+        self._store = JsonlStore(path, fsync=True)
+        self.path = self._store.path
+
+    @staticmethod
+    def _source_key(filepath: str) -> str:
+        """Normalize a source path into the journal key."""
+        return str(Path(filepath).resolve())
+
+    def lookup(
+        self,
+        filepath: str,
+        content_hash: str,
+        processor_version: str,
+        target: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the checkpoint of an unfinished upload of an identical file.
+
+        Args:
+            filepath: Path to the source file
+            content_hash: Current content hash of the file
+            processor_version: Current MarkdownProcessor version
+            target: Upload target key (see UploadManifest.target_key)
+
+        Returns:
+            A copy of the checkpoint with the keys "page_id", "blocks_done" and
+            "tail_block_id", or None if there is nothing to resume
+        """
+        entry = self._store.get(self._source_key(filepath))
+        if (entry
+                and entry.get("hash") == content_hash
+                and entry.get("processor_version") == processor_version
+                and entry.get("target") == target):
+            return entry
+        return None
+
+    def checkpoint(
+        self,
+        filepath: str,
+        content_hash: str,
+        processor_version: str,
+        target: str,
+        page_id: str,
+        blocks_done: int,
+        tail_block_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Record that the first blocks_done top-level blocks of a file are on its page.
+
+        Args:
+            filepath: Path to the source file
+            content_hash: Content hash of the file being uploaded
+            processor_version: MarkdownProcessor version used for parsing
+            target: Upload target key (see UploadManifest.target_key)
+            page_id: ID of the page being filled
+            blocks_done: Number of confirmed top-level blocks (after normalization)
+            tail_block_id: ID of the last confirmed block (None if only the
+                pages.create request has been confirmed, which returns no block IDs)
+
+        Returns:
+            The recorded checkpoint
+        """
+        entry = {
+            "source": self._source_key(filepath),
+            "hash": content_hash,
+            "processor_version": processor_version,
+            "target": target,
+            "page_id": page_id,
+            "blocks_done": blocks_done,
+            "tail_block_id": tail_block_id,
+            "updated_at": time.time(),
+        }
+        self._store.put(entry)
+        return dict(entry)
+
+    def finish(self, filepath: str) -> None:
+        """
+        Remove the checkpoint of a completed upload.
+
+        Args:
+            filepath: Path to the source file
+        """
+        self._store.remove(self._source_key(filepath))
+
+    def __len__(self) -> int:
+        return len(self._store)
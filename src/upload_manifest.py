@@ -0,0 +1,138 @@
+"""
+Upload manifest module for skipping unchanged files on re-upload.
+Persists, per source file, the content hash, parser version, upload target
+and resulting Notion page ID in a local append-only JSON Lines file.
+"""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from .jsonl_store import JsonlStore
+except ImportError:
+    from jsonl_store import JsonlStore
+
+# Read files in 1 MiB pieces so hashing large exports stays cheap on memory
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+class UploadManifest:
+    """
+    Local record of previously uploaded files.
+    Each record is appended as one JSON line, so recording an upload costs
+    O(1) regardless of the manifest size; later lines supersede earlier ones.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the UploadManifest, loading existing records if present.
+
+        Args:
+            path: Location of the manifest file (created on first record)
+        """
+        self._store = JsonlStore(path)
+        self.path = self._store.path
+
+    @staticmethod
+    def hash_file(filepath: str) -> str:
+        """
+        Compute the SHA-256 hash of a file without reading it into memory at once.
+
+        Args:
+            filepath: Path to the file
+
+        Returns:
+            Hex digest of the file content
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def target_key(database_id: Optional[str] = None, parent_page_id: Optional[str] = None) -> str:
+        """Describe an upload target so moving a file to another parent re-uploads it."""
+        if database_id:
+            return f"database:{database_id}"
+        return f"page:{parent_page_id}"
+
+    @staticmethod
+    def _source_key(filepath: str) -> str:
+        """Normalize a source path into the manifest key."""
+        return str(Path(filepath).resolve())
+
+    def lookup(
+        self,
+        filepath: str,
+        content_hash: str,
+        processor_version: str,
+        target: str
+    ) -> Optional[str]:
+        """
+        Find the page previously created from an identical file.
+
+        Args:
+            filepath: Path to the source file
+            content_hash: Current content hash of the file
+            processor_version: Current MarkdownProcessor version
+            target: Upload target key (see target_key)
+
+        Returns:
+            The stored page ID if nothing changed, otherwise None
+        """
+        entry = self._store.get(self._source_key(filepath))
+        if (entry
+                and entry.get("hash") == content_hash
+                and entry.get("processor_version") == processor_version
+                and entry.get("target") == target):
+            return entry.get("page_id")
+        return None
+
+    def get(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored record for a file.
+
+        Args:
+            filepath: Path to the source file
+
+        Returns:
+            A copy of the record, or None if the file was never recorded
+        """
+        return self._store.get(self._source_key(filepath))
+
+    def record(
+        self,
+        filepath: str,
+        content_hash: str,
+        processor_version: str,
+        target: str,
+        page_id: str
+    ) -> None:
+        """
+        Record a successful upload and persist it immediately.
+
+        Args:
+            filepath: Path to the source file
+            content_hash: Content hash of the uploaded file
+            processor_version: MarkdownProcessor version used for parsing
+            target: Upload target key (see target_key)
+            page_id: ID of the created Notion page
+        """
+        entry = {
+            "source": self._source_key(filepath),
+            "hash": content_hash,
+            "processor_version": processor_version,
+            "target": target,
+            "page_id": page_id,
+            "uploaded_at": time.time(),
+        }
+        self._store.put(entry)
+
+    def __len__(self) -> int:
+        return len(self._store)
@@ -0,0 +1 @@
+"""Benchmarks for Markdown2Notion (run explicitly, not part of the unit test suite)."""
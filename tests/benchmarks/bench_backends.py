@@ -0,0 +1,148 @@
+"""
+Parser backend comparison.
+Measures throughput (MB/s, blocks/s) and fidelity of every registered parser
+backend on the same seeded synthetic corpora, so the cost of richer parsing
+can be weighed against what it preserves.
+
+Usage (from the repository root):
+    python tests/benchmarks/bench_backends.py                       # 1MB of every corpus
+    python tests/benchmarks/bench_backends.py --sizes 50MB --corpora formatted,mixed
+
+Fidelity is reported as counts over the produced blocks:
+    blocks      top-level blocks
+    nested      blocks nested as children (list items, quote paragraphs, table rows)
+    formatted   rich text runs carrying annotations or a link
+    leaked      Markdown markup left as literal text outside code blocks
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from markdown_processor import LINE_BACKEND, MarkdownProcessor, available_backends
+
+try:
+    from .bench_parser import _time_call
+    from .corpus import CORPORA, SIZES, MB, generate
+except ImportError:
+    from bench_parser import _time_call
+    from corpus import CORPORA, SIZES, MB, generate
+
+DEFAULT_SIZES = ("1MB",)
+
+# Markup that only survives as text if the parser did not understand it
+_LEAKED_MARKUP = re.compile(r"\*\*|~~|`|\]\(|^\s*\|.*\|\s*$|^\s*(?:[-*+]|\d+\.)\s")
+
+
+def _walk(blocks: List[Dict[str, Any]], depth: int = 0) -> Iterator[tuple]:
+    """Yield (depth, block) for every block and nested block."""
+    for block in blocks:
+        yield depth, block
+        body = block.get(block["type"], {})
+        yield from _walk(body.get("children", []), depth + 1)
+
+
+def fidelity(blocks: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Count what a backend preserved of the Markdown structure.
+
+    Args:
+        blocks: Notion block dicts produced by parse_markdown_to_blocks
+
+    Returns:
+        "blocks", "nested", "formatted" and "leaked" counts
+    """
+    counts = {"blocks": len(blocks), "nested": 0, "formatted": 0, "leaked": 0}
+    for depth, block in _walk(blocks):
+        if depth:
+            counts["nested"] += 1
+        body = block.get(block["type"], {})
+        runs = list(body.get("rich_text", []))
+        if block["type"] == "table_row":
+            runs = [run for cell in body["cells"] for run in cell]
+        for run in runs:
+            if run.get("annotations") or run["text"].get("link"):
+                counts["formatted"] += 1
+            elif block["type"] != "code" and _LEAKED_MARKUP.search(run["text"]["content"]):
+                counts["leaked"] += 1
+    return counts
+
+
+def run_benchmarks(
+    sizes: List[str],
+    corpora: List[str],
+    backends: Optional[List[str]] = None,
+    budget: float = 1.0
+) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark parse_markdown_to_blocks with every backend on every corpus and size.
+
+    Args:
+        sizes: Size labels from corpus.SIZES
+        corpora: Corpus names from corpus.CORPORA
+        backends: Backend names (defaults to every available backend)
+        budget: Approximate seconds spent per measurement
+
+    Returns:
+        Results keyed "<backend>/<corpus>/<size>"
+    """
+    processor = MarkdownProcessor()
+    results: Dict[str, Dict[str, float]] = {}
+    for size_label in sizes:
+        for kind in corpora:
+            content = generate(kind, SIZES[size_label])
+            megabytes = len(content.encode("utf-8")) / MB
+            for backend in backends or available_backends():
+                blocks, _ = processor.parse_markdown_to_blocks(content, backend=backend)
+                seconds = _time_call(
+                    lambda content=content, backend=backend: processor.parse_markdown_to_blocks(content, backend=backend),
+                    budget
+                )
+                result: Dict[str, float] = {
+                    "seconds": seconds,
+                    "mb_per_s": megabytes / seconds,
+                    "blocks_per_s": len(blocks) / seconds,
+                }
+                result.update(fidelity(blocks))
+                results[f"{backend}/{kind}/{size_label}"] = result
+    return results
+
+
+def _print_table(results: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'case':32s} {'MB/s':>8s} {'blocks/s':>12s} {'blocks':>8s} {'nested':>8s} {'formatted':>10s} {'leaked':>8s}")
+    for key, result in results.items():
+        print(
+            f"{key:32s} {result['mb_per_s']:8.2f} {result['blocks_per_s']:12,.0f} {result['blocks']:8d} "
+            f"{result['nested']:8d} {result['formatted']:10d} {result['leaked']:8d}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES),
+                        help=f"comma-separated sizes out of {', '.join(SIZES)}")
+    parser.add_argument("--corpora", default=",".join(CORPORA),
+                        help=f"comma-separated corpora out of {', '.join(CORPORA)}")
+    parser.add_argument("--backends", default=None,
+                        help=f"comma-separated backends (default: {LINE_BACKEND} and every registered one)")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="approximate seconds per measurement")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.sizes.split(","),
+        args.corpora.split(","),
+        args.backends.split(",") if args.backends else None,
+        budget=args.budget
+    )
+    _print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
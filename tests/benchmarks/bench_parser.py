@@ -0,0 +1,269 @@
+"""
+Parser benchmark with a regression gate.
+Measures blocks/s, MB/s and peak memory of MarkdownProcessor.parse_markdown_to_blocks
+and process_file on seeded synthetic corpora, and compares them with a stored baseline.
+
+Usage (from the repository root):
+    python tests/benchmarks/bench_parser.py                    # 1KB and 1MB, compare to baseline
+    python tests/benchmarks/bench_parser.py --sizes 50MB       # large documents only
+    python tests/benchmarks/bench_parser.py --update-baseline  # record new baseline numbers
+
+Throughput baselines are scaled by a CPU calibration run, so a baseline
+recorded on one machine remains meaningful on a faster or slower one.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from markdown_processor import MarkdownProcessor
+
+try:
+    from .corpus import CORPORA, SIZES, MB, generate
+except ImportError:
+    from corpus import CORPORA, SIZES, MB, generate
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+DEFAULT_SIZES = ("1KB", "1MB")
+DEFAULT_TOLERANCE = 0.30
+# Peak memory of tiny documents is dominated by interpreter noise
+_MEMORY_SLACK_MB = 1.0
+
+
+def calibrate() -> float:
+    """
+    Time a fixed pure-Python workload resembling the parser's inner loop.
+
+    Returns:
+        Best-of-5 seconds for the workload (lower means a faster machine)
+    """
+    lines = [f"- item {i} with some words" for i in range(100000)]
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        out = []
+        for line in lines:
+            stripped = line.rstrip()
+            if stripped.startswith("- "):
+                out.append({"type": "bulleted_list_item", "text": stripped[2:]})
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _time_call(func: Callable[[], Any], budget: float) -> float:
+    """Best time of one call, repeating small calls until the budget is used."""
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    best = elapsed
+
+    # Repeat until roughly budget seconds are spent (at least once more, at most 1000 times)
+    repeats = min(1000, max(1, int(budget / max(elapsed, 1e-6))))
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory_mb(func: Callable[[], Any]) -> float:
+    """Peak traced allocation of one call, in MB."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / MB
+
+
+def run_benchmarks(
+    sizes: List[str],
+    corpora: List[str],
+    budget: float = 1.0,
+    measure_memory: bool = True
+) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark parse_markdown_to_blocks and process_file on every corpus and size.
+
+    Args:
+        sizes: Size labels from corpus.SIZES
+        corpora: Corpus names from corpus.CORPORA
+        budget: Approximate seconds spent per measurement
+        measure_memory: Also run each case under tracemalloc
+
+    Returns:
+        Results keyed "<function>/<corpus>/<size>"
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    processor = MarkdownProcessor()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size_label in sizes:
+            for kind in corpora:
+                content = generate(kind, SIZES[size_label])
+                filepath = os.path.join(tmpdir, f"{kind}-{size_label}.md")
+                with open(filepath, "w", encoding="utf-8") as f:
+                    f.write(content)
+
+                megabytes = len(content.encode("utf-8")) / MB
+                block_count = len(processor.parse_markdown_to_blocks(content)[0])
+                cases = {
+                    "parse_markdown_to_blocks": lambda content=content: processor.parse_markdown_to_blocks(content),
+                    "process_file": lambda filepath=filepath: processor.process_file(filepath),
+                }
+
+                for name, func in cases.items():
+                    seconds = _time_call(func, budget)
+                    result = {
+                        "seconds": seconds,
+                        "blocks": block_count,
+                        "blocks_per_s": block_count / seconds,
+                        "mb_per_s": megabytes / seconds,
+                    }
+                    if measure_memory:
+                        result["peak_mb"] = _peak_memory_mb(func)
+                    results[f"{name}/{kind}/{size_label}"] = result
+
+    return results
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    calibration: float,
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[str]:
+    """
+    Compare results with a baseline.
+
+    Args:
+        results: Output of run_benchmarks
+        calibration: Output of calibrate() on this machine
+        baseline: Parsed baseline.json
+        tolerance: Allowed relative slowdown or memory growth
+
+    Returns:
+        Human-readable descriptions of every regression (empty if none)
+    """
+    # A machine twice as slow as the baseline machine is expected to reach half the throughput
+    speed_factor = baseline["calibration"] / calibration
+    regressions = []
+    for key, result in results.items():
+        expected = baseline["results"].get(key)
+        if expected is None:
+            continue
+
+        min_throughput = expected["mb_per_s"] * speed_factor * (1 - tolerance)
+        if result["mb_per_s"] < min_throughput:
+            regressions.append(
+                f"{key}: {result['mb_per_s']:.2f} MB/s < {min_throughput:.2f} MB/s "
+                f"(baseline {expected['mb_per_s']:.2f} MB/s scaled by {speed_factor:.2f})"
+            )
+
+        if "peak_mb" in result and "peak_mb" in expected:
+            max_peak = expected["peak_mb"] * (1 + tolerance) + _MEMORY_SLACK_MB
+            if result["peak_mb"] > max_peak:
+                regressions.append(
+                    f"{key}: peak {result['peak_mb']:.1f} MB > {max_peak:.1f} MB "
+                    f"(baseline {expected['peak_mb']:.1f} MB)"
+                )
+    return regressions
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[Dict[str, Any]]:
+    """Load the stored baseline, or None if it does not exist yet."""
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(
+    results: Dict[str, Dict[str, float]],
+    calibration: float,
+    path: Path = BASELINE_PATH
+) -> None:
+    """Merge results into the stored baseline (other sizes and corpora are kept)."""
+    baseline = load_baseline(path) or {"results": {}}
+    if baseline.get("calibration"):
+        # Rescale kept entries so every throughput refers to the new calibration
+        factor = baseline["calibration"] / calibration
+        for entry in baseline["results"].values():
+            for key in ("blocks_per_s", "mb_per_s"):
+                entry[key] *= factor
+    baseline.update({
+        "calibration": calibration,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    })
+    baseline["results"].update(results)
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def _print_table(results: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'case':55s} {'blocks/s':>12s} {'MB/s':>8s} {'peak MB':>9s}")
+    for key, result in results.items():
+        peak = f"{result['peak_mb']:9.1f}" if "peak_mb" in result else f"{'-':>9s}"
+        print(f"{key:55s} {result['blocks_per_s']:12,.0f} {result['mb_per_s']:8.2f} {peak}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES),
+                        help=f"comma-separated sizes out of {', '.join(SIZES)}")
+    parser.add_argument("--corpora", default=",".join(CORPORA),
+                        help=f"comma-separated corpora out of {', '.join(CORPORA)}")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="approximate seconds per measurement")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative regression before failing")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc runs")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store the results as the new baseline instead of comparing")
+    args = parser.parse_args(argv)
+
+    calibration = calibrate()
+    results = run_benchmarks(
+        args.sizes.split(","),
+        args.corpora.split(","),
+        budget=args.budget,
+        measure_memory=not args.no_memory
+    )
+    _print_table(results)
+    print(f"calibration: {calibration * 1000:.1f} ms")
+
+    if args.update_baseline:
+        save_baseline(results, calibration)
+        print(f"baseline updated: {BASELINE_PATH}")
+        return 0
+
+    baseline = load_baseline()
+    if baseline is None:
+        print("no baseline stored; run with --update-baseline first")
+        return 0
+
+    regressions = find_regressions(results, calibration, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""
+Startup benchmark tracked per release.
+Measures import time of the package entry points with `python -X importtime`
+and the time until a freshly started MCP server answers `initialize`, and
+compares them with the numbers stored for the latest recorded release.
+
+Usage (from the repository root):
+    python tests/benchmarks/bench_startup.py           # compare to the stored release numbers
+    python tests/benchmarks/bench_startup.py --record  # store the numbers for the current version
+    python tests/benchmarks/bench_startup.py --history # print the numbers of every recorded release
+
+Each measurement runs in a fresh interpreter; the best of several runs is
+kept. Times are scaled by the parser benchmark's CPU calibration.
+"""
+
+import argparse
+import json
+import os
+import platform
+import select
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BASELINE_PATH = Path(__file__).parent / "startup_baseline.json"
+
+# Add src directory to path for imports
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+try:
+    from .bench_parser import calibrate
+except ImportError:
+    from bench_parser import calibrate
+
+# Case name -> module imported in a fresh interpreter (from the repository root)
+IMPORT_CASES = {
+    "import src": "src",
+    "import src.markdown_processor": "src.markdown_processor",
+    "import src.notion_uploader": "src.notion_uploader",
+    "import src.server": "src.server",
+}
+READINESS_CASE = "server readiness"
+
+# Dependencies that parse-only imports must not load
+HEAVY_MODULES = ("fastmcp", "mcp", "notion_client", "dotenv", "httpx")
+
+DEFAULT_RUNS = 5
+# Startup times are noisy; allow this relative slowdown plus a fixed slack
+DEFAULT_TOLERANCE = 0.50
+_SLACK_MS = 20.0
+
+# Written to stderr right before the measured import, to skip interpreter startup lines
+_MARKER = "--- bench_startup ---"
+
+_INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "bench_startup", "version": "0"},
+    },
+}
+
+
+def parse_importtime(stderr: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Parse `-X importtime` output written after the marker line.
+
+    Args:
+        stderr: Standard error of the measured interpreter
+
+    Returns:
+        Total import time in ms (sum of the top-level imports' cumulative
+        times) and (module, self ms) pairs, slowest first
+    """
+    lines = stderr.split(_MARKER, 1)[-1].splitlines()
+    total_us = 0
+    modules = []
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented by two spaces per level
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative_us)
+        modules.append((name.strip(), int(self_us) / 1000))
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return total_us / 1000, modules
+
+
+def measure_import(module: str, runs: int = DEFAULT_RUNS) -> Dict[str, Any]:
+    """
+    Measure importing one module in fresh interpreters.
+
+    Args:
+        module: Dotted module name, imported from the repository root
+        runs: Number of interpreters started; the fastest run is kept
+
+    Returns:
+        "ms" (import time), "slowest" (top 5 modules by self time) and
+        "heavy" (HEAVY_MODULES the import loaded)
+    """
+    code = (
+        f"import sys; sys.stderr.write({_MARKER!r} + '\\n'); import {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    best: Optional[Dict[str, Any]] = None
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+        total, modules = parse_importtime(completed.stderr)
+        if best is None or total < best["ms"]:
+            best = {
+                "ms": total,
+                "slowest": modules[:5],
+                "heavy": [name for name in completed.stdout.strip().split(",") if name],
+            }
+    return best
+
+
+def measure_readiness(runs: int = DEFAULT_RUNS, timeout: float = 30.0) -> Dict[str, Any]:
+    """
+    Measure the time from starting src/server.py to its `initialize` response.
+
+    Args:
+        runs: Number of servers started; the fastest run is kept
+        timeout: Seconds to wait for one response
+
+    Returns:
+        "ms" (time until the response line arrived)
+    """
+    env = dict(os.environ, NOTION_TOKEN=os.getenv("NOTION_TOKEN", "bench-token"))
+    request = (json.dumps(_INITIALIZE) + "\n").encode()
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, str(REPO_ROOT / "src" / "server.py")],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env
+        )
+        try:
+            process.stdin.write(request)
+            process.stdin.flush()
+            ready, _, _ = select.select([process.stdout], [], [], timeout)
+            if not ready or not process.stdout.readline():
+                raise RuntimeError("server did not answer initialize")
+            best = min(best, (time.perf_counter() - start) * 1000)
+        finally:
+            process.kill()
+            process.wait()
+    return {"ms": best}
+
+
+def run_benchmarks(runs: int = DEFAULT_RUNS, readiness: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Run every import case and, optionally, the server readiness case.
+
+    Returns:
+        Results keyed by case name
+    """
+    results = {case: measure_import(module, runs) for case, module in IMPORT_CASES.items()}
+    if readiness:
+        results[READINESS_CASE] = measure_readiness(runs)
+    return results
+
+
+def _version_key(version: str) -> Tuple[int, ...]:
+    return tuple(int(part) if part.isdigit() else 0 for part in version.split("."))
+
+
+def current_version() -> str:
+    """Version of the package in this tree."""
+    sys.path.insert(0, str(REPO_ROOT))
+    import src
+    return src.__version__
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Any]],
+    calibration: float,
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[str]:
+    """
+    Compare results with the latest recorded release.
+
+    Args:
+        results: Output of run_benchmarks
+        calibration: Output of calibrate() on this machine
+        baseline: Parsed startup_baseline.json
+        tolerance: Allowed relative slowdown
+
+    Returns:
+        Human-readable descriptions of every regression (empty if none)
+    """
+    if not baseline.get("releases"):
+        return []
+    version = max(baseline["releases"], key=_version_key)
+    release = baseline["releases"][version]
+    # A machine twice as slow as the baseline machine is expected to take twice as long
+    speed_factor = calibration / release["calibration"]
+    regressions = []
+    for case, result in results.items():
+        expected = release["results"].get(case)
+        if expected is None:
+            continue
+        limit = expected["ms"] * speed_factor * (1 + tolerance) + _SLACK_MS
+        if result["ms"] > limit:
+            regressions.append(
+                f"{case}: {result['ms']:.1f} ms > {limit:.1f} ms "
+                f"({version}: {expected['ms']:.1f} ms scaled by {speed_factor:.2f})"
+            )
+        if case == "import src.markdown_processor" and result.get("heavy"):
+            regressions.append(f"{case}: loads {', '.join(result['heavy'])}")
+    return regressions
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Optional[Dict[str, Any]]:
+    """Load the stored release numbers, or None if none are stored yet."""
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_release(
+    results: Dict[str, Dict[str, Any]],
+    calibration: float,
+    version: str,
+    path: Path = BASELINE_PATH
+) -> None:
+    """Store the results for a release (replacing earlier numbers of that version)."""
+    baseline = load_baseline(path) or {"releases": {}}
+    baseline["releases"][version] = {
+        "calibration": calibration,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {case: {"ms": result["ms"]} for case, result in results.items()},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def _print_table(results: Dict[str, Dict[str, Any]]) -> None:
+    print(f"{'case':32s} {'ms':>9s}  slowest imports (self ms)")
+    for case, result in results.items():
+        slowest = ", ".join(f"{name} {ms:.1f}" for name, ms in result.get("slowest", [])[:3])
+        print(f"{case:32s} {result['ms']:9.1f}  {slowest}")
+        if result.get("heavy"):
+            print(f"{'':32s} {'':9s}  loads {', '.join(result['heavy'])}")
+
+
+def _print_history(baseline: Dict[str, Any]) -> None:
+    versions = sorted(baseline["releases"], key=_version_key)
+    cases = list(IMPORT_CASES) + [READINESS_CASE]
+    print(f"{'case':32s}" + "".join(f" {version:>10s}" for version in versions))
+    for case in cases:
+        cells = []
+        for version in versions:
+            entry = baseline["releases"][version]["results"].get(case)
+            cells.append(f" {entry['ms']:10.1f}" if entry else f" {'-':>10s}")
+        print(f"{case:32s}" + "".join(cells))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="fresh interpreters per case")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative regression before failing")
+    parser.add_argument("--no-readiness", action="store_true", help="skip starting the MCP server")
+    parser.add_argument("--record", action="store_true",
+                        help="store the results for the current version instead of comparing")
+    parser.add_argument("--history", action="store_true", help="print the stored numbers of every release")
+    args = parser.parse_args(argv)
+
+    if args.history:
+        baseline = load_baseline()
+        if baseline is None:
+            print("no releases recorded; run with --record first")
+        else:
+            _print_history(baseline)
+        return 0
+
+    calibration = calibrate()
+    results = run_benchmarks(args.runs, readiness=not args.no_readiness)
+    _print_table(results)
+    print(f"calibration: {calibration * 1000:.1f} ms")
+
+    if args.record:
+        version = current_version()
+        save_release(results, calibration, version)
+        print(f"recorded {version}: {BASELINE_PATH}")
+        return 0
+
+    baseline = load_baseline()
+    if baseline is None:
+        print("no releases recorded; run with --record first")
+        return 0
+
+    regressions = find_regressions(results, calibration, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
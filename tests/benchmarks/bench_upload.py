@@ -0,0 +1,170 @@
+"""
+End-to-end upload benchmark against the in-process fake Notion API.
+Uploads a directory of synthetic documents with NotionUploader.upload_directory
+and reports pages/min, API calls per document and rate-limit behaviour,
+without any network access.
+
+Usage (from the repository root):
+    python tests/benchmarks/bench_upload.py
+    python tests/benchmarks/bench_upload.py --docs 50 --size 64KB --latency 0.2 --server-rate 3
+    python tests/benchmarks/bench_upload.py --error-rate 0.05 --client-rate 10
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from notion_client import Client
+
+from notion_uploader import NotionUploader
+from rate_limiter import RateLimiter
+
+try:
+    from .corpus import CORPORA, KB, MB, generate
+    from .fake_notion import FakeNotionServer
+except ImportError:
+    from corpus import CORPORA, KB, MB, generate
+    from fake_notion import FakeNotionServer
+
+
+def parse_size(value: str) -> int:
+    """Parse sizes such as "16KB" or "2MB" into characters."""
+    value = value.strip().upper()
+    for suffix, factor in (("MB", MB), ("KB", KB)):
+        if value.endswith(suffix):
+            return int(float(value[:-len(suffix)]) * factor)
+    return int(value)
+
+
+def run_upload_benchmark(
+    docs: int = 10,
+    size: int = 16 * KB,
+    kind: str = "mixed",
+    latency: float = 0.05,
+    server_rate: Optional[float] = 3.0,
+    client_rate: float = 3.0,
+    workers: int = 4,
+    error_rate: float = 0.0,
+    enforce_limits: bool = True
+) -> Dict[str, Any]:
+    """
+    Upload synthetic documents to a fake Notion server and measure the run.
+
+    Args:
+        docs: Number of documents (one page each)
+        size: Size of each document in characters
+        kind: Corpus name from corpus.CORPORA
+        latency: Fake server latency per request in seconds
+        server_rate: Requests per second the fake server accepts (None = unlimited)
+        client_rate: Requests per second allowed by the uploader's rate limiter
+        workers: upload_directory max_workers
+        error_rate: Fraction of requests the fake server fails with a 5xx error
+        enforce_limits: Let the fake server reject payloads over Notion's limits
+
+    Returns:
+        Dict of measurements and the fake server's traffic stats
+    """
+    with tempfile.TemporaryDirectory() as tmpdir, FakeNotionServer(
+        latency=latency,
+        jitter=latency / 2,
+        rate_limit=server_rate,
+        error_rate=error_rate,
+        enforce_limits=enforce_limits
+    ) as server:
+        for i in range(docs):
+            with open(os.path.join(tmpdir, f"doc-{i:04d}.md"), "w", encoding="utf-8") as f:
+                f.write(generate(kind, size, seed=i))
+
+        uploader = NotionUploader(
+            token="fake-token",
+            rate_limiter=RateLimiter(rate=client_rate, burst=max(1, int(client_rate)))
+        )
+        # Expected 429/400 responses are counted in the stats; keep per-request warnings quiet
+        uploader.client = Client(auth="fake-token", base_url=server.base_url, retry=False, log_level=logging.ERROR)
+
+        start = time.perf_counter()
+        results = uploader.upload_directory(
+            tmpdir,
+            parent_page_id="00000000-0000-0000-0000-000000000000",
+            max_workers=workers
+        )
+        elapsed = time.perf_counter() - start
+
+        stats = server.stats()
+        uploaded = sum(1 for result in results if result["status"] == "uploaded")
+        errors: Dict[str, int] = {}
+        for result in results:
+            if result["error"]:
+                message = result["error"].split(":")[0][:80]
+                errors[message] = errors.get(message, 0) + 1
+
+        return {
+            "docs": docs,
+            "uploaded": uploaded,
+            "failed": docs - uploaded,
+            "seconds": elapsed,
+            "pages_per_min": uploaded / elapsed * 60 if elapsed else 0.0,
+            "api_calls": stats["requests"],
+            "api_calls_per_doc": stats["requests"] / docs if docs else 0.0,
+            "rate_limited": stats["rate_limited"],
+            "bytes_per_doc": stats["bytes_received"] / docs if docs else 0.0,
+            "routes": stats["routes"],
+            "statuses": stats["statuses"],
+            "errors": errors,
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=10, help="number of documents")
+    parser.add_argument("--size", default="16KB", help="size of each document, e.g. 16KB or 1MB")
+    parser.add_argument("--kind", default="mixed", choices=sorted(CORPORA), help="corpus to generate")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake server latency in seconds")
+    parser.add_argument("--server-rate", type=float, default=3.0,
+                        help="requests/s accepted by the fake server before 429 (0 = unlimited)")
+    parser.add_argument("--client-rate", type=float, default=3.0, help="uploader rate limit in requests/s")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent uploads")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failing with 5xx")
+    parser.add_argument("--no-limits", action="store_true", help="accept payloads over Notion's limits")
+    parser.add_argument("--json", action="store_true", help="print the raw results as JSON")
+    args = parser.parse_args(argv)
+
+    result = run_upload_benchmark(
+        docs=args.docs,
+        size=parse_size(args.size),
+        kind=args.kind,
+        latency=args.latency,
+        server_rate=args.server_rate or None,
+        client_rate=args.client_rate,
+        workers=args.workers,
+        error_rate=args.error_rate,
+        enforce_limits=not args.no_limits
+    )
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    print(f"documents:        {result['uploaded']}/{result['docs']} uploaded in {result['seconds']:.2f} s")
+    print(f"pages/min:        {result['pages_per_min']:.1f}")
+    print(f"API calls/doc:    {result['api_calls_per_doc']:.2f} ({result['api_calls']} total)")
+    print(f"429 responses:    {result['rate_limited']}")
+    print(f"request KB/doc:   {result['bytes_per_doc'] / KB:.1f}")
+    print(f"calls by route:   {json.dumps(result['routes'], sort_keys=True)}")
+    print(f"responses:        {json.dumps(result['statuses'], sort_keys=True)}")
+    for message, count in result["errors"].items():
+        print(f"failed ({count}x):     {message}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Seeded synthetic Markdown corpora for benchmarks.
+The same kind, size and seed always produce the same document, so results
+can be compared across runs and against a stored baseline.
+"""
+
+import random
+from typing import Callable, Dict, Iterator
+
+KB = 1024
+MB = 1024 * KB
+
+SIZES = {"1KB": KB, "1MB": MB, "50MB": 50 * MB}
+
+_WORDS = (
+    "notion markdown block page upload parse stream chunk token limit cache "
+    "request server client paragraph heading list quote code fence table "
+    "alpha beta gamma delta epsilon zeta theta lambda sigma omega"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _headings(rng: random.Random) -> Iterator[str]:
+    """Heading-dense documents: every section is a heading and one short line."""
+    while True:
+        level = rng.randint(1, 6)
+        yield f"{'#' * level} {_sentence(rng, rng.randint(2, 6))}\n\n{_sentence(rng, 8)}\n\n"
+
+
+def _deep_lists(rng: random.Random) -> Iterator[str]:
+    """Long, indented bullet, numbered and to-do lists."""
+    while True:
+        lines = []
+        for i in range(rng.randint(5, 40)):
+            indent = "  " * rng.randint(0, 4)
+            marker = rng.choice(("- ", "* ", f"{i + 1}. ", "- [ ] ", "- [x] "))
+            lines.append(f"{indent}{marker}{_sentence(rng, rng.randint(3, 12))}")
+        yield "\n".join(lines) + "\n\n"
+
+
+def _code_fences(rng: random.Random) -> Iterator[str]:
+    """Huge fenced code blocks with occasional prose between them."""
+    while True:
+        body = "\n".join(
+            f"    value_{i} = compute({rng.randint(0, 999)})  # {rng.choice(_WORDS)}"
+            for i in range(rng.randint(200, 2000))
+        )
+        yield f"```python\ndef generated():\n{body}\n```\n\n{_sentence(rng, 12)}\n\n"
+
+
+def _long_paragraphs(rng: random.Random) -> Iterator[str]:
+    """Multi-line paragraphs of running text."""
+    while True:
+        lines = [_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(3, 30))]
+        yield "\n".join(lines) + "\n\n"
+
+
+def _inline(rng: random.Random) -> str:
+    """A sentence with bold, italic, code, struck and linked words."""
+    words = []
+    for _ in range(rng.randint(6, 16)):
+        word = rng.choice(_WORDS)
+        style = rng.random()
+        if style < 0.1:
+            word = f"**{word}**"
+        elif style < 0.2:
+            word = f"*{word}*"
+        elif style < 0.27:
+            word = f"`{word}()`"
+        elif style < 0.3:
+            word = f"~~{word}~~"
+        elif style < 0.35:
+            word = f"[{word}](https://example.com/{word})"
+        words.append(word)
+    return " ".join(words).capitalize() + "."
+
+
+def _formatted(rng: random.Random) -> Iterator[str]:
+    """Inline formatting, links, tables and nested lists, as written by hand or exported from tools."""
+    while True:
+        choice = rng.random()
+        if choice < 0.5:
+            yield "\n".join(_inline(rng) for _ in range(rng.randint(1, 4))) + "\n\n"
+        elif choice < 0.8:
+            lines = []
+            for _ in range(rng.randint(3, 15)):
+                indent = "  " * rng.randint(0, 2)
+                lines.append(f"{indent}{rng.choice(('- ', '1. ', '- [ ] '))}{_inline(rng)}")
+            yield "\n".join(lines) + "\n\n"
+        else:
+            columns = rng.randint(2, 5)
+            rows = [" | ".join(rng.choice(_WORDS) for _ in range(columns)) for _ in range(rng.randint(2, 30))]
+            separator = " | ".join("---" for _ in range(columns))
+            yield "\n".join(f"| {row} |" for row in [rows[0], separator] + rows[1:]) + "\n\n"
+
+
+def _mixed(rng: random.Random) -> Iterator[str]:
+    """A typical note mixing every element."""
+    generators = [_headings(rng), _deep_lists(rng), _long_paragraphs(rng)]
+    while True:
+        yield next(rng.choice(generators))
+        if rng.random() < 0.2:
+            yield f"> {_sentence(rng, 10)}\n\n```\n{_sentence(rng, 6)}\n```\n\n"
+
+
+CORPORA: Dict[str, Callable[[random.Random], Iterator[str]]] = {
+    "headings": _headings,
+    "deep_lists": _deep_lists,
+    "code_fences": _code_fences,
+    "long_paragraphs": _long_paragraphs,
+    "mixed": _mixed,
+    "formatted": _formatted,
+}
+
+
+def generate(kind: str, size: int, seed: int = 0) -> str:
+    """
+    Generate a synthetic Markdown document.
+
+    Args:
+        kind: One of CORPORA
+        size: Target length in characters (the result is cut to exactly this)
+        seed: Random seed
+
+    Returns:
+        The Markdown document
+    """
+    rng = random.Random(f"{kind}:{size}:{seed}")
+    parts = []
+    length = 0
+    for part in CORPORA[kind](rng):
+        parts.append(part)
+        length += len(part)
+        if length >= size:
+            break
+    return "".join(parts)[:size]
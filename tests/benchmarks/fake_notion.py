@@ -0,0 +1,566 @@
+"""
+In-process fake of the Notion REST API for load tests and end-to-end tests.
+Serves the endpoints the uploader uses over real HTTP, so notion_client,
+httpx connection pooling, the rate limiter and retries are all exercised,
+with configurable latency, server-side rate limiting, payload limits and
+error injection.
+
+    with FakeNotionServer(latency=0.05, rate_limit=3) as server:
+        client = Client(auth="fake-token", base_url=server.base_url)
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# Documented Notion request limits
+MAX_CHILDREN = 100
+MAX_BLOCKS_PER_REQUEST = 1000
+MAX_NESTING_DEPTH = 2
+MAX_RICH_TEXT_LENGTH = 2000
+MAX_RICH_TEXT_RUNS = 100
+MAX_PAYLOAD_BYTES = 500 * 1000
+
+
+class FakeNotionError(Exception):
+    """An error response the fake server sends instead of a result."""
+
+    def __init__(self, status: int, code: str, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.headers = headers or {}
+
+
+class FakeNotionServer:
+    """
+    Threaded HTTP server emulating the Notion pages, blocks and databases endpoints.
+    All state lives in memory; stats() reports what clients sent.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: Optional[float] = None,
+        burst: int = 3,
+        retry_after: float = 1.0,
+        error_rate: float = 0.0,
+        enforce_limits: bool = True,
+        seed: int = 0
+    ):
+        """
+        Initialize the FakeNotionServer (call start() or use it as a context manager).
+
+        Args:
+            latency: Seconds every request takes before it is answered
+            jitter: Extra random latency of up to this many seconds
+            rate_limit: Sustained requests per second before answering 429
+                (None disables server-side rate limiting)
+            burst: Requests accepted back to back under rate_limit
+            retry_after: Retry-After value (seconds) sent with 429 responses
+            error_rate: Fraction of requests answered with a random 5xx error
+            enforce_limits: Reject payloads that exceed Notion's documented limits
+            seed: Seed for jitter and random errors
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.enforce_limits = enforce_limits
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._injected: List[Tuple[Optional[str], FakeNotionError, bool]] = []
+
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.blocks: Dict[str, Dict[str, Any]] = {}
+        self.children: Dict[str, List[str]] = {}
+        self.databases: Dict[str, Dict[str, Any]] = {}
+        self.data_sources: Dict[str, Dict[str, Any]] = {}
+        self.requests: Counter = Counter()
+        self.responses: Counter = Counter()
+        self.bytes_received = 0
+
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # Lifecycle
+
+    @property
+    def base_url(self) -> str:
+        """Root URL to pass to notion_client as base_url."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeNotionServer":
+        """Start serving on a free localhost port in a background thread."""
+        server = self
+
+        class Handler(_FakeNotionHandler):
+            fake = server
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "FakeNotionServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    # Test helpers
+
+    def add_database(self, title: str = "Fake database", database_id: Optional[str] = None) -> str:
+        """
+        Create a database pages can be uploaded into.
+
+        Returns:
+            The database ID
+        """
+        database_id = database_id or str(uuid.uuid4())
+        data_source_id = str(uuid.uuid4())
+        rich_title = [{"type": "text", "plain_text": title, "text": {"content": title}}]
+        with self._lock:
+            # Like API version 2025-09-03, the schema lives on the database's data source
+            self.databases[database_id] = {
+                "object": "database",
+                "id": database_id,
+                "title": rich_title,
+                "data_sources": [{"id": data_source_id, "name": title}],
+            }
+            self.data_sources[data_source_id] = {
+                "object": "data_source",
+                "id": data_source_id,
+                "parent": {"type": "database_id", "database_id": database_id},
+                "title": rich_title,
+                "properties": {"Name": {"id": "title", "type": "title", "title": {}}},
+            }
+        return database_id
+
+    def inject_error(
+        self,
+        status: int,
+        code: str = "internal_server_error",
+        route: Optional[str] = None,
+        count: int = 1,
+        retry_after: Optional[float] = None,
+        applied: bool = False
+    ) -> None:
+        """
+        Make the next matching requests fail.
+
+        Args:
+            status: HTTP status to answer with
+            code: Notion error code
+            route: Route name such as "blocks.children.append" (None matches any)
+            count: Number of requests to fail
+            retry_after: Retry-After header value, if any
+            applied: Carry out the request before failing it, like a gateway
+                timeout that hides a successful write
+        """
+        headers = {"Retry-After": str(retry_after)} if retry_after is not None else {}
+        error = FakeNotionError(status, code, f"Injected {status} error", headers)
+        with self._lock:
+            self._injected.extend([(route, error, applied)] * count)
+
+    def page_blocks(self, page_id: str) -> List[Dict[str, Any]]:
+        """Top-level blocks of a page in order (nested children under their type key)."""
+        with self._lock:
+            return [self._render_block(block_id, deep=True) for block_id in self.children.get(page_id, [])]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the traffic served so far.
+
+        Returns:
+            Dict with total requests, per-route counts, per-status counts,
+            rate-limited responses, bytes received and pages created
+        """
+        with self._lock:
+            return {
+                "requests": sum(self.requests.values()),
+                "routes": dict(self.requests),
+                "statuses": dict(self.responses),
+                "rate_limited": self.responses.get(429, 0),
+                "bytes_received": self.bytes_received,
+                "pages": len(self.pages),
+            }
+
+    # Request handling (called from handler threads)
+
+    def handle(self, method: str, path: str, query: Dict[str, List[str]], body: Any, size: int) -> Any:
+        """Route one request, applying latency, rate limits and injected errors."""
+        route, params = _match_route(method, path)
+        with self._lock:
+            self.requests[route] += 1
+            self.bytes_received += size
+
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        self._check_rate_limit()
+        injected, applied = self._take_injected(route)
+        if injected and not applied:
+            raise injected
+        if self.enforce_limits and size > MAX_PAYLOAD_BYTES:
+            raise _validation_error(f"request body exceeds {MAX_PAYLOAD_BYTES} bytes, was {size}.")
+
+        handler = getattr(self, "_" + route.replace(".", "_"), None)
+        if handler is None:
+            raise FakeNotionError(400, "invalid_request_url", f"Invalid request URL: {method} {path}")
+        with self._lock:
+            result = handler(body or {}, query, *params)
+        if injected:
+            raise injected
+        return result
+
+    def record_status(self, status: int) -> None:
+        with self._lock:
+            self.responses[status] += 1
+
+    def _check_rate_limit(self) -> None:
+        if self.rate_limit is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate_limit)
+            self._refilled = now
+            if self._tokens < 1:
+                raise FakeNotionError(
+                    429, "rate_limited", "You have been rate limited. Please try again in a few minutes.",
+                    {"Retry-After": str(self.retry_after)}
+                )
+            self._tokens -= 1
+
+    def _take_injected(self, route: str) -> Tuple[Optional[FakeNotionError], bool]:
+        """Pop the next injected (or random) error for a route, with whether to apply the request first."""
+        with self._lock:
+            for i, (injected_route, error, applied) in enumerate(self._injected):
+                if injected_route in (None, route):
+                    del self._injected[i]
+                    return error, applied
+            if self.error_rate and self._random.random() < self.error_rate:
+                status = self._random.choice((500, 502, 503))
+                return FakeNotionError(status, "internal_server_error", "Unexpected error"), False
+        return None, False
+
+    # Endpoint implementations (called with the lock held)
+
+    def _pages_create(self, body: Dict[str, Any], query: Any) -> Dict[str, Any]:
+        parent = body.get("parent") or {}
+        if "database_id" in parent or "data_source_id" in parent:
+            self._check_title_property(parent, body.get("properties") or {})
+        if "page_id" in parent and parent["page_id"] not in self.pages and parent["page_id"] not in self.blocks:
+            # Unknown parent pages are created on the fly so uploads need no setup
+            self._new_page({"type": "workspace", "workspace": True}, {}, page_id=parent["page_id"])
+
+        children = body.get("children") or []
+        self._validate_children(children)
+        page = self._new_page(parent, body.get("properties") or {})
+        self._insert_children(page["id"], children)
+        return page
+
+    def _pages_retrieve(self, body: Any, query: Any, page_id: str) -> Dict[str, Any]:
+        if page_id not in self.pages:
+            raise _not_found(page_id)
+        return self.pages[page_id]
+
+    def _databases_retrieve(self, body: Any, query: Any, database_id: str) -> Dict[str, Any]:
+        if database_id not in self.databases:
+            raise _not_found(database_id)
+        return self.databases[database_id]
+
+    def _databases_query(self, body: Dict[str, Any], query: Any, database_id: str) -> Dict[str, Any]:
+        if database_id not in self.databases:
+            raise _not_found(database_id)
+        (source,) = self.databases[database_id]["data_sources"]
+        return self._data_sources_query(body, query, source["id"])
+
+    def _data_sources_retrieve(self, body: Any, query: Any, data_source_id: str) -> Dict[str, Any]:
+        if data_source_id not in self.data_sources:
+            raise _not_found(data_source_id)
+        return self.data_sources[data_source_id]
+
+    def _data_sources_query(self, body: Dict[str, Any], query: Any, data_source_id: str) -> Dict[str, Any]:
+        if data_source_id not in self.data_sources:
+            raise _not_found(data_source_id)
+        database_id = self.data_sources[data_source_id]["parent"]["database_id"]
+        pages = [
+            page for page in self.pages.values()
+            if page["parent"].get("database_id") == database_id
+            or page["parent"].get("data_source_id") == data_source_id
+        ]
+        return self._paginate(pages, body.get("page_size"), body.get("start_cursor"))
+
+    def _blocks_children_append(self, body: Dict[str, Any], query: Any, block_id: str) -> Dict[str, Any]:
+        if block_id not in self.pages and block_id not in self.blocks:
+            raise _not_found(block_id)
+        children = body.get("children") or []
+        self._validate_children(children)
+
+        after = body.get("after")
+        if after is not None and after not in self.children.get(block_id, []):
+            raise FakeNotionError(400, "validation_error", f"Block {after} is not a child of {block_id}.")
+        created = self._insert_children(block_id, children, after)
+        return {
+            "object": "list",
+            "results": [self._render_block(new_id) for new_id in created],
+            "next_cursor": None,
+            "has_more": False,
+        }
+
+    def _blocks_children_list(self, body: Any, query: Dict[str, List[str]], block_id: str) -> Dict[str, Any]:
+        if block_id not in self.pages and block_id not in self.blocks:
+            raise _not_found(block_id)
+        blocks = [self._render_block(child_id) for child_id in self.children.get(block_id, [])]
+        page_size = int(query.get("page_size", ["100"])[0])
+        return self._paginate(blocks, page_size, query.get("start_cursor", [None])[0])
+
+    def _blocks_update(self, body: Dict[str, Any], query: Any, block_id: str) -> Dict[str, Any]:
+        block = self.blocks.get(block_id)
+        if block is None:
+            raise _not_found(block_id)
+        block_type = block["type"]
+        if block_type in body:
+            self._validate_rich_text(body[block_type])
+            block[block_type] = dict(block[block_type], **body[block_type])
+        return self._render_block(block_id)
+
+    def _blocks_delete(self, body: Any, query: Any, block_id: str) -> Dict[str, Any]:
+        block = self.blocks.get(block_id)
+        if block is None:
+            raise _not_found(block_id)
+        self.children[block["parent_id"]].remove(block_id)
+        block["archived"] = True
+        return self._render_block(block_id)
+
+    # State helpers
+
+    def _check_title_property(self, parent: Dict[str, Any], properties: Dict[str, Any]) -> None:
+        """Reject a database page whose properties do not set the data source's title property."""
+        if "data_source_id" in parent:
+            data_source_id = parent["data_source_id"]
+        elif parent["database_id"] in self.databases:
+            (source,) = self.databases[parent["database_id"]]["data_sources"]
+            data_source_id = source["id"]
+        else:
+            raise _not_found(parent["database_id"])
+        if data_source_id not in self.data_sources:
+            raise _not_found(data_source_id)
+        schema = self.data_sources[data_source_id]["properties"]
+        title = next(name for name, prop in schema.items() if prop["type"] == "title")
+        if title not in properties and schema[title]["id"] not in properties:
+            raise _validation_error(f"{title} is expected to be title.")
+
+    def _new_page(self, parent: Dict[str, Any], properties: Dict[str, Any], page_id: Optional[str] = None) -> Dict[str, Any]:
+        page_id = page_id or str(uuid.uuid4())
+        page = {
+            "object": "page",
+            "id": page_id,
+            "parent": parent,
+            "properties": properties,
+            "url": f"https://www.notion.so/{page_id.replace('-', '')}",
+            "archived": False,
+        }
+        self.pages[page_id] = page
+        self.children[page_id] = []
+        return page
+
+    def _insert_children(self, parent_id: str, children: List[Dict[str, Any]], after: Optional[str] = None) -> List[str]:
+        siblings = self.children.setdefault(parent_id, [])
+        position = siblings.index(after) + 1 if after is not None else len(siblings)
+        created = []
+        for child in children:
+            block_id = str(uuid.uuid4())
+            block_type = child["type"]
+            body = {key: value for key, value in child[block_type].items() if key != "children"}
+            self.blocks[block_id] = {"id": block_id, "type": block_type, block_type: body, "parent_id": parent_id}
+            self.children[block_id] = []
+            self._insert_children(block_id, child[block_type].get("children") or [])
+            created.append(block_id)
+        siblings[position:position] = created
+        return created
+
+    def _render_block(self, block_id: str, deep: bool = False) -> Dict[str, Any]:
+        block = self.blocks[block_id]
+        block_type = block["type"]
+        body = dict(block[block_type])
+        if "rich_text" in body:
+            body["rich_text"] = [
+                dict(run, plain_text=run.get("text", {}).get("content", ""))
+                for run in body["rich_text"]
+            ]
+        children = self.children.get(block_id, [])
+        if deep and children:
+            body["children"] = [self._render_block(child_id, deep=True) for child_id in children]
+        return {
+            "object": "block",
+            "id": block_id,
+            "type": block_type,
+            block_type: body,
+            "has_children": bool(children),
+            "archived": block.get("archived", False),
+        }
+
+    @staticmethod
+    def _paginate(items: List[Dict[str, Any]], page_size: Optional[int], cursor: Optional[str]) -> Dict[str, Any]:
+        # Like Notion, a cursor is the ID of the first item of the next page
+        page_size = min(int(page_size or 100), 100)
+        start = 0
+        if cursor:
+            start = next((i for i, item in enumerate(items) if item["id"] == cursor), None)
+            if start is None:
+                raise _validation_error(f"start_cursor {cursor} is not valid.")
+        end = start + page_size
+        return {
+            "object": "list",
+            "results": items[start:end],
+            "next_cursor": items[end]["id"] if end < len(items) else None,
+            "has_more": end < len(items),
+        }
+
+    # Validation mirroring the documented limits
+
+    def _validate_children(self, children: List[Dict[str, Any]], depth: int = 0) -> int:
+        # depth counts the levels of nesting below the top-level blocks of the request
+        if not self.enforce_limits:
+            return 0
+        if len(children) > MAX_CHILDREN:
+            raise _validation_error(f"body.children.length should be ≤ `{MAX_CHILDREN}`, instead was `{len(children)}`.")
+        if children and depth > MAX_NESTING_DEPTH:
+            raise _validation_error(f"body.children exceeds the maximum nesting depth of {MAX_NESTING_DEPTH}.")
+
+        total = len(children)
+        for child in children:
+            body = child.get(child.get("type"), {})
+            self._validate_rich_text(body)
+            total += self._validate_children(body.get("children") or [], depth + 1)
+        if depth == 0 and total > MAX_BLOCKS_PER_REQUEST:
+            raise _validation_error(f"A request may contain at most {MAX_BLOCKS_PER_REQUEST} blocks, got {total}.")
+        return total
+
+    def _validate_rich_text(self, body: Dict[str, Any]) -> None:
+        if not self.enforce_limits:
+            return
+        rich_text = body.get("rich_text") or []
+        if len(rich_text) > MAX_RICH_TEXT_RUNS:
+            raise _validation_error(f"rich_text.length should be ≤ `{MAX_RICH_TEXT_RUNS}`, instead was `{len(rich_text)}`.")
+        for run in rich_text:
+            content = (run.get("text") or {}).get("content", "")
+            # Notion counts UTF-16 code units
+            length = len(content.encode("utf-16-le")) // 2
+            if length > MAX_RICH_TEXT_LENGTH:
+                raise _validation_error(
+                    f"rich_text.text.content.length should be ≤ `{MAX_RICH_TEXT_LENGTH}`, instead was `{length}`."
+                )
+
+
+def _not_found(object_id: str) -> FakeNotionError:
+    return FakeNotionError(
+        404, "object_not_found",
+        f"Could not find object with ID: {object_id}. Make sure the relevant pages and databases are shared."
+    )
+
+
+def _validation_error(message: str) -> FakeNotionError:
+    return FakeNotionError(400, "validation_error", f"body failed validation: {message}")
+
+
+_ROUTES = [
+    ("POST", re.compile(r"pages"), "pages.create"),
+    ("GET", re.compile(r"pages/([^/]+)"), "pages.retrieve"),
+    ("GET", re.compile(r"databases/([^/]+)"), "databases.retrieve"),
+    ("POST", re.compile(r"databases/([^/]+)/query"), "databases.query"),
+    ("GET", re.compile(r"data_sources/([^/]+)"), "data_sources.retrieve"),
+    ("POST", re.compile(r"data_sources/([^/]+)/query"), "data_sources.query"),
+    ("PATCH", re.compile(r"blocks/([^/]+)/children"), "blocks.children.append"),
+    ("GET", re.compile(r"blocks/([^/]+)/children"), "blocks.children.list"),
+    ("PATCH", re.compile(r"blocks/([^/]+)"), "blocks.update"),
+    ("DELETE", re.compile(r"blocks/([^/]+)"), "blocks.delete"),
+]
+
+
+def _match_route(method: str, path: str) -> Tuple[str, Tuple[str, ...]]:
+    """Map a request to a route name and its path parameters."""
+    relative = path.strip("/")
+    if relative.startswith("v1/"):
+        relative = relative[3:]
+    for route_method, pattern, name in _ROUTES:
+        match = pattern.fullmatch(relative)
+        if route_method == method and match:
+            return name, match.groups()
+    return f"unknown:{method} {relative}", ()
+
+
+class _FakeNotionHandler(BaseHTTPRequestHandler):
+    """Translates HTTP requests into FakeNotionServer.handle calls."""
+
+    fake: FakeNotionServer
+    # Keep-alive, so clients can reuse pooled connections like against the real API
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs stall every response
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        headers: Dict[str, str] = {}
+        try:
+            try:
+                body = json.loads(raw) if raw else None
+            except ValueError as e:
+                raise FakeNotionError(400, "invalid_json", "Error parsing JSON body.") from e
+            status, payload = 200, self.fake.handle(method, url.path, parse_qs(url.query), body, len(raw))
+        except FakeNotionError as error:
+            status, headers = error.status, error.headers
+            payload = {"object": "error", "status": error.status, "code": error.code, "message": str(error)}
+
+        self.fake.record_status(status)
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep benchmark and test output clean
+        pass
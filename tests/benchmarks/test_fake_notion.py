@@ -0,0 +1,256 @@
+"""
+Tests for the fake Notion API server used by the end-to-end upload benchmark.
+The real notion_client and NotionUploader talk to it over HTTP.
+"""
+
+import functools
+import logging
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+# Add src and benchmark directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from notion_client import APIResponseError, Client
+
+from bench_upload import run_upload_benchmark
+from fake_notion import FakeNotionServer
+from markdown_processor import MarkdownProcessor
+from notion_uploader import NotionUploader
+from rate_limiter import RateLimiter
+from upload_journal import UploadJournal
+
+PARENT_PAGE_ID = "00000000-0000-0000-0000-000000000001"
+
+
+class TestFakeNotionServer(unittest.TestCase):
+    """Test cases for NotionUploader against FakeNotionServer."""
+
+    def setUp(self):
+        """Start a server without latency and an uploader pointed at it."""
+        self.server = FakeNotionServer().start()
+        self.addCleanup(self.server.stop)
+
+        self.uploader = NotionUploader(
+            token="fake-token",
+            rate_limiter=RateLimiter(rate=1000, burst=1000, base_delay=0.01)
+        )
+        # Disable the client's own retries so 429 handling goes through RateLimiter
+        self.uploader.client = Client(
+            auth="fake-token", base_url=self.server.base_url, retry=False, log_level=logging.ERROR
+        )
+
+    def test_large_document_is_created_and_appended(self):
+        """Test 250 blocks are sent as one create and two appends, in order."""
+        markdown = "\n\n".join(f"Paragraph {i}" for i in range(250))
+
+        page_id = self.uploader.upload_markdown_content(markdown, "Big", parent_page_id=PARENT_PAGE_ID)
+
+        blocks = self.server.page_blocks(page_id)
+        self.assertEqual(len(blocks), 250)
+        self.assertEqual(blocks[249]["paragraph"]["rich_text"][0]["plain_text"], "Paragraph 249")
+        self.assertEqual(
+            self.server.stats()["routes"],
+            {"pages.create": 1, "blocks.children.append": 2}
+        )
+
+    def test_nested_blocks_are_packed_within_limits(self):
+        """Test deeply nested blocks are uploaded without exceeding the request limits."""
+        def toggle(text, children):
+            return {"type": "toggle", "toggle": {
+                "rich_text": [{"type": "text", "text": {"content": text}}], "children": children
+            }}
+
+        blocks = [toggle(f"Section {i}", [toggle("Details", [toggle("Leaf", [])])] * 50) for i in range(10)]
+
+        page_id = self.uploader._create_page_with_blocks(blocks, "Nested", parent_page_id=PARENT_PAGE_ID)
+
+        sections = self.server.page_blocks(page_id)
+        self.assertEqual(len(sections), 10)
+        self.assertEqual(sections[9]["toggle"]["children"][49]["toggle"]["children"][0]["type"], "toggle")
+        self.assertNotIn(400, self.server.stats()["statuses"])
+
+    def test_rate_limited_request_is_retried(self):
+        """Test an injected 429 with Retry-After is retried by the rate limiter."""
+        self.server.inject_error(429, "rate_limited", route="pages.create", retry_after=0)
+
+        page_id = self.uploader.upload_markdown_content("Hello", "Retry", parent_page_id=PARENT_PAGE_ID)
+
+        self.assertEqual(len(self.server.page_blocks(page_id)), 1)
+        self.assertEqual(self.server.stats()["rate_limited"], 1)
+        self.assertEqual(self.server.stats()["routes"]["pages.create"], 2)
+
+    def test_server_rate_limits_pause_the_shared_bucket(self):
+        """Test 429s reach RateLimiter through the uploader's own client instead of its internal retries."""
+        server = FakeNotionServer(rate_limit=2, burst=1, retry_after=0.1).start()
+        self.addCleanup(server.stop)
+        limiter = RateLimiter(rate=1000, burst=1000, base_delay=0.01)
+        pause = patch.object(limiter.bucket, "pause", wraps=limiter.bucket.pause).start()
+        self.addCleanup(patch.stopall)
+        with patch("notion_uploader.Client", functools.partial(Client, base_url=server.base_url)):
+            uploader = NotionUploader(token="fake-token", rate_limiter=limiter)
+        markdown = "\n\n".join(f"Paragraph {i}" for i in range(250))
+
+        page_id = uploader.upload_markdown_content(markdown, "Throttled", parent_page_id=PARENT_PAGE_ID)
+
+        self.assertEqual(len(server.page_blocks(page_id)), 250)
+        self.assertGreater(server.stats()["rate_limited"], 0)
+        self.assertEqual(pause.call_count, server.stats()["rate_limited"])
+
+    def test_payload_limits_are_enforced(self):
+        """Test oversized rich text is rejected with a validation error."""
+        with self.assertRaises(APIResponseError) as context:
+            self.uploader.client.pages.create(
+                parent={"page_id": PARENT_PAGE_ID},
+                properties={},
+                children=[{"type": "paragraph", "paragraph": {"rich_text": [{"text": {"content": "x" * 2001}}]}}]
+            )
+
+        self.assertEqual(context.exception.code, "validation_error")
+        self.assertEqual(self.server.stats()["statuses"], {400: 1})
+
+    def test_oversized_text_is_normalized_before_sending(self):
+        """Test long multi-byte paragraphs and code blocks upload in one round trip."""
+        paragraph = "日本語のメモ😀" * 400
+        code = "```\n" + "print('x')\n" * 30000 + "```"
+
+        page_id = self.uploader.upload_markdown_content(
+            f"{paragraph}\n\n{code}", "Long", parent_page_id=PARENT_PAGE_ID
+        )
+
+        blocks = self.server.page_blocks(page_id)
+        texts = ["".join(run["plain_text"] for run in block[block["type"]]["rich_text"]) for block in blocks]
+        self.assertEqual(texts[0], paragraph)
+        self.assertEqual("".join(texts[1:]), "print('x')\n" * 29999 + "print('x')")
+        self.assertEqual(self.server.stats()["statuses"], {200: 1})
+
+    def test_large_multibyte_code_block_stays_under_payload_limit(self):
+        """Test a 200k-character Japanese code block is sent in requests Notion accepts."""
+        code = "```\n" + "日本語" * 70000 + "\n```"
+
+        page_id = self.uploader.upload_markdown_content(code, "Japanese", parent_page_id=PARENT_PAGE_ID)
+
+        blocks = self.server.page_blocks(page_id)
+        self.assertEqual(len(blocks), 2)
+        self.assertNotIn(400, self.server.stats()["statuses"])
+
+    def test_update_page_round_trip(self):
+        """Test update_page lists, updates, deletes and inserts blocks on the server."""
+        page_id = self.uploader.upload_markdown_content(
+            "# Title\n\nKeep\n\nChange\n\nDrop", "Doc", parent_page_id=PARENT_PAGE_ID
+        )
+
+        summary = self.uploader.update_page(page_id, "# Title\n\nKeep\n\nChanged\n\nNew", use_mirror=False)
+
+        texts = [block[block["type"]]["rich_text"][0]["plain_text"] for block in self.server.page_blocks(page_id)]
+        self.assertEqual(texts, ["Title", "Keep", "Changed", "New"])
+        self.assertEqual(summary["unchanged"], 2)
+        self.assertIn("blocks.children.list", self.server.stats()["routes"])
+
+    def test_database_routes(self):
+        """Test databases can be retrieved and queried for their pages."""
+        database_id = self.server.add_database("Notes")
+        self.uploader.upload_markdown_content("Hello", "Note", database_id=database_id)
+
+        info = self.uploader.get_database_info(database_id)
+        data_source_id = info["data_sources"][0]["id"]
+        pages = self.uploader.client.data_sources.query(data_source_id=data_source_id)["results"]
+
+        self.assertEqual(info["title"][0]["plain_text"], "Notes")
+        self.assertEqual(len(pages), 1)
+        self.assertIn("Name", pages[0]["properties"])
+        self.assertEqual(self.server.stats()["routes"]["data_sources.retrieve"], 1)
+
+    def _journaled_file(self, paragraphs):
+        """Write a Markdown file and give the uploader a journal next to it."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        filepath = os.path.join(tmpdir.name, "long.md")
+        Path(filepath).write_text("\n\n".join(f"Paragraph {i}" for i in range(paragraphs)), encoding="utf-8")
+        self.uploader.journal = UploadJournal(os.path.join(tmpdir.name, "journal.jsonl"))
+        return filepath
+
+    def _page_texts(self, page_id):
+        return [block["paragraph"]["rich_text"][0]["plain_text"] for block in self.server.page_blocks(page_id)]
+
+    def test_failed_upload_resumes_on_the_same_page(self):
+        """Test resume=True continues after the last confirmed append instead of starting over."""
+        filepath = self._journaled_file(450)
+        self.server.inject_error(500, route="blocks.children.append", count=3)
+        with self.assertRaises(APIResponseError):
+            self.uploader.upload_markdown_file(filepath, parent_page_id=PARENT_PAGE_ID)
+
+        page_id = self.uploader.upload_markdown_file(filepath, parent_page_id=PARENT_PAGE_ID, resume=True)
+
+        self.assertEqual(self._page_texts(page_id), [f"Paragraph {i}" for i in range(450)])
+        self.assertEqual(self.server.stats()["routes"]["pages.create"], 1)
+        self.assertEqual(len(self.uploader.journal), 0)
+
+    def test_timed_out_append_is_not_sent_twice(self):
+        """Test an append that was applied but answered with 504 is verified instead of re-sent."""
+        filepath = self._journaled_file(450)
+        self.server.inject_error(504, "gateway_timeout", route="blocks.children.append", applied=True)
+
+        page_id = self.uploader.upload_markdown_file(filepath, parent_page_id=PARENT_PAGE_ID)
+
+        self.assertEqual(self._page_texts(page_id), [f"Paragraph {i}" for i in range(450)])
+        self.assertEqual(self.server.stats()["routes"]["blocks.children.append"], 4)
+
+    def test_resume_skips_append_applied_before_crash(self):
+        """Test an append that landed without being journaled is detected on resume."""
+        filepath = self._journaled_file(450)
+        self.server.inject_error(400, "validation_error", route="blocks.children.append", applied=True)
+        with self.assertRaises(APIResponseError):
+            self.uploader.upload_markdown_file(filepath, parent_page_id=PARENT_PAGE_ID)
+
+        page_id = self.uploader.upload_markdown_file(filepath, parent_page_id=PARENT_PAGE_ID, resume=True)
+
+        self.assertEqual(self._page_texts(page_id), [f"Paragraph {i}" for i in range(450)])
+        self.assertEqual(self.server.stats()["routes"]["blocks.children.append"], 4)
+
+    def test_resume_finishes_deferred_children(self):
+        """Test children deferred to a new block are completed after a crash part way through them."""
+        filepath = self._journaled_file(0)
+        items = "\n".join(f"  - Item {i}\n    - Detail {i}\n      - Note {i}" for i in range(150))
+        Path(filepath).write_text(f"- Outer\n{items}\n\nAfter", encoding="utf-8")
+        self.uploader.processor = MarkdownProcessor(backend="mistune")
+
+        def crash_after_first_item_request(added):
+            # Outer's 150 items take two appends; fail the second
+            if added == 100:
+                self.server.inject_error(400, "validation_error", route="blocks.children.append")
+
+        with self.assertRaises(APIResponseError):
+            self.uploader.upload_markdown_file(
+                filepath, parent_page_id=PARENT_PAGE_ID, progress=crash_after_first_item_request
+            )
+
+        page_id = self.uploader.upload_markdown_file(filepath, parent_page_id=PARENT_PAGE_ID, resume=True)
+
+        blocks = self.server.page_blocks(page_id)
+        self.assertEqual([block["type"] for block in blocks], ["bulleted_list_item", "paragraph"])
+        items = blocks[0]["bulleted_list_item"]["children"]
+        self.assertEqual(len(items), 150)
+        detail = items[149]["bulleted_list_item"]["children"][0]["bulleted_list_item"]
+        self.assertEqual(detail["rich_text"][0]["plain_text"], "Detail 149")
+        self.assertEqual(detail["children"][0]["bulleted_list_item"]["rich_text"][0]["plain_text"], "Note 149")
+        self.assertEqual(self.server.stats()["routes"]["pages.create"], 1)
+
+    def test_upload_benchmark_reports_throughput(self):
+        """Test a small benchmark run uploads every document."""
+        result = run_upload_benchmark(
+            docs=3, size=2048, kind="headings", latency=0, server_rate=None, client_rate=1000
+        )
+
+        self.assertEqual(result["uploaded"], 3)
+        self.assertGreater(result["pages_per_min"], 0)
+        self.assertGreaterEqual(result["api_calls_per_doc"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
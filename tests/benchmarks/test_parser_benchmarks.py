@@ -0,0 +1,118 @@
+"""
+Tests for the parser benchmark suite.
+The regression gate itself only runs when RUN_BENCHMARKS=1 is set, since
+timings depend on the machine and its load.
+"""
+
+import os
+import unittest
+from pathlib import Path
+import sys
+
+# Add src and benchmark directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_backends import fidelity, run_benchmarks as run_backend_benchmarks
+from bench_parser import calibrate, find_regressions, load_baseline, run_benchmarks
+from corpus import CORPORA, generate
+
+
+class TestCorpus(unittest.TestCase):
+    """Test cases for the synthetic corpus generators."""
+
+    def test_generators_are_seeded_and_sized(self):
+        """Test every corpus is reproducible and exactly the requested size."""
+        for kind in CORPORA:
+            with self.subTest(kind=kind):
+                document = generate(kind, 4096)
+                self.assertEqual(len(document), 4096)
+                self.assertEqual(document, generate(kind, 4096))
+                self.assertNotEqual(document, generate(kind, 4096, seed=1))
+
+
+class TestRegressionGate(unittest.TestCase):
+    """Test cases for comparing results with a baseline."""
+
+    BASELINE = {
+        "calibration": 0.1,
+        "results": {"parse_markdown_to_blocks/mixed/1MB": {"mb_per_s": 10.0, "peak_mb": 10.0}},
+    }
+
+    def test_slower_results_are_reported(self):
+        """Test throughput below the tolerated baseline is a regression."""
+        results = {"parse_markdown_to_blocks/mixed/1MB": {"mb_per_s": 6.0, "peak_mb": 10.0}}
+
+        regressions = find_regressions(results, 0.1, self.BASELINE, tolerance=0.3)
+
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("MB/s", regressions[0])
+
+    def test_baseline_is_scaled_by_calibration(self):
+        """Test a machine twice as slow is expected to reach half the throughput."""
+        results = {"parse_markdown_to_blocks/mixed/1MB": {"mb_per_s": 6.0, "peak_mb": 10.0}}
+
+        self.assertEqual(find_regressions(results, 0.2, self.BASELINE, tolerance=0.3), [])
+
+    def test_memory_growth_is_reported(self):
+        """Test peak memory above the tolerated baseline is a regression."""
+        results = {"parse_markdown_to_blocks/mixed/1MB": {"mb_per_s": 10.0, "peak_mb": 20.0}}
+
+        regressions = find_regressions(results, 0.1, self.BASELINE, tolerance=0.3)
+
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("peak", regressions[0])
+
+    def test_run_benchmarks_reports_metrics(self):
+        """Test a tiny run produces every metric for both functions."""
+        results = run_benchmarks(["1KB"], ["mixed"], budget=0.01)
+
+        self.assertEqual(
+            set(results),
+            {"parse_markdown_to_blocks/mixed/1KB", "process_file/mixed/1KB"}
+        )
+        for result in results.values():
+            self.assertGreater(result["blocks_per_s"], 0)
+            self.assertGreater(result["mb_per_s"], 0)
+            self.assertIn("peak_mb", result)
+
+    @unittest.skipUnless(os.getenv("RUN_BENCHMARKS") == "1", "set RUN_BENCHMARKS=1 to run the benchmark gate")
+    def test_no_regression_against_stored_baseline(self):
+        """Test 1KB and 1MB parsing is not slower or larger than the stored baseline."""
+        baseline = load_baseline()
+        self.assertIsNotNone(baseline, "no baseline.json stored")
+
+        results = run_benchmarks(["1KB", "1MB"], list(CORPORA))
+        regressions = find_regressions(results, calibrate(), baseline)
+
+        self.assertEqual(regressions, [])
+
+
+class TestBackendComparison(unittest.TestCase):
+    """Test cases for the parser backend comparison."""
+
+    def test_every_backend_is_measured(self):
+        """Test a tiny run reports throughput and fidelity per backend."""
+        results = run_backend_benchmarks(["1KB"], ["formatted"], budget=0.01)
+
+        self.assertEqual(set(results), {"line/formatted/1KB", "mistune/formatted/1KB"})
+        self.assertGreater(results["mistune/formatted/1KB"]["mb_per_s"], 0)
+        self.assertGreater(results["line/formatted/1KB"]["leaked"], 0)
+        self.assertGreater(results["mistune/formatted/1KB"]["formatted"], 0)
+
+    def test_fidelity_counts_nested_and_leaked_markup(self):
+        """Test nested blocks are counted and markup is only leaked outside code."""
+        blocks = [
+            {"type": "paragraph", "paragraph": {"rich_text": [{"type": "text", "text": {"content": "a **b**"}}]}},
+            {"type": "code", "code": {"rich_text": [{"type": "text", "text": {"content": "`x`"}}]}},
+            {"type": "bulleted_list_item", "bulleted_list_item": {
+                "rich_text": [{"type": "text", "text": {"content": "c"}, "annotations": {"bold": True}}],
+                "children": [{"type": "paragraph", "paragraph": {"rich_text": []}}],
+            }},
+        ]
+
+        self.assertEqual(fidelity(blocks), {"blocks": 3, "nested": 1, "formatted": 1, "leaked": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for the startup benchmark and the lazy package imports.
+The timing gate only runs when RUN_BENCHMARKS=1 is set, since timings depend
+on the machine and its load.
+"""
+
+import os
+import unittest
+from pathlib import Path
+import sys
+
+# Add repository root (for the src package), src and benchmark directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_parser import calibrate
+from bench_startup import _MARKER, find_regressions, load_baseline, measure_import, parse_importtime, run_benchmarks
+
+IMPORTTIME_OUTPUT = f"""import time: self [us] | cumulative | imported package
+import time:       900 |        900 | site
+{_MARKER}
+import time:       120 |        120 |     re._casefix
+import time:       300 |        420 |   re
+import time:      1500 |       1920 | src.markdown_processor
+import time:        80 |         80 | json
+"""
+
+
+class TestImportTimeParsing(unittest.TestCase):
+    """Test cases for reading -X importtime output."""
+
+    def test_only_imports_after_marker_count(self):
+        """Test the total sums top-level cumulative times after the marker."""
+        total, modules = parse_importtime(IMPORTTIME_OUTPUT)
+
+        self.assertEqual(total, 2.0)
+        self.assertEqual(modules[0], ("src.markdown_processor", 1.5))
+        self.assertNotIn("site", [name for name, _ in modules])
+
+
+class TestRegressionGate(unittest.TestCase):
+    """Test cases for comparing results with the latest recorded release."""
+
+    BASELINE = {
+        "releases": {
+            "0.9.0": {"calibration": 0.1, "results": {"import src": {"ms": 500.0}}},
+            "0.10.0": {"calibration": 0.1, "results": {"import src": {"ms": 100.0}}},
+        }
+    }
+
+    def test_latest_release_is_the_reference(self):
+        """Test versions are compared numerically and the newest one is used."""
+        regressions = find_regressions({"import src": {"ms": 200.0}}, 0.1, self.BASELINE, tolerance=0.5)
+
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("0.10.0", regressions[0])
+
+    def test_baseline_is_scaled_by_calibration(self):
+        """Test a machine twice as slow is allowed twice the time."""
+        self.assertEqual(find_regressions({"import src": {"ms": 200.0}}, 0.2, self.BASELINE, tolerance=0.5), [])
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test cases for the import footprint of the package."""
+
+    def test_parse_only_import_skips_heavy_dependencies(self):
+        """Test importing MarkdownProcessor does not load the MCP or Notion stack."""
+        result = measure_import("src.markdown_processor", runs=1)
+
+        self.assertEqual(result["heavy"], [])
+
+    def test_package_attributes_load_on_access(self):
+        """Test the package's public names resolve lazily to the submodule objects."""
+        import src
+        from src.markdown_processor import MarkdownProcessor
+
+        self.assertIs(src.MarkdownProcessor, MarkdownProcessor)
+        self.assertIn("NotionUploader", dir(src))
+        with self.assertRaises(AttributeError):
+            src.missing
+
+    @unittest.skipUnless(os.getenv("RUN_BENCHMARKS") == "1", "set RUN_BENCHMARKS=1 to run the benchmark gate")
+    def test_no_regression_against_latest_release(self):
+        """Test imports and server readiness are not slower than the latest recorded release."""
+        baseline = load_baseline()
+        self.assertIsNotNone(baseline, "no startup_baseline.json stored")
+
+        regressions = find_regressions(run_benchmarks(), calibrate(), baseline)
+
+        self.assertEqual(regressions, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
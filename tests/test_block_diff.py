@@ -0,0 +1,156 @@
+"""Unit tests for the block diff planner."""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from block_diff import block_signature, can_update_in_place, plan_block_updates
+
+
+def paragraph(text):
+    """Build a locally parsed paragraph block."""
+    return {"type": "paragraph", "paragraph": {"rich_text": [{"type": "text", "text": {"content": text}}]}}
+
+
+def heading(text):
+    """Build a locally parsed heading block."""
+    return {"type": "heading_2", "heading_2": {"rich_text": [{"type": "text", "text": {"content": text}}]}}
+
+
+def existing(block_id, block):
+    """Attach an ID to a block as if it was fetched from Notion."""
+    return dict(block, id=block_id)
+
+
+class TestBlockSignature(unittest.TestCase):
+    """Test cases for block_signature."""
+
+    def test_api_block_matches_local_block(self):
+        """Test a block returned by the API has the same signature as its source."""
+        api_block = {
+            "id": "b1",
+            "type": "code",
+            "has_children": False,
+            "code": {
+                "caption": [],
+                "language": "python",
+                "rich_text": [
+                    {
+                        "type": "text",
+                        "text": {"content": "print(1)", "link": None},
+                        "annotations": {"bold": False, "italic": False, "code": False, "color": "default"},
+                        "plain_text": "print(1)",
+                        "href": None,
+                    }
+                ],
+            },
+        }
+        local_block = {
+            "type": "code",
+            "code": {"rich_text": [{"type": "text", "text": {"content": "print(1)"}}], "language": "python"},
+        }
+
+        self.assertEqual(block_signature(api_block), block_signature(local_block))
+
+    def test_adjacent_runs_are_merged(self):
+        """Test runs split differently but with equal formatting compare equal."""
+        split = {"type": "paragraph", "paragraph": {"rich_text": [
+            {"type": "text", "text": {"content": "Hello "}},
+            {"type": "text", "text": {"content": "world"}},
+        ]}}
+
+        self.assertEqual(block_signature(split), block_signature(paragraph("Hello world")))
+
+    def test_attributes_are_compared(self):
+        """Test to-do state and code language are part of the signature."""
+        todo = {"type": "to_do", "to_do": {"rich_text": [], "checked": False}}
+        done = {"type": "to_do", "to_do": {"rich_text": [], "checked": True}}
+
+        self.assertNotEqual(block_signature(todo), block_signature(done))
+
+    def test_can_update_in_place(self):
+        """Test only same-type blocks without children can be updated."""
+        self.assertTrue(can_update_in_place(existing("a", paragraph("x")), paragraph("y")))
+        self.assertFalse(can_update_in_place(existing("a", paragraph("x")), heading("y")))
+        self.assertFalse(can_update_in_place(
+            dict(existing("a", paragraph("x")), has_children=True), paragraph("y")
+        ))
+
+
+class TestPlanBlockUpdates(unittest.TestCase):
+    """Test cases for plan_block_updates."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.current = [existing(f"b{i}", paragraph(f"P{i}")) for i in range(5)]
+
+    def test_identical_content_needs_no_operations(self):
+        """Test an unchanged page produces an empty plan."""
+        plan = plan_block_updates(self.current, [paragraph(f"P{i}") for i in range(5)])
+
+        self.assertEqual((plan["deletes"], plan["updates"], plan["inserts"]), ([], [], []))
+        self.assertEqual(plan["unchanged"], 5)
+
+    def test_edited_block_is_updated_in_place(self):
+        """Test a changed paragraph becomes a single update."""
+        desired = [paragraph(f"P{i}") for i in range(5)]
+        desired[2] = paragraph("P2 edited")
+
+        plan = plan_block_updates(self.current, desired)
+
+        self.assertEqual(plan["updates"], [("b2", desired[2])])
+        self.assertEqual((plan["deletes"], plan["inserts"]), ([], []))
+
+    def test_insert_after_existing_block(self):
+        """Test new blocks are inserted after the preceding kept block."""
+        desired = [paragraph(f"P{i}") for i in range(5)]
+        desired.insert(3, heading("New"))
+
+        plan = plan_block_updates(self.current, desired)
+
+        self.assertEqual(plan["inserts"], [("b2", [heading("New")])])
+        self.assertEqual(plan["layout"], ["b0", "b1", "b2", None, "b3", "b4"])
+
+    def test_removed_block_is_deleted(self):
+        """Test a removed block becomes a single delete."""
+        desired = [paragraph(f"P{i}") for i in (0, 1, 3, 4)]
+
+        plan = plan_block_updates(self.current, desired)
+
+        self.assertEqual(plan["deletes"], ["b2"])
+        self.assertEqual((plan["updates"], plan["inserts"]), ([], []))
+
+    def test_leading_insert_reuses_first_block(self):
+        """Test content prepended to the page is anchored by updating the first block."""
+        desired = [paragraph("Intro")] + [paragraph(f"P{i}") for i in range(5)]
+
+        plan = plan_block_updates(self.current, desired)
+
+        self.assertEqual(plan["updates"], [("b0", paragraph("Intro"))])
+        self.assertEqual(plan["inserts"], [("b0", [paragraph("P0")])])
+        self.assertEqual(plan["deletes"], [])
+
+    def test_leading_insert_of_other_type_recreates_prefix(self):
+        """Test a prepended block of a new type still ends up first."""
+        desired = [heading("Title")] + [paragraph(f"P{i}") for i in range(5)]
+
+        plan = plan_block_updates(self.current, desired)
+
+        # No block can become the heading, so everything is re-created
+        self.assertEqual(plan["deletes"], [f"b{i}" for i in range(5)])
+        self.assertEqual(plan["inserts"], [(None, desired)])
+
+    def test_empty_page(self):
+        """Test filling an empty page appends everything."""
+        desired = [paragraph("A"), paragraph("B")]
+
+        plan = plan_block_updates([], desired)
+
+        self.assertEqual(plan["inserts"], [(None, desired)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""Unit tests for the compact block model."""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blocks import Block, expand_blocks, to_notion
+from markdown_processor import MarkdownProcessor
+
+
+class TestBlocks(unittest.TestCase):
+    """Test cases for Block and its expansion helpers."""
+
+    def test_to_dict_builds_notion_block(self):
+        """Test a compact block expands into the Notion API format."""
+        block = Block("code", "x = 1", (("language", "python"),))
+
+        self.assertEqual(block.to_dict(), {
+            "type": "code",
+            "code": {
+                "rich_text": [{"type": "text", "text": {"content": "x = 1"}}],
+                "language": "python"
+            }
+        })
+
+    def test_to_dict_returns_fresh_dicts(self):
+        """Test mutating an expanded dict does not affect the block."""
+        block = Block("paragraph", "Text")
+        block.to_dict()["paragraph"]["rich_text"][0]["text"]["content"] = "Changed"
+
+        self.assertEqual(block.to_dict()["paragraph"]["rich_text"][0]["text"]["content"], "Text")
+
+    def test_expand_accepts_blocks_and_dicts(self):
+        """Test already expanded dicts pass through unchanged."""
+        raw = {"type": "divider", "divider": {}}
+
+        self.assertIs(to_notion(raw), raw)
+        self.assertEqual(
+            expand_blocks([Block("quote", "Q"), raw]),
+            [Block("quote", "Q").to_dict(), raw]
+        )
+
+    def test_processor_compact_output_matches_dicts(self):
+        """Test parse_compact expands to exactly what parse_markdown_to_blocks returns."""
+        processor = MarkdownProcessor()
+        content = "# Title\n\n- [x] Done\n1. One\n\n```python\nx = 1\n```\n\n> Quote\ntext"
+
+        compact, _ = processor.parse_compact(content)
+        blocks, _ = processor.parse_markdown_to_blocks(content)
+
+        self.assertTrue(all(isinstance(block, Block) for block in compact))
+        self.assertEqual(expand_blocks(compact), blocks)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Unit tests for the shared HTTP connection pool."""
+
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import socket
+import sys
+import threading
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import http_pool
+from http_pool import PoolSettings, close_shared_transport, create_transport, get_shared_transport, warm_up
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_HEAD(self):
+        self.connections.add(self.client_address)
+        self.send_response(404)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpPool(unittest.TestCase):
+    """Test cases for the http_pool module."""
+
+    def setUp(self):
+        """Start every test with no shared pool."""
+        close_shared_transport()
+
+    def tearDown(self):
+        """Close the pool created by the test."""
+        close_shared_transport()
+
+    def test_settings_from_env(self):
+        """Test pool settings are read from the NOTION_HTTP_* variables."""
+        env = {
+            "NOTION_HTTP_MAX_CONNECTIONS": "4",
+            "NOTION_HTTP_MAX_KEEPALIVE": "2",
+            "NOTION_HTTP_KEEPALIVE_EXPIRY": "15",
+            "NOTION_HTTP_TIMEOUT": "7.5",
+            "NOTION_HTTP2": "true",
+        }
+        with patch.dict("os.environ", env):
+            settings = PoolSettings.from_env()
+
+        self.assertEqual(settings, PoolSettings(4, 2, 15.0, 7.5, True))
+        self.assertEqual(settings.timeout_ms, 7500)
+        self.assertEqual(settings.limits.max_keepalive_connections, 2)
+
+    def test_shared_transport_is_reused_until_closed(self):
+        """Test the same pool is returned until it is closed."""
+        transport = get_shared_transport()
+
+        self.assertIs(get_shared_transport(), transport)
+        close_shared_transport()
+        self.assertIsNot(get_shared_transport(), transport)
+
+    def test_concurrent_first_use_creates_one_pool(self):
+        """Test threads racing on first use all get the same pool."""
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_shared_transport())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(transport) for transport in results}), 1)
+
+    def test_http2_without_h2_falls_back(self):
+        """Test HTTP/2 degrades to HTTP/1.1 when h2 is not installed."""
+        try:
+            import h2  # noqa: F401
+            self.skipTest("h2 is installed")
+        except ImportError:
+            pass
+
+        with self.assertLogs(http_pool.logger, level="WARNING"):
+            transport = create_transport(PoolSettings(http2=True))
+        transport.close()
+
+    def test_warm_up_keeps_connection_open(self):
+        """Test warm-up opens a connection that later requests reuse."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        _KeepAliveHandler.connections.clear()
+        try:
+            self.assertTrue(warm_up(base_url))
+            self.assertTrue(warm_up(base_url))
+        finally:
+            close_shared_transport()
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(len(_KeepAliveHandler.connections), 1)
+
+    def test_warm_up_failure_is_not_fatal(self):
+        """Test warm-up reports an unreachable API instead of raising."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        with self.assertLogs(http_pool.logger, level="WARNING"):
+            self.assertFalse(warm_up(f"http://127.0.0.1:{port}", timeout=1.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
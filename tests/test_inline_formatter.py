@@ -0,0 +1,112 @@
+"""Unit tests for the inline formatting scanner."""
+
+import unittest
+from pathlib import Path
+import sys
+import time
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blocks import Block
+from inline_formatter import format_inline, inline_block
+
+
+def styles(text):
+    return [
+        (content, dict.fromkeys(annotations, True) or None, link)
+        for content, annotations, link in format_inline(text)
+    ]
+
+
+class TestFormatInline(unittest.TestCase):
+    """Test cases for format_inline."""
+
+    def test_emphasis_and_strikethrough(self):
+        """Test each delimiter run maps to its annotations."""
+        self.assertEqual(styles("a **b** *c* ***d*** ~~e~~ __f__"), [
+            ("a ", None, None),
+            ("b", {"bold": True}, None),
+            (" ", None, None),
+            ("c", {"italic": True}, None),
+            (" ", None, None),
+            ("d", {"bold": True, "italic": True}, None),
+            (" ", None, None),
+            ("e", {"strikethrough": True}, None),
+            (" ", None, None),
+            ("f", {"bold": True}, None),
+        ])
+
+    def test_nested_styles_combine(self):
+        """Test an inner style adds to the outer one."""
+        self.assertEqual(styles("**bold *both* bold**"), [
+            ("bold ", {"bold": True}, None),
+            ("both", {"bold": True, "italic": True}, None),
+            (" bold", {"bold": True}, None),
+        ])
+
+    def test_code_spans_take_precedence(self):
+        """Test markup inside code spans is kept verbatim."""
+        self.assertEqual(styles("run `a ** b` or ``x ` y``"), [
+            ("run ", None, None),
+            ("a ** b", {"code": True}, None),
+            (" or ", None, None),
+            ("x ` y", {"code": True}, None),
+        ])
+
+    def test_links(self):
+        """Test absolute links become link runs and relative ones keep their text."""
+        self.assertEqual(styles("[site](https://example.com), [notes](notes.md) and **[b](mailto:a@b.c)**"), [
+            ("site", None, "https://example.com"),
+            (", notes and ", None, None),
+            ("b", {"bold": True}, "mailto:a@b.c"),
+        ])
+
+    def test_unmatched_markup_stays_literal(self):
+        """Test delimiters without a partner, spaced stars and snake_case are plain text."""
+        for text in ("2 * 3 * 4", "**unclosed", "snake_case_name", "a ~b~ c", "`open", "[x](has space)", "[ ] todo"):
+            with self.subTest(text=text):
+                self.assertEqual(styles(text), [(text, None, None)])
+
+    def test_backslash_escapes(self):
+        """Test escaped delimiters are literal and the backslash is dropped."""
+        self.assertEqual(styles(r"\*not\* \q"), [(r"*not* \q", None, None)])
+
+    def test_linear_time_on_unmatched_delimiters(self):
+        """Test pathological inputs do not rescan the text for every delimiter."""
+        for unit in ("*a ", "[a](b c ", "x ``", "**x _y "):
+            with self.subTest(unit=unit):
+                start = time.perf_counter()
+                format_inline(unit * 20000)
+                small = time.perf_counter() - start
+                start = time.perf_counter()
+                format_inline(unit * 80000)
+                large = time.perf_counter() - start
+
+                # Four times the input; a quadratic scan would take about sixteen times as long
+                self.assertLess(large, small * 10 + 0.05)
+
+
+class TestInlineBlock(unittest.TestCase):
+    """Test cases for building blocks from Markdown text."""
+
+    def test_plain_text_is_a_plain_block(self):
+        """Test text without markup builds the same compact block as before."""
+        self.assertEqual(inline_block("paragraph", "Just text [ ] here"), Block("paragraph", "Just text [ ] here"))
+
+    def test_formatted_text_keeps_runs_and_attrs(self):
+        """Test formatted text carries its runs before the other attributes."""
+        block = inline_block("to_do", "Ship **it**", (("checked", True),))
+
+        self.assertEqual(block.text, "Ship it")
+        self.assertEqual(block.to_dict(), {"type": "to_do", "to_do": {
+            "rich_text": [
+                {"type": "text", "text": {"content": "Ship "}},
+                {"type": "text", "text": {"content": "it"}, "annotations": {"bold": True}},
+            ],
+            "checked": True,
+        }})
+
+
+if __name__ == '__main__':
+    unittest.main()
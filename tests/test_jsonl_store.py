@@ -0,0 +1,72 @@
+"""Unit tests for JsonlStore."""
+
+import unittest
+from pathlib import Path
+import sys
+import tempfile
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from jsonl_store import JsonlStore
+
+
+class TestJsonlStore(unittest.TestCase):
+    """Test cases for JsonlStore."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "state", "store.jsonl")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.tmpdir.cleanup()
+
+    def test_latest_record_wins_across_instances(self):
+        """Test records are replayed from disk with later lines superseding earlier ones."""
+        store = JsonlStore(self.path)
+        store.put({"source": "a", "value": 1})
+        store.put({"source": "a", "value": 2})
+        store.put({"source": "b", "value": 3})
+
+        reloaded = JsonlStore(self.path)
+
+        self.assertEqual(len(reloaded), 2)
+        self.assertEqual(reloaded.get("a"), {"source": "a", "value": 2})
+
+    def test_removed_record_stays_removed(self):
+        """Test a removal is persisted as a line that drops the record on load."""
+        store = JsonlStore(self.path, fsync=True)
+        store.put({"source": "a", "value": 1})
+        store.remove("a")
+        store.remove("missing")
+
+        self.assertIsNone(JsonlStore(self.path).get("a"))
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+    def test_get_returns_a_copy(self):
+        """Test changing a returned record does not change the store."""
+        store = JsonlStore(self.path)
+        store.put({"source": "a", "value": 1})
+
+        store.get("a")["value"] = 99
+
+        self.assertEqual(store.get("a")["value"], 1)
+
+    def test_stale_lines_are_compacted_on_load(self):
+        """Test loading rewrites a file dominated by superseded lines."""
+        store = JsonlStore(self.path)
+        for i in range(150):
+            store.put({"source": "a", "value": i})
+
+        JsonlStore(self.path)
+
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
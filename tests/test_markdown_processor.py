@@ -1,6 +1,7 @@
 """Unit tests for MarkdownProcessor class."""
 
 import unittest
+from unittest.mock import patch
 import tempfile
 import os
 from pathlib import Path
@@ -9,7 +10,8 @@ import sys
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from markdown_processor import MarkdownProcessor
+import markdown_processor
+from markdown_processor import MarkdownProcessor, split_at_safe_boundaries
 
 
 class TestMarkdownProcessor(unittest.TestCase):
@@ -184,11 +186,100 @@ This paragraph has **bold text**, *italic text*, and `inline code`.
         # Should have paragraphs with rich text
         self.assertGreater(len(paragraph_blocks), 0)
 
+        runs = paragraph_blocks[0]['paragraph']['rich_text']
+        self.assertEqual(runs[1]['annotations'], {'bold': True})
+        self.assertEqual(runs[3]['annotations'], {'italic': True})
+        self.assertEqual(runs[5]['annotations'], {'code': True})
+        self.assertNotIn('**', ''.join(run['text']['content'] for run in runs))
+        link = paragraph_blocks[1]['paragraph']['rich_text'][0]['text']
+        self.assertEqual(link, {'content': 'This is a link', 'link': {'url': 'https://example.com'}})
+
     def test_invalid_file_handling(self):
         """Test handling of non-existent files."""
         with self.assertRaises(FileNotFoundError):
             self.processor.process_file("/nonexistent/file.md")
 
+    def test_iter_blocks_matches_full_parse(self):
+        """Test the streaming parser yields exactly the blocks of a full parse."""
+        content = """
+
+   # Title with leading whitespace
+
+Paragraph line one
+line two
+
+```python
+def f():
+    return 1   
+```
+- Bullet
+1. Numbered
+> Quote
+
+```
+unterminated code   
+
+  """
+        expected, _ = self.processor.parse_markdown_to_blocks(content, "Stream Test")
+
+        from_lines = list(self.processor.iter_blocks(content.split('\n')))
+        from_file_lines = list(self.processor.iter_blocks(
+            line + '\n' for line in content.split('\n')
+        ))
+
+        self.assertEqual(from_lines, expected)
+        self.assertEqual(from_file_lines, expected)
+        self.assertEqual(expected[0]['type'], 'heading_1')
+
+    def test_stream_file(self):
+        """Test streaming a file lazily yields blocks and the filename title."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+            f.write("# Streamed\n\n- a\n- b\n")
+            temp_path = f.name
+
+        try:
+            blocks, title = self.processor.stream_file(temp_path)
+            self.assertEqual(title, Path(temp_path).stem)
+            self.assertEqual(next(blocks)['type'], 'heading_1')
+            self.assertEqual(len(list(blocks)), 2)
+        finally:
+            os.unlink(temp_path)
+
+    def test_stream_file_missing(self):
+        """Test streaming a missing file fails immediately."""
+        with self.assertRaises(FileNotFoundError):
+            self.processor.stream_file("/nonexistent/file.md")
+
+    def test_todo_items(self):
+        """Test '- [ ]' and '- [x]' produce to-do blocks rather than bullets."""
+        content = """- [ ] Open task
+- [x] Done task
+- Plain bullet
+"""
+        blocks, _ = self.processor.parse_markdown_to_blocks(content, "Todo Test")
+
+        self.assertEqual(
+            [block['type'] for block in blocks],
+            ['to_do', 'to_do', 'bulleted_list_item']
+        )
+        self.assertFalse(blocks[0]['to_do']['checked'])
+        self.assertTrue(blocks[1]['to_do']['checked'])
+        self.assertEqual(blocks[1]['to_do']['rich_text'][0]['text']['content'], "Done task")
+
+    def test_lines_that_look_like_markup_are_text(self):
+        """Test near-miss markup such as '#######' or '1.x' stays paragraph text."""
+        content = """####### Too deep
+1.x not a list
+->not a bullet"""
+        blocks, _ = self.processor.parse_markdown_to_blocks(content, "Text Test")
+
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(blocks[0]['type'], 'paragraph')
+        self.assertEqual(
+            blocks[0]['paragraph']['rich_text'][0]['text']['content'],
+            "####### Too deep 1.x not a list ->not a bullet"
+        )
+
     def test_large_content_generation(self):
         """Test generation of many blocks (for testing 100+ block scenarios)."""
         # Generate content that will create many blocks
@@ -216,5 +307,71 @@ This paragraph has **bold text**, *italic text*, and `inline code`.
             self.assertIsInstance(block['type'], str)
 
 
+
+class TestParallelParsing(unittest.TestCase):
+    """Test cases for splitting and parsing large documents in worker processes."""
+
+    CONTENT = "\n\n".join(
+        f"## Part {i}\n\nText {i}\nmore text\n\n```python\nx = {i}\n\ny = {i}\n```\n- [x] Done {i}"
+        for i in range(40)
+    )
+
+    def tearDown(self):
+        """Stop the worker pool started by a test."""
+        markdown_processor._reset_parse_pool()
+
+    def test_split_never_cuts_inside_code_fences(self):
+        """Test every segment holds balanced fences and segments rejoin to the document."""
+        segments = split_at_safe_boundaries(self.CONTENT, 16)
+
+        self.assertGreater(len(segments), 1)
+        for segment in segments:
+            fences = [line for line in segment.split('\n') if line.startswith('```')]
+            self.assertEqual(len(fences) % 2, 0)
+
+        processor = MarkdownProcessor()
+        stitched = [
+            block
+            for segment in segments
+            for block in processor.parse_compact(segment)[0]
+        ]
+        self.assertEqual(stitched, processor.parse_compact(self.CONTENT)[0])
+
+    def test_document_without_safe_boundary_is_one_segment(self):
+        """Test a document that is one long code block is not split."""
+        content = "```\n" + "\n\n".join(f"line {i}" for i in range(100)) + "\n```"
+
+        self.assertEqual(split_at_safe_boundaries(content, 8), [content])
+
+    @patch('markdown_processor.os.cpu_count', return_value=2)
+    def test_parallel_parse_matches_serial(self, _mock_cpu_count):
+        """Test the process pool produces exactly the serial blocks."""
+        serial, _ = MarkdownProcessor().parse_markdown_to_blocks(self.CONTENT)
+
+        parallel, _ = MarkdownProcessor(parallel_threshold=1).parse_markdown_to_blocks(self.CONTENT)
+
+        self.assertEqual(parallel, serial)
+
+    @patch('markdown_processor._get_parse_pool')
+    def test_small_documents_stay_serial(self, mock_get_pool):
+        """Test content below the threshold never starts the pool."""
+        processor = MarkdownProcessor(parallel_threshold=len(self.CONTENT) + 1)
+
+        blocks, _ = processor.parse_compact(self.CONTENT)
+
+        mock_get_pool.assert_not_called()
+        self.assertGreater(len(blocks), 0)
+
+    @patch('markdown_processor.os.cpu_count', return_value=2)
+    @patch('markdown_processor._get_parse_pool')
+    def test_broken_pool_falls_back_to_serial(self, mock_get_pool, _mock_cpu_count):
+        """Test a pool that cannot start does not fail the parse."""
+        mock_get_pool.return_value.map.side_effect = OSError("no processes")
+
+        blocks, _ = MarkdownProcessor(parallel_threshold=1).parse_compact(self.CONTENT)
+
+        self.assertEqual(blocks, MarkdownProcessor().parse_compact(self.CONTENT)[0])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
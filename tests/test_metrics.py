@@ -0,0 +1,108 @@
+"""Unit tests for the metrics registry."""
+
+import unittest
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+import httpx
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from metrics import Histogram, Metrics, endpoint_name
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for Metrics."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.metrics = Metrics()
+
+    def stage(self, name):
+        return self.metrics.snapshot()["histograms"][("stage_seconds", (("stage", name),))]
+
+    def test_endpoint_name_replaces_ids(self):
+        """Test IDs with and without dashes are collapsed into one label value."""
+        self.assertEqual(endpoint_name("/v1/blocks/16132a37-09e4-816c-b512-e4d73d345003/children"),
+                         "blocks/{id}/children")
+        self.assertEqual(endpoint_name("/v1/pages/16132a3709e4816cb512e4d73d345003"), "pages/{id}")
+        self.assertEqual(endpoint_name("/v1/pages"), "pages")
+
+    def test_timer_records_stage(self):
+        """Test a timed block becomes one stage observation."""
+        with self.metrics.timer("parse"):
+            time.sleep(0.01)
+
+        stage = self.stage("parse")
+        self.assertEqual(stage["count"], 1)
+        self.assertGreaterEqual(stage["sum"], 0.01)
+
+    def test_timed_iter_excludes_consumer_time(self):
+        """Test only time spent producing items counts, in one observation."""
+        for _ in self.metrics.timed_iter(range(3), "parse"):
+            time.sleep(0.02)
+
+        stage = self.stage("parse")
+        self.assertEqual(stage["count"], 1)
+        self.assertLess(stage["sum"], 0.02)
+
+    def test_http_hooks_record_api_metrics(self):
+        """Test latency, status counts, 429s and bytes are recorded per endpoint."""
+        statuses = iter([429, 200])
+        transport = httpx.MockTransport(lambda request: httpx.Response(next(statuses), json={}))
+        client = httpx.Client(transport=transport, event_hooks=self.metrics.event_hooks())
+        url = "https://api.notion.com/v1/blocks/16132a3709e4816cb512e4d73d345003/children"
+
+        for _ in range(2):
+            client.patch(url, json={"children": []})
+
+        counters = self.metrics.snapshot()["counters"]
+        labels = (("endpoint", "blocks/{id}/children"), ("method", "PATCH"))
+        self.assertEqual(counters[("api_requests_total", labels + (("status", "429"),))], 1)
+        self.assertEqual(counters[("api_requests_total", labels + (("status", "200"),))], 1)
+        self.assertEqual(counters[("api_rate_limited_total", (("endpoint", "blocks/{id}/children"),))], 1)
+        self.assertEqual(counters[("api_request_bytes_total", (("endpoint", "blocks/{id}/children"),))], 30)
+        self.assertEqual(self.metrics.snapshot()["histograms"][("api_request_seconds", labels)]["count"], 2)
+
+    def test_render_prometheus(self):
+        """Test the text exposition format of counters and histograms."""
+        self.metrics.inc("api_rate_limited_total", (("endpoint", "pages"),))
+        self.metrics.observe("stage_seconds", 0.003, (("stage", "parse"),))
+
+        text = self.metrics.render_prometheus()
+
+        self.assertIn("# TYPE markdown2notion_api_rate_limited_total counter", text)
+        self.assertIn('markdown2notion_api_rate_limited_total{endpoint="pages"} 1\n', text)
+        self.assertIn('markdown2notion_stage_seconds_bucket{stage="parse",le="0.001"} 0\n', text)
+        self.assertIn('markdown2notion_stage_seconds_bucket{stage="parse",le="0.005"} 1\n', text)
+        self.assertIn('markdown2notion_stage_seconds_bucket{stage="parse",le="+Inf"} 1\n', text)
+        self.assertIn('markdown2notion_stage_seconds_count{stage="parse"} 1\n', text)
+
+    def test_changes_are_exported_to_textfile(self):
+        """Test a change schedules a write of the Prometheus text file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "metrics" / "markdown2notion.prom"
+            metrics = Metrics(textfile=str(path), export_interval=0.01)
+
+            metrics.inc("api_rate_limited_total", (("endpoint", "pages"),))
+            deadline = time.monotonic() + 2
+            while not path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            self.assertIn("markdown2notion_api_rate_limited_total", path.read_text(encoding="utf-8"))
+
+    def test_histogram_quantile(self):
+        """Test quantiles are interpolated within buckets."""
+        histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+        for value in (0.05, 0.15, 0.15, 0.3):
+            histogram.observe(value)
+
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.15)
+        self.assertEqual(histogram.quantile(1.0), 0.4)
+
+
+if __name__ == '__main__':
+    unittest.main()
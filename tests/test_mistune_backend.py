@@ -0,0 +1,182 @@
+"""Unit tests for the mistune parser backend and backend selection."""
+
+import unittest
+from unittest.mock import patch
+import os
+import tempfile
+from pathlib import Path
+import sys
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from markdown_processor import MarkdownProcessor, available_backends, get_backend
+from mistune_backend import MistuneBackend
+from parse_cache import ParseCache
+
+
+def text_of(block):
+    return "".join(run["text"]["content"] for run in block[block["type"]]["rich_text"])
+
+
+class TestMistuneBackend(unittest.TestCase):
+    """Test cases for rendering mistune's AST as Notion blocks."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.processor = MarkdownProcessor(backend="mistune")
+
+    def parse(self, content):
+        return self.processor.parse_markdown_to_blocks(content)[0]
+
+    def test_inline_formatting_becomes_annotated_runs(self):
+        """Test bold, italic, strikethrough, code and links keep their formatting."""
+        blocks = self.parse("Plain **bold** *italic* ~~gone~~ `code` [site](https://example.com) &amp; end")
+
+        runs = blocks[0]["paragraph"]["rich_text"]
+        self.assertEqual(runs[1], {"type": "text", "text": {"content": "bold"}, "annotations": {"bold": True}})
+        self.assertEqual(runs[3]["annotations"], {"italic": True})
+        self.assertEqual(runs[5]["annotations"], {"strikethrough": True})
+        self.assertEqual(runs[7]["annotations"], {"code": True})
+        self.assertEqual(runs[9]["text"], {"content": "site", "link": {"url": "https://example.com"}})
+        self.assertEqual(runs[10]["text"]["content"], " & end")
+
+    def test_code_spans_keep_entities(self):
+        """Test entities are decoded in plain text but not inside code spans."""
+        blocks = self.parse("Use `&amp;` for &amp;")
+
+        runs = blocks[0]["paragraph"]["rich_text"]
+        self.assertEqual(runs[1]["text"]["content"], "&amp;")
+        self.assertEqual(runs[1]["annotations"], {"code": True})
+        self.assertEqual(runs[2]["text"]["content"], " for &")
+
+    def test_plain_blocks_match_line_parser(self):
+        """Test unformatted headings, paragraphs and code produce the line parser's dicts."""
+        content = "# Title\n\nFirst line\nsecond line\n\n#### Deep\n\n```python\nx = 1\n```"
+
+        self.assertEqual(self.parse(content), MarkdownProcessor().parse_markdown_to_blocks(content)[0])
+
+    def test_relative_links_stay_plain_text(self):
+        """Test links Notion cannot resolve are kept as their text only."""
+        blocks = self.parse("See [the notes](notes.md) and **[docs](https://docs.example.com)**")
+
+        runs = blocks[0]["paragraph"]["rich_text"]
+        self.assertEqual(runs[0]["text"], {"content": "See the notes and "})
+        self.assertEqual(runs[1]["annotations"], {"bold": True})
+        self.assertEqual(runs[1]["text"]["link"], {"url": "https://docs.example.com"})
+
+    def test_nested_lists_become_children(self):
+        """Test sub-items are nested under their parent item."""
+        blocks = self.parse("- parent\n  - child\n    1. grandchild\n- [x] done")
+
+        self.assertEqual(len(blocks), 2)
+        child = blocks[0]["bulleted_list_item"]["children"][0]
+        self.assertEqual(text_of(child), "child")
+        grandchild = child["bulleted_list_item"]["children"][0]
+        self.assertEqual(grandchild["type"], "numbered_list_item")
+        self.assertEqual(blocks[1]["to_do"]["checked"], True)
+        self.assertEqual(text_of(blocks[1]), "done")
+
+    def test_quote_keeps_following_paragraphs_as_children(self):
+        """Test a multi-paragraph quote is one quote block."""
+        blocks = self.parse("> first\n>\n> second")
+
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(text_of(blocks[0]), "first")
+        self.assertEqual(text_of(blocks[0]["quote"]["children"][0]), "second")
+
+    def test_table_becomes_table_block(self):
+        """Test tables become table blocks with a header row and one cell list per column."""
+        blocks = self.parse("| A | B |\n|---|---|\n| 1 | **2** |\n| 3 | |")
+
+        table = blocks[0]["table"]
+        self.assertEqual(table["table_width"], 2)
+        self.assertTrue(table["has_column_header"])
+        rows = [row["table_row"]["cells"] for row in table["children"]]
+        self.assertEqual(rows[0][0], [{"type": "text", "text": {"content": "A"}}])
+        self.assertEqual(rows[1][1][0]["annotations"], {"bold": True})
+        self.assertEqual(rows[2][1], [])
+
+    def test_long_cell_text_is_split_into_runs(self):
+        """Test a cell longer than Notion's 2,000 character limit becomes several runs."""
+        blocks = self.parse("| A |\n|---|\n| " + "x" * 4500 + " |")
+
+        cell = blocks[0]["table"]["children"][1]["table_row"]["cells"][0]
+        self.assertEqual([len(run["text"]["content"]) for run in cell], [2000, 2000, 500])
+
+    def test_long_tables_are_split_with_repeated_header(self):
+        """Test tables over 100 rows continue in further tables starting with the header."""
+        content = "| H |\n|---|\n" + "\n".join(f"| {i} |" for i in range(150))
+
+        blocks = self.parse(content)
+
+        self.assertEqual(len(blocks), 2)
+        self.assertEqual([len(block["table"]["children"]) for block in blocks], [100, 52])
+        self.assertEqual(blocks[1]["table"]["children"][0], blocks[0]["table"]["children"][0])
+
+    def test_divider_and_indented_code(self):
+        """Test thematic breaks become dividers and indented code is plain text code."""
+        blocks = self.parse("Text\n\n---\n\n    indented")
+
+        self.assertEqual(blocks[1], {"type": "divider", "divider": {}})
+        self.assertEqual(blocks[2]["code"]["language"], "plain text")
+        self.assertEqual(text_of(blocks[2]), "indented")
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test cases for choosing the parser backend."""
+
+    def test_backend_per_call(self):
+        """Test a call can override the processor's backend."""
+        processor = MarkdownProcessor()
+
+        line_blocks = processor.parse_markdown_to_blocks("- a\n  - b")[0]
+        mistune_blocks = processor.parse_markdown_to_blocks("- a\n  - b", backend="mistune")[0]
+
+        self.assertEqual(len(line_blocks), 2)
+        self.assertEqual(len(mistune_blocks), 1)
+
+    def test_backend_from_environment(self):
+        """Test NOTION_MARKDOWN_PARSER sets the default backend."""
+        with patch.dict(os.environ, {"NOTION_MARKDOWN_PARSER": "mistune"}):
+            processor = MarkdownProcessor()
+
+        self.assertEqual(processor.backend, "mistune")
+        self.assertIsInstance(get_backend("mistune"), MistuneBackend)
+        self.assertEqual(available_backends(), ["line", "mistune"])
+
+    def test_unknown_backend_is_rejected(self):
+        """Test an unknown backend name fails early with the available names."""
+        with self.assertRaises(ValueError) as context:
+            MarkdownProcessor(backend="commonmark")
+
+        self.assertIn("line, mistune", str(context.exception))
+
+    def test_cache_entries_are_per_backend(self):
+        """Test the same content parsed by different backends is cached separately."""
+        processor = MarkdownProcessor(cache=ParseCache())
+        content = "- item\n  - sub-item"
+
+        line_blocks = processor.parse_compact(content)[0]
+        mistune_blocks = processor.parse_compact(content, backend="mistune")[0]
+
+        self.assertNotEqual(line_blocks, mistune_blocks)
+        self.assertEqual(processor.parser_version("mistune"), "mistune-3")
+        self.assertNotEqual(processor.parser_version(), processor.parser_version("mistune"))
+
+    def test_process_file_with_backend(self):
+        """Test files are parsed whole by a non-line backend."""
+        processor = MarkdownProcessor(backend="mistune")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "notes.md")
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write("\n> quoted\n> text\n")
+
+            blocks, title = processor.process_file(filepath)
+
+        self.assertEqual(title, "notes")
+        self.assertEqual(blocks, [{"type": "quote", "quote": {"rich_text": [{"type": "text", "text": {"content": "quoted text"}}]}}])
+
+
+if __name__ == '__main__':
+    unittest.main()
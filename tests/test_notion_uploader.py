@@ -1,7 +1,9 @@
 """Unit tests for NotionUploader class."""
 
+import asyncio
+import threading
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from pathlib import Path
 import sys
 import tempfile
@@ -10,7 +12,55 @@ import os
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from notion_uploader import NotionUploader
+from blocks import Block
+from notion_uploader import AsyncNotionUploader, NotionUploader, _NotionUploaderBase
+from metrics import Metrics
+from rate_limiter import RateLimiter
+from upload_journal import UploadJournal
+from upload_manifest import UploadManifest
+
+
+class InMemoryBlocks:
+    """Minimal in-memory stand-in for the Notion blocks endpoints of one page."""
+
+    def __init__(self, page_id, blocks):
+        self.page_id = page_id
+        self.children = [dict(block, id=f"old-{i}") for i, block in enumerate(blocks)]
+        self.counter = 0
+        self.calls = []
+
+    def list(self, block_id, page_size=100, start_cursor=None):
+        self.calls.append("list")
+        start = int(start_cursor or 0)
+        results = self.children[start:start + page_size]
+        has_more = start + page_size < len(self.children)
+        return {"results": results, "has_more": has_more,
+                "next_cursor": str(start + page_size) if has_more else None}
+
+    def append(self, block_id, children, after=None):
+        self.calls.append("append")
+        position = len(self.children)
+        if after:
+            position = [b["id"] for b in self.children].index(after) + 1
+        created = []
+        for block in children:
+            self.counter += 1
+            created.append(dict(block, id=f"new-{self.counter}"))
+        self.children[position:position] = created
+        return {"results": created}
+
+    def delete(self, block_id):
+        self.calls.append("delete")
+        self.children = [b for b in self.children if b["id"] != block_id]
+
+    def update(self, block_id, **body):
+        self.calls.append("update")
+        for block in self.children:
+            if block["id"] == block_id:
+                block.update(body)
+
+    def contents(self):
+        return [{k: v for k, v in b.items() if k != "id"} for b in self.children]
 
 
 class TestNotionUploader(unittest.TestCase):
@@ -25,14 +75,25 @@ class TestNotionUploader(unittest.TestCase):
             
             # Mock environment variables
             with patch.dict('os.environ', {'NOTION_TOKEN': 'test_token'}):
-                self.uploader = NotionUploader()
+                self.uploader = NotionUploader(rate_limiter=RateLimiter(rate=1000, burst=1000))
                 self.mock_client = mock_client
 
     def test_initialization_with_token(self):
         """Test NotionUploader initialization with provided token."""
         with patch('notion_uploader.Client') as mock_client_class:
             uploader = NotionUploader(token="test_token_direct")
-            mock_client_class.assert_called_once_with(auth="test_token_direct")
+            mock_client_class.assert_called_once()
+            self.assertEqual(mock_client_class.call_args.kwargs["auth"], "test_token_direct")
+
+    def test_uploaders_share_connection_pool(self):
+        """Test each uploader gets its own httpx client on the shared transport."""
+        with patch('notion_uploader.Client') as mock_client_class:
+            NotionUploader(token="token_a")
+            NotionUploader(token="token_b")
+
+        first, second = (call.kwargs["client"] for call in mock_client_class.call_args_list)
+        self.assertIsNot(first, second)
+        self.assertIs(first._transport, second._transport)
 
     def test_initialization_without_token_raises_error(self):
         """Test that missing token raises ValueError."""
@@ -43,6 +104,11 @@ class TestNotionUploader(unittest.TestCase):
                 
                 self.assertIn("NOTION_TOKEN is required", str(context.exception))
 
+    def test_base_uploader_is_abstract(self):
+        """Test the shared base cannot be instantiated without a client factory."""
+        with self.assertRaises(TypeError):
+            _NotionUploaderBase(token="test_token")
+
     def test_extract_page_id_from_url_standard_format(self):
         """Test URL parsing for standard Notion URLs."""
         test_cases = [
@@ -150,10 +216,11 @@ class TestNotionUploader(unittest.TestCase):
         # Setup mocks
         mock_processor = Mock()
         mock_processor_class.return_value = mock_processor
-        mock_processor.process_file.return_value = (
-            [{"type": "paragraph", "paragraph": {"rich_text": [{"text": {"content": "test"}}]}}],
+        mock_processor.stream_file_compact.return_value = (
+            iter([Block("paragraph", "test")]),
             "Test Title"
         )
+        self.uploader.processor = mock_processor
         
         mock_page_response = {"id": "new-page-id"}
         self.mock_client.pages.create.return_value = mock_page_response
@@ -170,10 +237,14 @@ class TestNotionUploader(unittest.TestCase):
             )
             
             # Verify file was processed
-            mock_processor.process_file.assert_called_once_with(temp_path)
+            mock_processor.stream_file_compact.assert_called_once_with(temp_path)
             
-            # Verify page was created
+            # Verify page was created with the expanded blocks
             self.mock_client.pages.create.assert_called_once()
+            self.assertEqual(
+                self.mock_client.pages.create.call_args.kwargs["children"],
+                [Block("paragraph", "test").to_dict()]
+            )
             
             self.assertEqual(result, "new-page-id")
             
@@ -186,10 +257,11 @@ class TestNotionUploader(unittest.TestCase):
         # Setup mocks  
         mock_processor = Mock()
         mock_processor_class.return_value = mock_processor
-        mock_processor.parse_markdown_to_blocks.return_value = (
-            [{"type": "paragraph", "paragraph": {"rich_text": [{"text": {"content": "test"}}]}}],
+        mock_processor.parse_compact.return_value = (
+            [Block("paragraph", "test")],
             "Test Title"
         )
+        self.uploader.processor = mock_processor
         
         mock_page_response = {"id": "content-page-id"}
         self.mock_client.pages.create.return_value = mock_page_response
@@ -201,13 +273,60 @@ class TestNotionUploader(unittest.TestCase):
         )
         
         # Verify content was processed
-        mock_processor.parse_markdown_to_blocks.assert_called_once()
+        mock_processor.parse_compact.assert_called_once()
         
         # Verify page was created
         self.mock_client.pages.create.assert_called_once()
         
         self.assertEqual(result, "content-page-id")
 
+    def test_create_page_consumes_blocks_lazily(self):
+        """Test the page is created before the block stream is exhausted."""
+        produced = []
+
+        def block_stream():
+            for i in range(250):
+                produced.append(i)
+                yield {"type": "paragraph", "paragraph": {"rich_text": [{"text": {"content": str(i)}}]}}
+
+        def fake_create(**kwargs):
+            # Only the first chunk has been parsed when the page is created
+            self.assertEqual(len(produced), 100)
+            return {"id": "stream-page"}
+
+        self.mock_client.pages.create.side_effect = fake_create
+
+        result = self.uploader._create_page_with_blocks(
+            block_stream(), "Streamed", parent_page_id="parent-id"
+        )
+
+        self.assertEqual(result, "stream-page")
+        append_sizes = [
+            len(call[1]['children'])
+            for call in self.mock_client.blocks.children.append.call_args_list
+        ]
+        self.assertEqual(append_sizes, [100, 50])
+
+    def test_upload_markdown_file_streams_large_file(self):
+        """Test a file upload sends the same blocks as a full parse."""
+        self.mock_client.pages.create.return_value = {"id": "page-id"}
+        content = "\n\n".join(f"## Section {i}\nText {i}" for i in range(120))
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            self.uploader.upload_markdown_file(temp_path, parent_page_id="parent-id")
+        finally:
+            os.unlink(temp_path)
+
+        sent = list(self.mock_client.pages.create.call_args[1]['children'])
+        for call in self.mock_client.blocks.children.append.call_args_list:
+            sent.extend(call[1]['children'])
+        expected, _ = self.uploader.processor.parse_markdown_to_blocks(content)
+        self.assertEqual(sent, expected)
+
     def test_upload_without_target_raises_error(self):
         """Test that missing target parameters raise ValueError."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
@@ -223,6 +342,250 @@ class TestNotionUploader(unittest.TestCase):
         finally:
             os.unlink(temp_path)
 
+    def _make_vault(self, root):
+        """Create a small directory tree of Markdown files."""
+        files = {
+            "a.md": "# A\nAlpha",
+            "b.md": "# B\nBeta",
+            "notes.txt": "not markdown",
+            "sub/c.md": "# C\nGamma",
+        }
+        for relative, content in files.items():
+            path = Path(root) / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+
+    def test_upload_directory_returns_per_file_results(self):
+        """Test directory upload reports each file and keeps going on failure."""
+        def fake_create(**kwargs):
+            title = kwargs["properties"]["title"]["title"][0]["text"]["content"]
+            if title == "b":
+                raise Exception("boom")
+            return {"id": f"page-{title}"}
+
+        self.mock_client.pages.create.side_effect = fake_create
+
+        with tempfile.TemporaryDirectory() as root:
+            self._make_vault(root)
+            results = self.uploader.upload_directory(
+                root, parent_page_id="parent-id", max_workers=2
+            )
+
+        self.assertEqual(
+            [Path(r["filepath"]).name for r in results], ["a.md", "b.md", "c.md"]
+        )
+        self.assertEqual([r["status"] for r in results], ["uploaded", "failed", "uploaded"])
+        self.assertEqual(results[0]["page_id"], "page-a")
+        self.assertEqual(results[1]["error"], "boom")
+
+    def test_upload_directory_mirror_folders(self):
+        """Test subfolders are recreated as nested parent pages."""
+        def fake_create(**kwargs):
+            title = kwargs["properties"]["title"]["title"][0]["text"]["content"]
+            return {"id": f"page-{title}"}
+
+        self.mock_client.pages.create.side_effect = fake_create
+
+        with tempfile.TemporaryDirectory() as root:
+            self._make_vault(root)
+            self.uploader.upload_directory(
+                root, parent_page_id="parent-id", mirror_folders=True
+            )
+
+        parents = {
+            call[1]["properties"]["title"]["title"][0]["text"]["content"]: call[1]["parent"]
+            for call in self.mock_client.pages.create.call_args_list
+        }
+        self.assertEqual(parents["sub"], {"page_id": "parent-id"})
+        self.assertEqual(parents["c"], {"page_id": "page-sub"})
+        self.assertEqual(parents["a"], {"page_id": "parent-id"})
+
+    def test_upload_directory_invalid_options(self):
+        """Test invalid directory upload options raise errors."""
+        with tempfile.TemporaryDirectory() as root:
+            with self.assertRaises(ValueError):
+                self.uploader.upload_directory(root, parent_page_id="p", max_workers=0)
+            with self.assertRaises(ValueError):
+                self.uploader.upload_directory(root, database_id="db", mirror_folders=True)
+        with self.assertRaises(FileNotFoundError):
+            self.uploader.upload_directory("/nonexistent/vault", parent_page_id="p")
+
+    def test_manifest_skips_unchanged_file(self):
+        """Test an unchanged file is not re-uploaded when a manifest is configured."""
+        self.mock_client.pages.create.return_value = {"id": "page-1"}
+
+        with tempfile.TemporaryDirectory() as root:
+            self.uploader.manifest = UploadManifest(os.path.join(root, "manifest.jsonl"))
+            path = Path(root, "note.md")
+            path.write_text("# Note\nBody", encoding="utf-8")
+
+            first = self.uploader.upload_markdown_file(str(path), parent_page_id="parent-id")
+            second = self.uploader.upload_markdown_file(str(path), parent_page_id="parent-id")
+            self.assertEqual(self.mock_client.pages.create.call_count, 1)
+
+            forced = self.uploader.upload_markdown_file(
+                str(path), parent_page_id="parent-id", force=True
+            )
+            self.assertEqual(self.mock_client.pages.create.call_count, 2)
+
+            path.write_text("# Note\nChanged", encoding="utf-8")
+            self.uploader.upload_markdown_file(str(path), parent_page_id="parent-id")
+            self.assertEqual(self.mock_client.pages.create.call_count, 3)
+
+        self.assertEqual(first, "page-1")
+        self.assertEqual(second, "page-1")
+        self.assertEqual(forced, "page-1")
+
+    def test_resume_requires_journal(self):
+        """Test resume=True without a configured journal is rejected before any API call."""
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root, "note.md")
+            path.write_text("# Note\nBody", encoding="utf-8")
+
+            with self.assertRaises(ValueError):
+                self.uploader.upload_markdown_file(str(path), parent_page_id="parent-id", resume=True)
+
+        self.mock_client.pages.create.assert_not_called()
+
+    def test_upload_directory_reports_skipped_files(self):
+        """Test directory re-runs only upload changed files."""
+        self.mock_client.pages.create.return_value = {"id": "page"}
+
+        with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as state:
+            self._make_vault(root)
+            self.uploader.manifest = UploadManifest(os.path.join(state, "manifest.jsonl"))
+            self.uploader.upload_directory(root, parent_page_id="parent-id", mirror_folders=True)
+            calls_after_first_run = self.mock_client.pages.create.call_count
+
+            Path(root, "a.md").write_text("# A\nEdited", encoding="utf-8")
+            results = self.uploader.upload_directory(
+                root, parent_page_id="parent-id", mirror_folders=True
+            )
+
+        self.assertEqual([r["status"] for r in results], ["uploaded", "skipped", "skipped"])
+        self.assertEqual(self.mock_client.pages.create.call_count, calls_after_first_run + 1)
+
+    def _attach_page(self, markdown):
+        """Back the mock client's blocks endpoints with an in-memory page."""
+        blocks, _ = self.uploader.processor.parse_markdown_to_blocks(markdown)
+        page = InMemoryBlocks("page-id", blocks)
+        self.mock_client.blocks.children.list = page.list
+        self.mock_client.blocks.children.append = page.append
+        self.mock_client.blocks.delete = page.delete
+        self.mock_client.blocks.update = page.update
+        return page
+
+    def test_update_page_applies_minimal_changes(self):
+        """Test a small edit to a large page costs a handful of calls."""
+        original = "\n\n".join(f"Paragraph {i}" for i in range(250))
+        page = self._attach_page(original)
+        edited_parts = [f"Paragraph {i}" for i in range(250)]
+        edited_parts[10] = "Paragraph 10 edited"
+        edited_parts.insert(200, "## New section")
+        del edited_parts[50]
+        edited = "\n\n".join(edited_parts)
+
+        summary = self.uploader.update_page("page-id", edited)
+
+        expected, _ = self.uploader.processor.parse_markdown_to_blocks(edited)
+        self.assertEqual(page.contents(), expected)
+        self.assertEqual(
+            {k: summary[k] for k in ("updated", "deleted", "inserted")},
+            {"updated": 1, "deleted": 1, "inserted": 1},
+        )
+        self.assertEqual(page.calls.count("list"), 3)
+        self.assertEqual(summary["api_calls"], 6)
+
+    def test_update_page_uses_mirror_on_next_update(self):
+        """Test the cached mirror avoids re-fetching the page children."""
+        page = self._attach_page("# Title\n\nBody")
+        self.uploader.update_page("page-id", "# Title\n\nBody v2")
+        page.calls.clear()
+
+        summary = self.uploader.update_page("page-id", "# Title v3\n\nBody v2")
+
+        self.assertEqual(page.calls, ["update"])
+        self.assertEqual(summary["api_calls"], 1)
+        self.assertEqual(page.contents()[0]["heading_1"]["rich_text"][0]["text"]["content"], "Title v3")
+
+    def test_failed_update_does_not_leave_a_stale_mirror(self):
+        """Test a retry after an update failed part way re-reads the page instead of inserting twice."""
+        page = self._attach_page("A\n\nB")
+        self.uploader.update_page("page-id", "A\n\nB\n\nC")
+        real_append = page.append
+        appends = []
+
+        def failing_append(**kwargs):
+            appends.append(kwargs)
+            if len(appends) == 2:
+                raise Exception("Internal server error")
+            return real_append(**kwargs)
+
+        self.mock_client.blocks.children.append = failing_append
+        edited = "A\n\nX\n\nB\n\nY\n\nC\n\nZ"
+        with self.assertRaises(Exception):
+            self.uploader.update_page("page-id", edited)
+
+        self.uploader.update_page("page-id", edited)
+
+        expected, _ = self.uploader.processor.parse_markdown_to_blocks(edited)
+        self.assertEqual(page.contents(), expected)
+
+    def test_update_page_refetches_when_mirror_is_stale(self):
+        """Test a stale mirror falls back to fetching the current children."""
+        page = self._attach_page("First\n\nSecond")
+        self.uploader.update_page("page-id", "First\n\nSecond edited")
+        # Someone deletes a block in Notion behind our back
+        del page.children[1]
+        missing = Exception("Could not find block")
+        missing.status = 404
+        real_update = page.update
+
+        def update(block_id, **body):
+            if block_id not in [b["id"] for b in page.children]:
+                raise missing
+            real_update(block_id, **body)
+
+        self.mock_client.blocks.update = update
+
+        self.uploader.update_page("page-id", "First\n\nSecond edited again")
+
+        expected, _ = self.uploader.processor.parse_markdown_to_blocks("First\n\nSecond edited again")
+        self.assertEqual(page.contents(), expected)
+
+    def test_update_page_packs_inserted_blocks(self):
+        """Test inserted blocks are packed into appends like a new page's blocks."""
+        first = {"type": "paragraph", "paragraph": {"rich_text": [{"type": "text", "text": {"content": "First"}}]}}
+        leaf = {"type": "paragraph", "paragraph": {"rich_text": []}}
+        inner = {"type": "toggle", "toggle": {"rich_text": [], "children": [leaf]}}
+        middle = {"type": "toggle", "toggle": {"rich_text": [], "children": [inner]}}
+        outer = {"type": "toggle", "toggle": {"rich_text": [], "children": [middle]}}
+        paragraphs = [
+            {"type": "paragraph", "paragraph": {"rich_text": [{"type": "text", "text": {"content": f"P {i}"}}]}}
+            for i in range(150)
+        ]
+        self.mock_client.blocks.children.list.return_value = {
+            "results": [dict(first, id="old-0")], "has_more": False
+        }
+        new_ids = (f"new-{i}" for i in range(1, 1000))
+        self.mock_client.blocks.children.append.side_effect = lambda **kwargs: {
+            "results": [{"id": next(new_ids)} for _ in kwargs["children"]]
+        }
+
+        with patch.object(
+            self.uploader.processor, "parse_markdown_to_blocks", return_value=([first] + paragraphs + [outer], "")
+        ):
+            summary = self.uploader.update_page("page-id", "ignored")
+
+        appends = [call.kwargs for call in self.mock_client.blocks.children.append.call_args_list]
+        self.assertEqual(
+            [(a["block_id"], len(a["children"]), a.get("after")) for a in appends],
+            [("page-id", 100, "old-0"), ("page-id", 51, "new-100"), ("new-151", 1, None)],
+        )
+        self.assertEqual(appends[2]["children"], [middle])
+        self.assertEqual(summary["inserted"], 151)
+        self.assertEqual(summary["api_calls"], 4)
+
     def test_list_database_pages(self):
         """Test database page listing."""
         mock_response = {
@@ -253,6 +616,115 @@ class TestNotionUploader(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]["id"], "page1")
 
+    def test_api_calls_go_through_rate_limiter(self):
+        """Test every Notion call of a chunked upload passes the rate limiter."""
+        limiter = Mock(wraps=RateLimiter(rate=1000, burst=1000))
+        self.uploader.rate_limiter = limiter
+        self.mock_client.pages.create.return_value = {"id": "page-id"}
+        blocks = [{"type": "paragraph", "paragraph": {"rich_text": []}}] * 250
+
+        self.uploader._create_page_with_blocks(blocks, "Title", parent_page_id="parent-id")
+
+        self.assertEqual(limiter.call.call_count, 3)
+
+    def test_deferred_children_are_appended_to_new_block(self):
+        """Test children nested too deeply are appended to the block created for them."""
+        self.mock_client.pages.create.return_value = {"id": "page-id"}
+        self.mock_client.blocks.children.append.side_effect = [
+            {"results": [{"id": "outer-id"}]},
+            {"results": [{"id": "middle-id"}]},
+        ]
+        leaf = {"type": "paragraph", "paragraph": {"rich_text": []}}
+        inner = {"type": "toggle", "toggle": {"rich_text": [], "children": [leaf]}}
+        middle = {"type": "toggle", "toggle": {"rich_text": [], "children": [inner]}}
+        outer = {"type": "toggle", "toggle": {"rich_text": [], "children": [middle]}}
+
+        self.uploader._create_page_with_blocks([outer], "Title", parent_page_id="parent-id")
+
+        appends = self.mock_client.blocks.children.append.call_args_list
+        self.assertEqual(self.mock_client.pages.create.call_args[1]["children"], [])
+        self.assertEqual([call[1]["block_id"] for call in appends], ["page-id", "outer-id"])
+        self.assertEqual(appends[1][1]["children"], [middle])
+
+    def test_progress_adds_up_to_plan(self):
+        """Test progress reports one call per request and match plan_upload's totals."""
+        self.mock_client.pages.create.return_value = {"id": "page-id"}
+        self.mock_client.blocks.children.append.return_value = {"results": []}
+        blocks = [{"type": "paragraph", "paragraph": {"rich_text": []}}] * 250
+        reports = []
+
+        self.uploader._create_page_with_blocks(blocks, "Title", parent_page_id="parent-id", progress=reports.append)
+
+        self.assertEqual(reports, [100, 100, 50])
+        self.assertEqual(self.uploader.plan_upload(blocks), (len(reports), sum(reports)))
+
+    def test_plan_callback_matches_progress(self):
+        """Test content and small file uploads are planned once with the totals progress adds up to."""
+        self.mock_client.pages.create.return_value = {"id": "page-id"}
+        self.mock_client.blocks.children.append.return_value = {"results": []}
+        content = "\n\n".join(f"Paragraph {i}" for i in range(250))
+
+        for upload in ("content", "file"):
+            plans, reports = [], []
+            with tempfile.TemporaryDirectory() as root:
+                path = Path(root, "note.md")
+                path.write_text(content, encoding="utf-8")
+                if upload == "content":
+                    self.uploader.upload_markdown_content(
+                        content, "Title", parent_page_id="parent-id",
+                        progress=reports.append, plan=lambda *totals, plans=plans: plans.append(totals)
+                    )
+                else:
+                    self.uploader.upload_markdown_file(
+                        str(path), parent_page_id="parent-id",
+                        progress=reports.append, plan=lambda *totals, plans=plans: plans.append(totals)
+                    )
+            self.assertEqual(plans, [(len(reports), sum(reports))], upload)
+
+    def test_large_file_is_not_planned(self):
+        """Test files over PLAN_MAX_FILE_BYTES are streamed without a plan."""
+        self.mock_client.pages.create.return_value = {"id": "page-id"}
+        plans = []
+
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root, "note.md")
+            path.write_text("# Note\nBody", encoding="utf-8")
+            with patch('notion_uploader.PLAN_MAX_FILE_BYTES', 4):
+                self.uploader.upload_markdown_file(
+                    str(path), parent_page_id="parent-id", plan=lambda *totals, plans=plans: plans.append(totals)
+                )
+
+        self.assertEqual(plans, [])
+        self.mock_client.pages.create.assert_called_once()
+
+    def test_upload_stages_are_timed(self):
+        """Test page creation and every append are recorded as stages."""
+        self.uploader.metrics = Metrics()
+        self.mock_client.pages.create.return_value = {"id": "page-id"}
+        self.mock_client.blocks.children.append.return_value = {"results": []}
+        blocks = [{"type": "paragraph", "paragraph": {"rich_text": []}}] * 250
+
+        self.uploader._create_page_with_blocks(blocks, "Title", parent_page_id="parent-id")
+
+        stages = self.uploader.metrics.snapshot()["histograms"]
+        self.assertEqual(stages[("stage_seconds", (("stage", "create_page"),))]["count"], 1)
+        self.assertEqual(stages[("stage_seconds", (("stage", "append"),))]["count"], 2)
+
+    def test_rate_limited_append_is_retried(self):
+        """Test a 429 on an append is retried instead of failing the upload."""
+        rate_limited = Exception("rate limited")
+        rate_limited.status = 429
+        rate_limited.headers = {"retry-after": "0"}
+        self.uploader.rate_limiter = RateLimiter(rate=1000, burst=1000, base_delay=0.001)
+        self.mock_client.pages.create.return_value = {"id": "page-id"}
+        self.mock_client.blocks.children.append.side_effect = [rate_limited, {"results": []}]
+        blocks = [{"type": "paragraph", "paragraph": {"rich_text": []}}] * 150
+
+        result = self.uploader._create_page_with_blocks(blocks, "Title", parent_page_id="parent-id")
+
+        self.assertEqual(result, "page-id")
+        self.assertEqual(self.mock_client.blocks.children.append.call_count, 2)
+
     def test_get_database_info(self):
         """Test database info retrieval."""
         mock_db_info = {
@@ -267,6 +739,248 @@ class TestNotionUploader(unittest.TestCase):
         self.mock_client.databases.retrieve.assert_called_once_with("test-db-id")
         self.assertEqual(result, mock_db_info)
 
+    def test_metadata_is_cached_until_refreshed_or_invalidated(self):
+        """Test repeated lookups of a database or page hit Notion once."""
+        self.mock_client.databases.retrieve.return_value = {"id": "db-id", "properties": {}}
+        self.mock_client.pages.retrieve.return_value = {"id": "page-id"}
+        
+        self.uploader.get_database_info("db-id")
+        self.uploader.get_database_info("DB-ID")["properties"]["changed"] = {}
+        self.assertEqual(self.uploader.get_database_info("db-id")["properties"], {})
+        self.uploader.get_page_info("page-id")
+        self.uploader.get_page_info("page-id")
+        self.assertEqual(self.mock_client.databases.retrieve.call_count, 1)
+        self.assertEqual(self.mock_client.pages.retrieve.call_count, 1)
+        
+        self.uploader.get_database_info("db-id", refresh=True)
+        self.uploader.invalidate_metadata("page-id")
+        self.uploader.get_page_info("page-id")
+        self.assertEqual(self.mock_client.databases.retrieve.call_count, 2)
+        self.assertEqual(self.mock_client.pages.retrieve.call_count, 2)
+
+    def test_database_pages_use_schema_title_property(self):
+        """Test pages created in a database set its title property, resolved once per TTL."""
+        self.mock_client.databases.retrieve.return_value = {
+            "id": "db-id",
+            "properties": {"Tags": {"type": "multi_select"}, "Name": {"type": "title"}}
+        }
+        self.mock_client.pages.create.return_value = {"id": "new-page"}
+        
+        for title in ("First", "Second"):
+            self.uploader.upload_markdown_content("Text", title, database_id="db-id")
+        
+        self.mock_client.databases.retrieve.assert_called_once_with("db-id")
+        properties = self.mock_client.pages.create.call_args.kwargs["properties"]
+        self.assertEqual(list(properties), ["Name"])
+        self.assertEqual(properties["Name"]["title"][0]["text"]["content"], "Second")
+
+    def test_database_title_property_comes_from_data_source(self):
+        """Test the title property is read from the data source when the database lists none."""
+        self.mock_client.databases.retrieve.return_value = {"id": "db-id", "data_sources": [{"id": "ds-id"}]}
+        self.mock_client.data_sources.retrieve.return_value = {
+            "id": "ds-id", "properties": {"Task": {"type": "title"}}
+        }
+        self.mock_client.pages.create.return_value = {"id": "new-page"}
+        
+        self.uploader.upload_markdown_content("Text", "First", database_id="db-id")
+        self.uploader.invalidate_metadata("db-id")
+        self.uploader.upload_markdown_content("Text", "Second", database_id="db-id")
+        
+        self.mock_client.data_sources.retrieve.assert_called_with("ds-id")
+        self.assertEqual(self.mock_client.data_sources.retrieve.call_count, 2)
+        self.assertEqual(list(self.mock_client.pages.create.call_args.kwargs["properties"]), ["Task"])
+
+    def test_database_without_title_property_is_rejected(self):
+        """Test an unresolvable title property raises instead of guessing one."""
+        self.mock_client.databases.retrieve.return_value = {"id": "db-id", "data_sources": []}
+        
+        with self.assertRaises(ValueError):
+            self.uploader.upload_markdown_content("Text", "Title", database_id="db-id")
+        
+        self.mock_client.databases.retrieve.return_value = {"id": "db-id", "properties": {"Tags": {"type": "multi_select"}}}
+        self.uploader.invalidate_metadata()
+        with self.assertRaises(ValueError):
+            self.uploader.upload_markdown_content("Text", "Title", database_id="db-id")
+        
+        self.mock_client.pages.create.assert_not_called()
+
+
+class TestAsyncNotionUploader(unittest.TestCase):
+    """Test cases for AsyncNotionUploader."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        with patch('notion_uploader.AsyncClient') as mock_client_class:
+            mock_client = Mock()
+            mock_client.pages.create = AsyncMock()
+            mock_client.blocks.children.append = AsyncMock()
+            mock_client.databases.retrieve = AsyncMock()
+            mock_client.aclose = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            with patch.dict('os.environ', {'NOTION_TOKEN': 'test_token'}):
+                self.uploader = AsyncNotionUploader(
+                    rate_limiter=RateLimiter(rate=1000, burst=1000)
+                )
+                self.mock_client = mock_client
+
+    def test_initialization_uses_async_client(self):
+        """Test AsyncNotionUploader builds an AsyncClient with the token."""
+        with patch('notion_uploader.AsyncClient') as mock_client_class:
+            AsyncNotionUploader(token="test_token_direct")
+            mock_client_class.assert_called_once()
+            self.assertEqual(mock_client_class.call_args.kwargs["auth"], "test_token_direct")
+
+    def test_create_page_with_blocks_large_file(self):
+        """Test async page creation splits > 100 blocks into appends."""
+        test_blocks = [
+            {"type": "paragraph", "paragraph": {"rich_text": [{"text": {"content": f"P {i}"}}]}}
+            for i in range(250)
+        ]
+        self.mock_client.pages.create.return_value = {"id": "async-page-id"}
+
+        result = asyncio.run(self.uploader._create_page_with_blocks(
+            blocks=test_blocks,
+            title="Large Async Page",
+            parent_page_id="parent-id"
+        ))
+
+        self.assertEqual(result, "async-page-id")
+        self.assertEqual(len(self.mock_client.pages.create.call_args[1]['children']), 100)
+        append_sizes = [
+            len(call[1]['children'])
+            for call in self.mock_client.blocks.children.append.call_args_list
+        ]
+        self.assertEqual(append_sizes, [100, 50])
+
+    def test_concurrent_uploads_share_client(self):
+        """Test several uploads run concurrently on one event loop and one client."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_create(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"id": kwargs["properties"]["title"]["title"][0]["text"]["content"]}
+
+        self.mock_client.pages.create.side_effect = fake_create
+
+        async def upload_all():
+            return await asyncio.gather(*(
+                self.uploader.upload_markdown_content(
+                    content=f"# Doc {i}\nBody",
+                    title=f"doc-{i}",
+                    parent_page_id="parent-id"
+                )
+                for i in range(5)
+            ))
+
+        results = asyncio.run(upload_all())
+
+        self.assertEqual(results, [f"doc-{i}" for i in range(5)])
+        self.assertGreater(max_in_flight, 1)
+
+    def test_upload_directory_limits_in_flight_uploads(self):
+        """Test async directory upload never exceeds max_workers in flight."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_create(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"id": "page"}
+
+        self.mock_client.pages.create.side_effect = fake_create
+
+        with tempfile.TemporaryDirectory() as root:
+            for i in range(8):
+                Path(root, f"note-{i}.md").write_text(f"# Note {i}", encoding="utf-8")
+            results = asyncio.run(self.uploader.upload_directory(
+                root, parent_page_id="parent-id", max_workers=3
+            ))
+
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(r["status"] == "uploaded" for r in results))
+        self.assertLessEqual(max_in_flight, 3)
+        self.assertGreater(max_in_flight, 1)
+
+    def test_update_page_async(self):
+        """Test async in-place update issues only the required call."""
+        blocks, _ = self.uploader.processor.parse_markdown_to_blocks("A\n\nB\n\nC")
+        page = InMemoryBlocks("page-id", blocks)
+        self.mock_client.blocks.children.list = AsyncMock(side_effect=page.list)
+        self.mock_client.blocks.children.append = AsyncMock(side_effect=page.append)
+        self.mock_client.blocks.delete = AsyncMock(side_effect=page.delete)
+        self.mock_client.blocks.update = AsyncMock(side_effect=page.update)
+
+        summary = asyncio.run(self.uploader.update_page("page-id", "A\n\nC"))
+
+        self.assertEqual(page.calls, ["list", "delete"])
+        self.assertEqual(summary["deleted"], 1)
+
+    def test_database_title_property_async(self):
+        """Test async uploads resolve the title property from the cached schema."""
+        self.mock_client.databases.retrieve.return_value = {"properties": {"Name": {"type": "title"}}}
+        self.mock_client.pages.create.return_value = {"id": "new-page"}
+
+        async def upload_twice():
+            for title in ("First", "Second"):
+                await self.uploader.upload_markdown_content("Text", title, database_id="db-id")
+
+        asyncio.run(upload_twice())
+
+        self.mock_client.databases.retrieve.assert_awaited_once_with("db-id")
+        self.assertIn("Name", self.mock_client.pages.create.call_args.kwargs["properties"])
+
+    def test_manifest_and_journal_io_runs_off_the_event_loop(self):
+        """Test checkpoint lookups and manifest and journal writes run in the executor."""
+        self.mock_client.pages.create.return_value = {"id": "page-1"}
+        threads = {}
+
+        def record_thread(name, func):
+            def wrapper(*args, **kwargs):
+                threads[name] = threading.get_ident()
+                return func(*args, **kwargs)
+            return wrapper
+
+        async def upload(path):
+            threads["loop"] = threading.get_ident()
+            return await self.uploader.upload_markdown_file(str(path), parent_page_id="parent-id", resume=True)
+
+        with tempfile.TemporaryDirectory() as root:
+            self.uploader.manifest = UploadManifest(os.path.join(root, "manifest.jsonl"))
+            self.uploader.journal = UploadJournal(os.path.join(root, "journal.jsonl"))
+            for name in ("_find_checkpoint", "_save_checkpoint", "_record_upload"):
+                setattr(self.uploader, name, record_thread(name, getattr(self.uploader, name)))
+            path = Path(root, "note.md")
+            path.write_text("# Note\nBody", encoding="utf-8")
+
+            self.assertEqual(asyncio.run(upload(path)), "page-1")
+
+        self.assertEqual(set(threads), {"loop", "_find_checkpoint", "_save_checkpoint", "_record_upload"})
+        for name in ("_find_checkpoint", "_save_checkpoint", "_record_upload"):
+            self.assertNotEqual(threads[name], threads["loop"], name)
+
+    def test_upload_without_target_raises_error(self):
+        """Test that missing target parameters raise ValueError."""
+        with self.assertRaises(ValueError):
+            asyncio.run(self.uploader.upload_markdown_content(content="# Test", title="Test"))
+
+    def test_async_context_manager_closes_client(self):
+        """Test that leaving the async context closes the client."""
+        async def use_uploader():
+            async with self.uploader:
+                pass
+
+        asyncio.run(use_uploader())
+        self.mock_client.aclose.assert_awaited_once()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""Unit tests for ParseCache."""
+
+import unittest
+from pathlib import Path
+import sys
+import tempfile
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blocks import Block
+from markdown_processor import MarkdownProcessor
+from parse_cache import ParseCache
+
+
+BLOCKS = [Block("paragraph", "Hi"), Block("code", "x = 1", (("language", "python"),))]
+
+
+class TestParseCache(unittest.TestCase):
+    """Test cases for ParseCache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.tmpdir.cleanup()
+
+    def test_key_depends_on_content_and_parser_version(self):
+        """Test keys change with the content and with the parser version."""
+        key = ParseCache.make_key("# Title", "1")
+
+        self.assertEqual(key, ParseCache.make_key("# Title", "1"))
+        self.assertNotEqual(key, ParseCache.make_key("# Other", "1"))
+        self.assertNotEqual(key, ParseCache.make_key("# Title", "2"))
+
+    def test_hits_return_new_lists(self):
+        """Test modifying a returned list does not change the cached entry."""
+        cache = ParseCache()
+        cache.put("key", BLOCKS, 2)
+
+        first = cache.get("key")
+        first.append(Block("quote", "Added"))
+
+        self.assertEqual(cache.get("key"), BLOCKS)
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the entry limit evicts the least recently used document."""
+        cache = ParseCache(max_entries=2)
+        cache.put("a", BLOCKS, 2)
+        cache.put("b", BLOCKS, 2)
+        cache.get("a")
+        cache.put("c", BLOCKS, 2)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_size_budget_is_enforced(self):
+        """Test entries are evicted to stay within max_chars and oversized ones are skipped."""
+        cache = ParseCache(max_chars=150)
+        cache.put("a", BLOCKS, 100)
+        cache.put("b", BLOCKS, 100)
+        cache.put("huge", BLOCKS, 1000)
+
+        self.assertEqual(cache.stats()["chars"], 100)
+        self.assertIsNone(cache.get("huge"))
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("b"))
+
+    def test_disk_tier_survives_new_instances(self):
+        """Test entries written to disk are found by a fresh cache."""
+        ParseCache(directory=self.tmpdir.name).put("key", BLOCKS, 2)
+
+        cache = ParseCache(directory=self.tmpdir.name)
+
+        self.assertEqual(cache.get("key"), BLOCKS)
+        self.assertEqual(cache.get("key"), BLOCKS)
+        self.assertEqual(cache.stats()["disk_hits"], 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_formatted_blocks_survive_disk_round_trip(self):
+        """Test rich_text runs read from disk equal and hash like freshly parsed blocks."""
+        blocks, _ = MarkdownProcessor().parse_compact("Some **bold** and [a link](https://example.com)\n\n- [x] `done`")
+        ParseCache(directory=self.tmpdir.name).put("key", blocks, 2)
+
+        loaded = ParseCache(directory=self.tmpdir.name).get("key")
+
+        self.assertEqual(loaded, blocks)
+        self.assertEqual([hash(block) for block in loaded], [hash(block) for block in blocks])
+
+    def test_corrupt_disk_entry_is_a_miss(self):
+        """Test a damaged cache file is ignored."""
+        Path(self.tmpdir.name, "key.json").write_text('[{"type": ', encoding='utf-8')
+
+        cache = ParseCache(directory=self.tmpdir.name)
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_processor_skips_parsing_on_hit(self):
+        """Test MarkdownProcessor parses repeated content only once."""
+        cache = ParseCache()
+        processor = MarkdownProcessor(cache=cache)
+        content = "# Title\n\n- [x] Done\n\nText"
+
+        first, _ = processor.parse_markdown_to_blocks(content, "A")
+        processor._iter_compact_from_lines = None  # any further parse would fail
+        second, title = processor.parse_markdown_to_blocks(content, "B")
+
+        self.assertEqual(first, second)
+        self.assertEqual(title, "B")
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(first, MarkdownProcessor().parse_markdown_to_blocks(content)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
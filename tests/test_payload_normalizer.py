@@ -0,0 +1,105 @@
+"""Unit tests for the payload normalizer."""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blocks import Block
+from payload_normalizer import (
+    MAX_RICH_TEXT_BYTES, normalize_block, normalize_blocks, split_rich_text, split_text, utf16_length
+)
+from payload_packer import encoded_size
+
+
+def run_texts(block):
+    return [run["text"]["content"] for run in block[block["type"]]["rich_text"]]
+
+
+class TestPayloadNormalizer(unittest.TestCase):
+    """Test cases for the rich text normalization helpers."""
+
+    def test_utf16_length(self):
+        """Test characters outside the BMP count as two code units."""
+        self.assertEqual(utf16_length("abc"), 3)
+        self.assertEqual(utf16_length("日本語"), 3)
+        self.assertEqual(utf16_length("😀a"), 3)
+
+    def test_split_text_by_utf16_units(self):
+        """Test pieces stay within the limit without splitting surrogate pairs."""
+        text = "😀" * 1500  # 3000 code units
+
+        pieces = split_text(text)
+
+        self.assertEqual("".join(pieces), text)
+        self.assertEqual([utf16_length(piece) for piece in pieces], [2000, 1000])
+
+    def test_split_text_multibyte_bmp(self):
+        """Test Japanese text is split by characters, not bytes."""
+        text = "日本語" * 1000
+
+        self.assertEqual([len(piece) for piece in split_text(text)], [2000, 1000])
+
+    def test_split_rich_text_keeps_formatting(self):
+        """Test split runs keep their annotations and link."""
+        run = {"type": "text", "text": {"content": "x" * 2500, "link": {"url": "https://example.com"}},
+               "annotations": {"bold": True}}
+        short = {"type": "text", "text": {"content": "end"}}
+
+        runs = split_rich_text([run, short])
+
+        self.assertEqual([len(r["text"]["content"]) for r in runs], [2000, 500, 3])
+        self.assertTrue(all(r["text"].get("link") for r in runs[:2]))
+        self.assertEqual(runs[1]["annotations"], {"bold": True})
+
+    def test_fitting_blocks_are_returned_unchanged(self):
+        """Test blocks within the limits are passed through as the same objects."""
+        block = Block("paragraph", "Short").to_dict()
+        compact = Block("paragraph", "Short")
+
+        self.assertIs(normalize_block(block)[0], block)
+        self.assertEqual(list(normalize_blocks([compact])), [compact])
+
+    def test_long_block_is_split_into_runs(self):
+        """Test a long paragraph becomes one block with several runs."""
+        blocks = list(normalize_blocks([Block("paragraph", "a" * 4500)]))
+
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual([len(text) for text in run_texts(blocks[0])], [2000, 2000, 500])
+
+    def test_too_many_runs_continue_in_new_blocks(self):
+        """Test text needing more than 100 runs is continued in blocks of the same type."""
+        code = Block("code", "c" * 250000, (("language", "python"),))
+
+        blocks = normalize_block(code.to_dict())
+
+        self.assertEqual([len(block["code"]["rich_text"]) for block in blocks], [100, 25])
+        self.assertTrue(all(block["code"]["language"] == "python" for block in blocks))
+        self.assertEqual("".join(text for block in blocks for text in run_texts(block)), "c" * 250000)
+
+    def test_multibyte_text_continues_by_encoded_size(self):
+        """Test 100 runs of Japanese text, over 500 KB of JSON, are split by bytes."""
+        code = Block("code", "日本語のコード" * 30000, (("language", "plain text"),))
+
+        blocks = normalize_block(code.to_dict())
+
+        self.assertEqual(len(blocks), 2)
+        self.assertTrue(all(encoded_size(block) <= MAX_RICH_TEXT_BYTES + 1000 for block in blocks))
+        self.assertEqual("".join(text for block in blocks for text in run_texts(block)), "日本語のコード" * 30000)
+
+    def test_nested_children_are_normalized(self):
+        """Test oversized nested children are fixed and stay under their parent."""
+        child = Block("paragraph", "n" * 3000).to_dict()
+        parent = {"type": "toggle", "toggle": {"rich_text": [], "children": [child]}}
+
+        blocks = normalize_block(parent)
+
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual(len(run_texts(blocks[0]["toggle"]["children"][0])), 2)
+        self.assertEqual(len(run_texts(child)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
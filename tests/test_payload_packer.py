@@ -0,0 +1,120 @@
+"""Unit tests for the payload packer."""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blocks import Block
+from payload_packer import PayloadPacker
+
+
+def paragraph(text, children=None):
+    body = {"rich_text": [{"type": "text", "text": {"content": text}}]}
+    if children is not None:
+        body["children"] = children
+    return {"type": "paragraph", "paragraph": body}
+
+
+def toggle(text, children):
+    return {"type": "toggle", "toggle": {"rich_text": [{"type": "text", "text": {"content": text}}],
+                                         "children": children}}
+
+
+class TestPayloadPacker(unittest.TestCase):
+    """Test cases for PayloadPacker."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.packer = PayloadPacker()
+
+    def test_flat_blocks_fill_children_arrays(self):
+        """Test flat blocks are sent 100 per request."""
+        requests = list(self.packer.pack(paragraph(str(i)) for i in range(250)))
+
+        self.assertEqual([len(request["children"]) for request in requests], [100, 100, 50])
+        self.assertTrue(all(not request["deferred"] for request in requests))
+
+    def test_compact_blocks_are_expanded(self):
+        """Test compact blocks are sent as Notion dicts."""
+        request = next(self.packer.pack([Block("heading_1", "Title")]))
+
+        self.assertEqual(request["children"], [Block("heading_1", "Title").to_dict()])
+
+    def test_empty_input_still_creates_page(self):
+        """Test an empty document yields one empty pages.create request."""
+        self.assertEqual(list(self.packer.pack([])), [{"children": [], "deferred": []}])
+        self.assertEqual(list(self.packer.pack([], create=False)), [])
+
+    def test_nested_children_count_towards_block_budget(self):
+        """Test toggles with 99 children each are packed 10 per request."""
+        blocks = [toggle(f"T{i}", [paragraph(str(j)) for j in range(99)]) for i in range(25)]
+
+        requests = list(self.packer.pack(blocks))
+
+        self.assertEqual([len(request["children"]) for request in requests], [10, 10, 5])
+        self.assertEqual(self.packer.count_calls(blocks), 3)
+
+    def test_requests_stay_under_byte_budget(self):
+        """Test large blocks are split across requests by encoded size."""
+        packer = PayloadPacker(max_bytes=10000)
+        blocks = [paragraph("x" * 3000) for _ in range(7)]
+
+        requests = list(packer.pack(blocks))
+
+        self.assertEqual([len(request["children"]) for request in requests], [3, 3, 1])
+
+    def test_block_over_byte_budget_is_rejected(self):
+        """Test a single block too large for any request fails instead of being sent."""
+        packer = PayloadPacker(max_bytes=1000)
+
+        with self.assertRaises(ValueError) as context:
+            list(packer.pack([paragraph("small"), paragraph("x" * 2000)]))
+
+        self.assertIn("paragraph block encodes to", str(context.exception))
+
+    def test_two_levels_of_children_go_in_one_request(self):
+        """Test a block with children and grandchildren is sent whole."""
+        nested = toggle("Outer", [toggle("Inner", [paragraph("Leaf")])])
+        blocks = [paragraph("Intro"), nested, paragraph("Outro")]
+
+        requests = list(self.packer.pack(blocks))
+
+        self.assertEqual(requests, [{"children": blocks, "deferred": []}])
+        self.assertEqual(self.packer.count_calls(blocks), 1)
+
+    def test_too_deep_children_are_deferred(self):
+        """Test children nested beyond two levels are appended after their parent exists."""
+        deep = toggle("Outer", [toggle("Middle", [toggle("Inner", [paragraph("Leaf")])])])
+        blocks = [paragraph("Intro"), deep, paragraph("Outro")]
+
+        requests = list(self.packer.pack(blocks))
+
+        # The create request ends before the deferring block, whose ID it would not return
+        self.assertEqual(requests[0], {"children": [paragraph("Intro")], "deferred": []})
+        self.assertEqual(len(requests), 2)
+        self.assertNotIn("children", requests[1]["children"][0]["toggle"])
+        self.assertEqual(requests[1]["deferred"], [(0, deep["toggle"]["children"])])
+        self.assertEqual(self.packer.count_calls(blocks), 3)
+
+    def test_wide_children_are_deferred(self):
+        """Test a block with more than 100 children is sent without them."""
+        blocks = [toggle("Wide", [paragraph(str(i)) for i in range(150)])]
+
+        requests = list(self.packer.pack(blocks, create=False))
+
+        self.assertEqual(len(requests), 1)
+        index, nested = requests[0]["deferred"][0]
+        self.assertEqual((index, len(nested)), (0, 150))
+        self.assertEqual(self.packer.count_calls(blocks, create=False), 3)
+
+    def test_invalid_limits(self):
+        """Test non-positive limits are rejected."""
+        with self.assertRaises(ValueError):
+            PayloadPacker(max_children=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Unit tests for the profiling hooks."""
+
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import pstats
+import sys
+import tempfile
+import tracemalloc
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from profiling import Profiler, profiled
+
+
+def allocate():
+    return [str(i) * 10 for i in range(10000)]
+
+
+class TestProfiler(unittest.TestCase):
+    """Test cases for Profiler."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name) / "profiles"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def files(self, pattern="*"):
+        return sorted(self.directory.glob(pattern)) if self.directory.exists() else []
+
+    def test_enabled_profile_writes_stats_and_allocations(self):
+        """Test a profiled call leaves a loadable .prof file and an allocation summary."""
+        profiler = Profiler(directory=str(self.directory), enabled=True)
+
+        with profiler.profile("tool.upload_markdown") as path:
+            allocate()
+
+        stats = pstats.Stats(str(path))
+        self.assertTrue(any(func[2] == "allocate" for func in stats.stats))
+        summary = self.files("*.txt")[0].read_text(encoding="utf-8")
+        self.assertTrue(summary.startswith("tool.upload_markdown: "))
+        self.assertIn("test_profiling.py", summary)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_disabled_profiler_writes_nothing(self):
+        """Test nothing is profiled unless enabled or forced."""
+        profiler = Profiler(directory=str(self.directory))
+
+        with profiler.profile("tool.upload_markdown") as path:
+            allocate()
+
+        self.assertIsNone(path)
+        self.assertEqual(self.files(), [])
+
+    def test_sampling_and_force(self):
+        """Test unsampled calls are skipped and forced calls are always profiled."""
+        profiler = Profiler(directory=str(self.directory), enabled=True, sample_rate=0.25, rng=lambda: 0.5)
+
+        with profiler.profile("sampled_out") as skipped:
+            pass
+        with profiler.profile("forced", force=True) as forced:
+            pass
+
+        self.assertIsNone(skipped)
+        self.assertEqual(self.files("*.prof"), [forced])
+
+    def test_nested_calls_are_not_profiled_twice(self):
+        """Test a call inside a profiled call runs unprofiled."""
+        profiler = Profiler(directory=str(self.directory), enabled=True)
+
+        with profiler.profile("outer") as outer:
+            with profiler.profile("inner") as inner:
+                pass
+
+        self.assertIsNone(inner)
+        self.assertEqual(self.files("*.prof"), [outer])
+
+    def test_failing_call_is_still_profiled(self):
+        """Test the profile is written and the exception propagates."""
+        profiler = Profiler(directory=str(self.directory), enabled=True)
+
+        with self.assertRaises(ValueError):
+            with profiler.profile("failing"):
+                raise ValueError("Invalid parent")
+
+        self.assertEqual(len(self.files("*.prof")), 1)
+
+    def test_profiled_decorator_uses_default_profiler(self):
+        """Test decorated functions are profiled by the process-wide profiler."""
+        profiler = Profiler(directory=str(self.directory), enabled=True)
+
+        with patch("profiling.get_default_profiler", return_value=profiler):
+            result = profiled("NotionUploader.upload_markdown_file")(lambda: "page-id")()
+
+        self.assertEqual(result, "page-id")
+        self.assertEqual(len(self.files("*-NotionUploader.upload_markdown_file-*.prof")), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
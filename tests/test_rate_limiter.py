@@ -0,0 +1,154 @@
+"""Unit tests for the rate limiter."""
+
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+from pathlib import Path
+import sys
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from rate_limiter import RateLimiter, TokenBucket, get_default_limiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def rate_limit_error(retry_after=None):
+    """Build an exception shaped like notion_client's APIResponseError for a 429."""
+    error = Exception("Rate limited")
+    error.status = 429
+    error.code = "rate_limited"
+    error.headers = {"retry-after": retry_after} if retry_after is not None else {}
+    return error
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(rate=3.0, capacity=3, clock=self.clock)
+
+    def test_burst_then_steady_rate(self):
+        """Test the burst is free and later calls are spaced at 1/rate."""
+        waits = [self.bucket.reserve() for _ in range(5)]
+
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 1 / 3)
+        self.assertAlmostEqual(waits[4], 2 / 3)
+
+    def test_tokens_refill_over_time(self):
+        """Test tokens come back as the clock advances."""
+        for _ in range(3):
+            self.bucket.reserve()
+
+        self.clock.now += 1.0
+
+        self.assertEqual(self.bucket.reserve(), 0.0)
+
+    def test_pause_delays_all_callers(self):
+        """Test a pause (Retry-After) pushes back every reservation."""
+        self.bucket.pause(2.0)
+
+        self.assertAlmostEqual(self.bucket.reserve(), 2.0)
+
+    def test_invalid_configuration(self):
+        """Test invalid rate or capacity raises ValueError."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(capacity=0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for RateLimiter."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.limiter = RateLimiter(rate=1000, burst=1000, base_delay=0.001, max_retries=3)
+
+    def test_call_returns_result(self):
+        """Test a successful call is passed through."""
+        func = Mock(return_value={"id": "page"})
+
+        result = self.limiter.call(func, 1, key="value")
+
+        self.assertEqual(result, {"id": "page"})
+        func.assert_called_once_with(1, key="value")
+
+    def test_retries_rate_limited_calls(self):
+        """Test HTTP 429 responses are retried until the call succeeds."""
+        func = Mock(side_effect=[rate_limit_error("0"), rate_limit_error(), "ok"])
+
+        self.assertEqual(self.limiter.call(func), "ok")
+        self.assertEqual(func.call_count, 3)
+
+    def test_gives_up_after_max_retries(self):
+        """Test the original error is raised once retries are exhausted."""
+        func = Mock(side_effect=rate_limit_error("0"))
+
+        with self.assertRaises(Exception) as context:
+            self.limiter.call(func)
+
+        self.assertEqual(context.exception.status, 429)
+        self.assertEqual(func.call_count, 4)
+
+    def test_other_errors_are_not_retried(self):
+        """Test non-429 errors propagate immediately."""
+        error = Exception("validation failed")
+        error.status = 400
+        func = Mock(side_effect=error)
+
+        with self.assertRaises(Exception):
+            self.limiter.call(func)
+
+        func.assert_called_once()
+
+    def test_backoff_honors_retry_after(self):
+        """Test Retry-After is a floor for the backoff delay."""
+        limiter = RateLimiter(base_delay=0.5, max_delay=30.0)
+
+        for attempt in range(4):
+            delay = limiter.backoff_delay(rate_limit_error("2"), attempt)
+            self.assertGreaterEqual(delay, 2.0)
+            self.assertLessEqual(delay, 2.0 + 0.5 * 2 ** attempt)
+
+    def test_backoff_is_jittered_exponential(self):
+        """Test backoff without Retry-After stays within the exponential cap."""
+        limiter = RateLimiter(base_delay=0.5, max_delay=4.0)
+
+        with patch('rate_limiter.random.uniform', side_effect=lambda low, high: high):
+            delays = [limiter.backoff_delay(rate_limit_error(), attempt) for attempt in range(5)]
+
+        self.assertEqual(delays, [0.5, 1.0, 2.0, 4.0, 4.0])
+
+    def test_call_async_retries(self):
+        """Test the async path retries 429 responses as well."""
+        attempts = []
+
+        async def endpoint():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise rate_limit_error("0")
+            return "ok"
+
+        self.assertEqual(asyncio.run(self.limiter.call_async(endpoint)), "ok")
+        self.assertEqual(len(attempts), 2)
+
+    def test_default_limiter_is_shared(self):
+        """Test the process-wide limiter is a singleton."""
+        self.assertIs(get_default_limiter(), get_default_limiter())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 """Unit tests for MCP server functions."""
 
+import asyncio
+import threading
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -38,10 +40,10 @@ class TestMCPServer(unittest.TestCase):
             temp_path = f.name
         
         try:
-            result = self.upload_markdown(
+            result = asyncio.run(self.upload_markdown(
                 filepath=temp_path,
                 parent_url="https://notion.so/test-page"
-            )
+            ))
             
             # Verify uploader was called correctly
             mock_uploader.upload_markdown_file.assert_called_once()
@@ -65,10 +67,10 @@ class TestMCPServer(unittest.TestCase):
         mock_uploader.upload_markdown_file.side_effect = FileNotFoundError("File not found")
         mock_get_uploader.return_value = mock_uploader
         
-        result = self.upload_markdown(
+        result = asyncio.run(self.upload_markdown(
             filepath="/nonexistent/file.md",
             parent_url="https://notion.so/test-page"
-        )
+        ))
         
         self.assertIn("Error: File not found", result)
 
@@ -85,10 +87,10 @@ class TestMCPServer(unittest.TestCase):
             temp_path = f.name
         
         try:
-            result = self.upload_markdown(
+            result = asyncio.run(self.upload_markdown(
                 filepath=temp_path,
                 parent_url="invalid-url"
-            )
+            ))
             
             self.assertIn("Error:", result)
             
@@ -104,7 +106,7 @@ class TestMCPServer(unittest.TestCase):
             temp_path = f.name
         
         try:
-            result = self.upload_markdown(filepath=temp_path)
+            result = asyncio.run(self.upload_markdown(filepath=temp_path))
             
             self.assertIn("Error: Either parent_url, database_id, or parent_page_id must be provided", result)
             
@@ -118,11 +120,11 @@ class TestMCPServer(unittest.TestCase):
         mock_uploader.upload_markdown_content.return_value = "content-page-id-456"
         mock_get_uploader.return_value = mock_uploader
         
-        result = self.upload_markdown_content(
+        result = asyncio.run(self.upload_markdown_content(
             content="# Test Content\nSome text",
             title="Test Page",
             parent_url="https://notion.so/test-page"
-        )
+        ))
         
         # Verify uploader was called
         mock_uploader.upload_markdown_content.assert_called_once()
@@ -135,13 +137,93 @@ class TestMCPServer(unittest.TestCase):
     @patch('server.get_uploader')  
     def test_upload_markdown_content_missing_target(self, mock_get_uploader):
         """Test content upload with missing target."""
-        result = self.upload_markdown_content(
+        result = asyncio.run(self.upload_markdown_content(
             content="# Test",
             title="Test"
-        )
+        ))
         
         self.assertIn("Error: Either parent_url, database_id, or parent_page_id must be provided", result)
 
+    @patch('server.get_uploader')
+    def test_upload_directory_workers_are_capped_at_upload_limit(self, mock_get_uploader):
+        """Test a directory upload runs no more files at once than there are upload slots."""
+        import server
+        from server import upload_directory
+
+        mock_uploader = Mock()
+        mock_uploader.upload_directory.return_value = []
+        mock_get_uploader.return_value = mock_uploader
+        server._get_executor()
+
+        with patch('server._max_uploads', 3):
+            asyncio.run(upload_directory(directory="/vault", parent_page_id="parent-id", max_workers=8))
+
+        self.assertEqual(mock_uploader.upload_directory.call_args[1]['max_workers'], 3)
+
+    @patch('server.get_uploader')
+    def test_upload_directory_summary(self, mock_get_uploader):
+        """Test directory upload tool formats the per-file result table."""
+        from server import upload_directory
+
+        mock_uploader = Mock()
+        mock_uploader.upload_directory.return_value = [
+            {"filepath": "/vault/a.md", "status": "uploaded", "page_id": "page-a", "error": None},
+            {"filepath": "/vault/b.md", "status": "failed", "page_id": None, "error": "boom"},
+            {"filepath": "/vault/c.md", "status": "skipped", "page_id": "page-c", "error": None},
+        ]
+        mock_get_uploader.return_value = mock_uploader
+
+        result = asyncio.run(upload_directory(
+            directory="/vault", parent_page_id="parent-id", max_workers=1
+        ))
+
+        call_args = mock_uploader.upload_directory.call_args[1]
+        self.assertEqual(call_args['max_workers'], 1)
+        self.assertIn("Uploaded 1 of 3 files (1 unchanged, 1 failed)", result)
+        self.assertIn("[skipped] /vault/c.md: page-c", result)
+        self.assertIn("[uploaded] /vault/a.md: page-a", result)
+        self.assertIn("[failed] /vault/b.md: boom", result)
+
+    @patch('server.get_uploader')
+    def test_upload_directory_not_found(self, mock_get_uploader):
+        """Test directory upload tool reports a missing directory."""
+        from server import upload_directory
+
+        mock_uploader = Mock()
+        mock_uploader.upload_directory.side_effect = FileNotFoundError("missing")
+        mock_get_uploader.return_value = mock_uploader
+
+        result = asyncio.run(upload_directory(directory="/missing", parent_page_id="parent-id"))
+
+        self.assertIn("Error: Directory not found", result)
+
+    @patch('server.get_uploader')
+    def test_update_page_from_content(self, mock_get_uploader):
+        """Test the update tool diffs content against the target page."""
+        from server import update_page
+
+        mock_uploader = Mock()
+        mock_uploader.update_page.return_value = {
+            "unchanged": 98, "updated": 1, "inserted": 1, "deleted": 0, "api_calls": 3
+        }
+        mock_get_uploader.return_value = mock_uploader
+
+        result = asyncio.run(update_page(page_id="page-id", content="# New"))
+
+        mock_uploader.update_page.assert_called_once_with("page-id", "# New")
+        self.assertIn("1 updated, 1 inserted, 0 deleted, 98 unchanged (3 API calls)", result)
+
+    @patch('server.get_uploader')
+    def test_update_page_requires_single_source(self, mock_get_uploader):
+        """Test the update tool rejects ambiguous or missing content."""
+        from server import update_page
+
+        mock_get_uploader.return_value = Mock()
+
+        self.assertIn("Error:", asyncio.run(update_page(page_id="page-id")))
+        self.assertIn("Error:", asyncio.run(update_page(page_id="page-id", filepath="a.md", content="x")))
+        self.assertIn("Error:", asyncio.run(update_page(content="x")))
+
     def test_get_uploader_initialization(self):
         """Test uploader initialization and caching."""
         # Clear any existing global uploader
@@ -163,6 +245,29 @@ class TestMCPServer(unittest.TestCase):
                 
                 self.assertEqual(result1, result2)
 
+    def test_get_uploader_concurrent_first_calls(self):
+        """Test concurrent first calls create a single uploader."""
+        import server
+        import threading
+        import time
+        server.uploader = None
+        
+        def slow_uploader():
+            time.sleep(0.05)
+            return Mock()
+        
+        with patch('server.NotionUploader', side_effect=slow_uploader) as mock_uploader_class:
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(self.get_uploader())) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        mock_uploader_class.assert_called_once()
+        self.assertEqual(len({id(result) for result in results}), 1)
+        server.uploader = None
+
     @patch('server.get_uploader')
     def test_notion_api_error_handling(self, mock_get_uploader):
         """Test handling of Notion API errors."""
@@ -176,10 +281,10 @@ class TestMCPServer(unittest.TestCase):
             temp_path = f.name
         
         try:
-            result = self.upload_markdown(
+            result = asyncio.run(self.upload_markdown(
                 filepath=temp_path,
                 parent_url="https://notion.so/test-page"
-            )
+            ))
             
             self.assertIn("Error uploading markdown:", result)
             self.assertIn("Notion API error", result)
@@ -208,10 +313,10 @@ class TestMCPServer(unittest.TestCase):
                 temp_path = f.name
             
             try:
-                result = upload_markdown(
+                result = asyncio.run(upload_markdown(
                     filepath=temp_path,
                     parent_url=test_url
-                )
+                ))
                 
                 # Verify URL extraction was called
                 mock_uploader.extract_page_id_from_url.assert_called_once_with(test_url)
@@ -224,6 +329,330 @@ class TestMCPServer(unittest.TestCase):
                 os.unlink(temp_path)
 
 
+class TestToolConcurrency(unittest.TestCase):
+    """Test tool calls run concurrently without blocking the event loop."""
+
+    def setUp(self):
+        """Start each test with a fresh tool executor."""
+        import server
+        self.server = server
+        server._executor = None
+
+    def tearDown(self):
+        """Shut down the executor created by the test."""
+        if self.server._executor is not None:
+            self.server._executor.shutdown(wait=True)
+        self.server._executor = None
+
+    @patch('server.get_uploader')
+    def test_read_tools_run_during_upload(self, mock_get_uploader):
+        """Test a read-only tool answers while an upload is still running."""
+        import threading
+        release = threading.Event()
+        mock_uploader = Mock()
+        mock_uploader.upload_markdown_content.side_effect = lambda **kwargs: release.wait(5) and "page-id"
+        mock_uploader.list_database_pages.return_value = []
+        mock_get_uploader.return_value = mock_uploader
+        
+        async def scenario():
+            upload = asyncio.ensure_future(self.server.upload_markdown_content(
+                content="# Big", title="Big", parent_page_id="parent-id"
+            ))
+            listing = await asyncio.wait_for(self.server.list_database_pages("db-id"), timeout=2)
+            self.assertFalse(upload.done())
+            release.set()
+            return listing, await upload
+        
+        listing, uploaded = asyncio.run(scenario())
+        
+        self.assertIn("No pages found", listing)
+        self.assertIn("Successfully uploaded", uploaded)
+
+    @patch('server.get_uploader')
+    def test_list_database_pages_finds_title_property(self, mock_get_uploader):
+        """Test page titles are read from whichever property has the title type."""
+        mock_uploader = Mock()
+        mock_uploader.list_database_pages.return_value = [{
+            "id": "page-id",
+            "properties": {
+                "Tags": {"type": "multi_select", "multi_select": []},
+                "Name": {"type": "title", "title": [{"plain_text": "Roadmap"}]},
+            },
+        }]
+        mock_get_uploader.return_value = mock_uploader
+        
+        listing = asyncio.run(self.server.list_database_pages("db-id"))
+        
+        self.assertIn("- Roadmap (ID: page-id)", listing)
+
+    @patch('server.get_uploader')
+    def test_concurrent_uploads_are_capped(self, mock_get_uploader):
+        """Test no more than NOTION_MAX_CONCURRENT_UPLOADS uploads run at once."""
+        import threading
+        import time
+        lock = threading.Lock()
+        active = []
+        peak = []
+        
+        def slow_upload(**kwargs):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return "page-id"
+        
+        mock_uploader = Mock()
+        mock_uploader.upload_markdown_content.side_effect = slow_upload
+        mock_get_uploader.return_value = mock_uploader
+        
+        async def scenario():
+            return await asyncio.gather(*(
+                self.server.upload_markdown_content(content="x", title=f"t{i}", parent_page_id="parent-id")
+                for i in range(4)
+            ))
+        
+        with patch.dict('os.environ', {'NOTION_MAX_CONCURRENT_UPLOADS': '2'}):
+            results = asyncio.run(scenario())
+        
+        self.assertEqual(len(results), 4)
+        self.assertEqual(max(peak), 2)
+
+    @patch('server.get_uploader')
+    def test_background_jobs_count_towards_upload_limit(self, mock_get_uploader):
+        """Test a foreground upload waits while a background job holds the only upload slot."""
+        import threading
+        from upload_jobs import UploadJobManager
+        slots = threading.BoundedSemaphore(1)
+        manager = UploadJobManager(max_workers=1, slots=slots)
+        started = threading.Event()
+        release = threading.Event()
+        order = []
+        
+        def upload(**kwargs):
+            if kwargs["title"] == "job":
+                started.set()
+                release.wait(5)
+            order.append(kwargs["title"])
+            return "page-id"
+        
+        mock_uploader = Mock()
+        mock_uploader.upload_markdown_content.side_effect = upload
+        mock_get_uploader.return_value = mock_uploader
+        
+        async def scenario():
+            await self.server.upload_markdown_content(
+                content="x", title="job", parent_page_id="parent-id", background=True
+            )
+            self.assertTrue(await asyncio.get_running_loop().run_in_executor(None, started.wait, 5))
+            foreground = asyncio.ensure_future(self.server.upload_markdown_content(
+                content="x", title="foreground", parent_page_id="parent-id"
+            ))
+            await asyncio.sleep(0.1)
+            self.assertFalse(foreground.done())
+            release.set()
+            return await foreground
+        
+        with patch('server.get_upload_slots', return_value=slots), \
+                patch('server.get_default_job_manager', return_value=manager):
+            result = asyncio.run(scenario())
+        manager.shutdown()
+        
+        self.assertIn("Successfully uploaded", result)
+        self.assertEqual(order, ["job", "foreground"])
+
+    @patch('server.get_uploader')
+    def test_profile_argument_profiles_tool_call(self, mock_get_uploader):
+        """Test profile=True writes a profile of that call only."""
+        from profiling import Profiler
+        mock_uploader = Mock()
+        mock_uploader.upload_markdown_content.return_value = "page-id"
+        mock_get_uploader.return_value = mock_uploader
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            profiler = Profiler(directory=temp_dir)
+            with patch('server.get_default_profiler', return_value=profiler):
+                asyncio.run(self.server.upload_markdown_content(content="x", title="t", parent_page_id="parent-id"))
+                result = asyncio.run(self.server.upload_markdown_content(
+                    content="x", title="t", parent_page_id="parent-id", profile=True
+                ))
+            
+            self.assertIn("Successfully uploaded", result)
+            self.assertEqual(len(list(Path(temp_dir).glob("*-tool.upload_markdown_content-*.prof"))), 1)
+
+
+class TestBackgroundUploads(unittest.TestCase):
+    """Test background upload jobs and the job-status tools."""
+
+    def setUp(self):
+        """Use a private job manager for each test."""
+        from upload_jobs import UploadJobManager
+        import server
+        self.server = server
+        self.manager = UploadJobManager(max_workers=1)
+        patcher = patch('server.get_default_job_manager', return_value=self.manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('server.get_uploader')
+    def test_background_upload_reports_progress(self, mock_get_uploader):
+        """Test background mode returns a job ID and the status shows the page URL."""
+        def upload(**kwargs):
+            kwargs["progress"](100)
+            kwargs["progress"](50)
+            return "page-id-123"
+        
+        mock_uploader = Mock()
+        mock_uploader.upload_markdown_file.side_effect = upload
+        mock_get_uploader.return_value = mock_uploader
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+            f.write("# Notes")
+        try:
+            started = asyncio.run(self.server.upload_markdown(
+                filepath=f.name, parent_page_id="parent-id", background=True
+            ))
+            self.manager.shutdown()
+        finally:
+            os.unlink(f.name)
+        
+        job_id = started.split("Job ID: ")[1].split("\n")[0]
+        status = self.server.get_upload_status(job_id)
+        self.assertIn("succeeded", status)
+        self.assertIn("150 blocks sent in 2 API calls", status)
+        mock_uploader.processor.stream_file_compact.assert_not_called()
+        mock_uploader.plan_upload.assert_not_called()
+        self.assertIn("https://www.notion.so/pageid123", status)
+        self.assertIn(job_id, self.server.list_upload_jobs())
+
+    @patch('server.get_uploader')
+    def test_planned_background_upload_counts_chunks_down(self, mock_get_uploader):
+        """Test a planned job's chunks_remaining counts down to 0 as calls are confirmed."""
+        remaining = []
+        
+        def upload(**kwargs):
+            job = kwargs["plan"].__self__
+            kwargs["plan"](3, 250)
+            remaining.append(job.snapshot()["chunks_remaining"])
+            for blocks in (100, 100, 50):
+                kwargs["progress"](blocks)
+                remaining.append(job.snapshot()["chunks_remaining"])
+            return "page-id-123"
+        
+        mock_uploader = Mock()
+        mock_uploader.upload_markdown_content.side_effect = upload
+        mock_get_uploader.return_value = mock_uploader
+        
+        started = asyncio.run(self.server.upload_markdown_content(
+            content="# Big", title="Title", parent_page_id="parent-id", background=True
+        ))
+        self.manager.shutdown()
+        
+        job_id = started.split("Job ID: ")[1].split("\n")[0]
+        self.assertEqual(remaining, [3, 2, 1, 0])
+        self.assertIn("250/250 blocks sent, 0 of 3 chunks remaining", self.server.get_upload_status(job_id))
+
+    @patch('server.get_uploader')
+    def test_background_upload_failure_is_reported(self, mock_get_uploader):
+        """Test a failed background upload shows its error."""
+        mock_uploader = Mock()
+        mock_uploader.upload_markdown_content.side_effect = Exception("API error")
+        mock_get_uploader.return_value = mock_uploader
+        
+        started = asyncio.run(self.server.upload_markdown_content(
+            content="# x", title="Title", parent_page_id="parent-id", background=True
+        ))
+        self.manager.shutdown()
+        
+        job_id = started.split("Job ID: ")[1].split("\n")[0]
+        self.assertIn("Error: API error", self.server.get_upload_status(job_id))
+
+    def test_unknown_job(self):
+        """Test status queries for unknown jobs."""
+        self.assertIn("Unknown upload job", self.server.get_upload_status("missing"))
+        self.assertEqual(self.server.list_upload_jobs(), "No upload jobs")
+
+
+class TestProgressNotifications(unittest.TestCase):
+    """Test MCP progress notifications sent while a tool uploads."""
+
+    @patch('server.get_uploader')
+    def test_upload_reports_create_and_chunks(self, mock_get_uploader):
+        """Test a client sees page creation and every appended chunk, without parsing twice."""
+        from fastmcp import Client
+        import server
+        
+        def upload(**kwargs):
+            for blocks in (100, 100, 50):
+                kwargs["progress"](blocks)
+            return "page-id"
+        
+        mock_uploader = Mock()
+        mock_uploader.upload_markdown_content.side_effect = upload
+        mock_get_uploader.return_value = mock_uploader
+        events = []
+        
+        async def on_progress(progress, total, message):
+            events.append((progress, total, message))
+        
+        async def scenario():
+            async with Client(server.mcp) as client:
+                return await client.call_tool(
+                    "upload_markdown_content",
+                    {"content": "# Big", "title": "Title", "parent_page_id": "parent-id"},
+                    progress_handler=on_progress
+                )
+        
+        result = asyncio.run(scenario())
+        
+        self.assertIn("Successfully uploaded", result.content[0].text)
+        self.assertEqual(events, [
+            (1, None, "Page created with 100 blocks"),
+            (2, None, "Appended chunk 1 (200 blocks sent)"),
+            (3, None, "Appended chunk 2 (250 blocks sent)"),
+        ])
+        mock_uploader.processor.parse_compact.assert_not_called()
+        mock_uploader.plan_upload.assert_not_called()
+
+    @patch('server.get_uploader')
+    def test_upload_reports_parsing_and_chunk_totals(self, mock_get_uploader):
+        """Test a planned upload reports parsing and "chunk k of n" totals."""
+        from fastmcp import Client
+        import server
+        
+        def upload(**kwargs):
+            kwargs["plan"](3, 250)
+            for blocks in (100, 100, 50):
+                kwargs["progress"](blocks)
+            return "page-id"
+        
+        mock_uploader = Mock()
+        mock_uploader.upload_markdown_content.side_effect = upload
+        mock_get_uploader.return_value = mock_uploader
+        events = []
+        
+        async def on_progress(progress, total, message):
+            events.append((progress, total, message))
+        
+        async def scenario():
+            async with Client(server.mcp) as client:
+                return await client.call_tool(
+                    "upload_markdown_content",
+                    {"content": "# Big", "title": "Title", "parent_page_id": "parent-id"},
+                    progress_handler=on_progress
+                )
+        
+        asyncio.run(scenario())
+        
+        self.assertEqual(events, [
+            (0, 3, "Parsed 250 blocks; uploading in 3 API calls"),
+            (1, 3, "Page created with 100 blocks"),
+            (2, 3, "Appended chunk 1 of 2"),
+            (3, 3, "Appended chunk 2 of 2"),
+        ])
+
+
 class TestServerEnvironment(unittest.TestCase):
     """Test server environment and configuration."""
     
@@ -234,11 +663,15 @@ class TestServerEnvironment(unittest.TestCase):
         # Test with missing token
         with patch.dict('os.environ', {}, clear=True):
             with patch('sys.stderr') as mock_stderr:
-                with patch('server.mcp.run') as mock_run:
+                with patch('server.mcp.run') as mock_run, patch('server.warm_up') as mock_warm_up:
                     main()
+                    for thread in threading.enumerate():
+                        if thread.name == "notion-warm-up":
+                            thread.join(timeout=10)
                     
                     # Should run despite warning
                     mock_run.assert_called_once_with(transport="stdio")
+                    mock_warm_up.assert_called_once_with()
 
     def test_server_imports(self):
         """Test that all server imports work correctly."""
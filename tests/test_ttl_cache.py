@@ -0,0 +1,85 @@
+"""Unit tests for TTLCache."""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for TTLCache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.cache = TTLCache(ttl=10, max_entries=2, clock=self.clock)
+
+    def test_entries_expire_after_ttl(self):
+        """Test an entry is served until its TTL has passed."""
+        self.cache.put("a", {"id": "a"})
+
+        self.clock.now = 9.9
+        self.assertEqual(self.cache.get("a"), {"id": "a"})
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.stats(), {
+            "hits": 1, "misses": 1, "expirations": 1, "evictions": 0, "entries": 0
+        })
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the size bound evicts the entry read least recently."""
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.get("a")
+        self.cache.put("c", 3)
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_values_are_copied(self):
+        """Test changing a returned or stored value does not change the cached entry."""
+        value = {"properties": {"Name": {"type": "title"}}}
+        self.cache.put("db", value)
+        value["properties"].clear()
+        self.cache.get("db")["properties"].clear()
+
+        self.assertEqual(self.cache.get("db"), {"properties": {"Name": {"type": "title"}}})
+
+    def test_invalidate_and_clear(self):
+        """Test entries can be dropped one at a time or all at once."""
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+
+        self.assertTrue(self.cache.invalidate("a"))
+        self.assertFalse(self.cache.invalidate("a"))
+        self.assertEqual(len(self.cache), 1)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_zero_ttl_disables_caching(self):
+        """Test a TTL of zero stores nothing."""
+        cache = TTLCache(ttl=0)
+        cache.put("a", 1)
+
+        self.assertIsNone(cache.get("a"))
+        with self.assertRaises(ValueError):
+            TTLCache(max_entries=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Unit tests for background upload jobs."""
+
+import unittest
+from pathlib import Path
+import sys
+import threading
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from upload_jobs import FAILED, QUEUED, RUNNING, SUCCEEDED, UploadJob, UploadJobManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestUploadJob(unittest.TestCase):
+    """Test cases for UploadJob."""
+
+    def test_progress_and_throughput(self):
+        """Test recorded calls add up against the plan and give a block rate."""
+        clock = FakeClock()
+        job = UploadJob("'notes.md'", clock=clock)
+        self.assertEqual(job.snapshot()["status"], QUEUED)
+
+        job._set_status(RUNNING)
+        job.plan(calls=3, blocks=250)
+        job.record(100)
+        job.record(100)
+        clock.now += 4.0
+
+        state = job.snapshot()
+        self.assertEqual((state["blocks_sent"], state["blocks_total"]), (200, 250))
+        self.assertEqual(state["chunks_remaining"], 1)
+        self.assertEqual(state["blocks_per_second"], 50.0)
+
+    def test_unplanned_job_has_no_remaining_chunks(self):
+        """Test chunks remaining stays unknown until the job is planned."""
+        job = UploadJob("content 'x'")
+
+        self.assertIsNone(job.snapshot()["chunks_remaining"])
+
+
+class TestUploadJobManager(unittest.TestCase):
+    """Test cases for UploadJobManager."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.manager = UploadJobManager(max_workers=2, max_finished=2)
+
+    def tearDown(self):
+        """Stop the worker pool."""
+        self.manager.shutdown()
+
+    def test_submit_returns_before_job_finishes(self):
+        """Test a job runs in the background and reports its page ID."""
+        release = threading.Event()
+
+        def run(job):
+            job.plan(1, 10)
+            release.wait(5)
+            job.record(10)
+            return "page-id"
+
+        job = self.manager.submit("'big.md'", run)
+        self.assertFalse(job.finished)
+        release.set()
+        self.manager.shutdown()
+
+        state = self.manager.get(job.id).snapshot()
+        self.assertEqual(state["status"], SUCCEEDED)
+        self.assertEqual((state["page_id"], state["chunks_remaining"]), ("page-id", 0))
+
+    def test_failure_is_recorded(self):
+        """Test an exception in the job body marks the job as failed."""
+        def run(job):
+            raise ValueError("Invalid parent")
+
+        job = self.manager.submit("'bad.md'", run)
+        self.manager.shutdown()
+
+        self.assertEqual(job.status, FAILED)
+        self.assertEqual(job.error, "Invalid parent")
+
+    def test_jobs_wait_for_a_shared_upload_slot(self):
+        """Test a job stays queued while another upload holds the only slot."""
+        slots = threading.BoundedSemaphore(1)
+        manager = UploadJobManager(max_workers=2, slots=slots)
+        slots.acquire()
+
+        job = manager.submit("'queued.md'", lambda job: "page-id")
+        self.assertFalse(job.finished)
+        self.assertEqual(job.status, QUEUED)
+        slots.release()
+        manager.shutdown()
+
+        self.assertEqual(job.status, SUCCEEDED)
+
+    def test_oldest_finished_jobs_are_forgotten(self):
+        """Test only max_finished finished jobs are kept."""
+        manager = UploadJobManager(max_workers=1, max_finished=2)
+        jobs = [manager.submit(f"'{i}.md'", lambda job: "page-id") for i in range(4)]
+        manager.shutdown()
+
+        self.assertEqual(len(manager.jobs()), 2)
+        self.assertIsNone(manager.get(jobs[0].id))
+        self.assertIsNotNone(manager.get(jobs[3].id))
+
+
+if __name__ == '__main__':
+    unittest.main()
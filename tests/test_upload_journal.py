@@ -0,0 +1,86 @@
+"""Unit tests for UploadJournal."""
+
+import unittest
+from pathlib import Path
+import sys
+import tempfile
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from upload_journal import UploadJournal
+from upload_manifest import UploadManifest
+
+
+class TestUploadJournal(unittest.TestCase):
+    """Test cases for UploadJournal."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.tmpdir.name, "state", "journal.jsonl")
+        self.source = os.path.join(self.tmpdir.name, "note.md")
+        Path(self.source).write_text("# Note", encoding="utf-8")
+        self.target = UploadManifest.target_key(parent_page_id="parent-id")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.tmpdir.cleanup()
+
+    def test_lookup_requires_matching_hash_version_and_target(self):
+        """Test a checkpoint only resumes the same content, parser version and target."""
+        journal = UploadJournal(self.journal_path)
+        journal.checkpoint(self.source, "hash-1", "1", self.target, "page-1", 100, None)
+
+        checkpoint = journal.lookup(self.source, "hash-1", "1", self.target)
+        self.assertEqual((checkpoint["page_id"], checkpoint["blocks_done"]), ("page-1", 100))
+        self.assertIsNone(journal.lookup(self.source, "hash-2", "1", self.target))
+        self.assertIsNone(journal.lookup(self.source, "hash-1", "2", self.target))
+        self.assertIsNone(journal.lookup(self.source, "hash-1", "1", "page:other"))
+
+    def test_checkpoints_persist_across_instances(self):
+        """Test the latest checkpoint is reloaded from disk."""
+        journal = UploadJournal(self.journal_path)
+        journal.checkpoint(self.source, "hash-1", "1", self.target, "page-1", 100, None)
+        journal.checkpoint(self.source, "hash-1", "1", self.target, "page-1", 200, "block-200")
+
+        reloaded = UploadJournal(self.journal_path).lookup(self.source, "hash-1", "1", self.target)
+
+        self.assertEqual(reloaded["blocks_done"], 200)
+        self.assertEqual(reloaded["tail_block_id"], "block-200")
+
+    def test_finished_uploads_are_forgotten(self):
+        """Test finish removes the checkpoint, also after a reload."""
+        journal = UploadJournal(self.journal_path)
+        journal.checkpoint(self.source, "hash-1", "1", self.target, "page-1", 100, None)
+        journal.finish(self.source)
+
+        self.assertEqual(len(journal), 0)
+        self.assertEqual(len(UploadJournal(self.journal_path)), 0)
+
+    def test_torn_line_is_ignored(self):
+        """Test a partially written last line does not break loading."""
+        journal = UploadJournal(self.journal_path)
+        journal.checkpoint(self.source, "hash-1", "1", self.target, "page-1", 100, None)
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"source": "trunc')
+
+        reloaded = UploadJournal(self.journal_path)
+
+        self.assertEqual(reloaded.lookup(self.source, "hash-1", "1", self.target)["page_id"], "page-1")
+
+    def test_superseded_lines_are_compacted(self):
+        """Test a journal with many stale lines is rewritten on load."""
+        journal = UploadJournal(self.journal_path)
+        for i in range(150):
+            journal.checkpoint(self.source, "hash-1", "1", self.target, "page-1", i, f"block-{i}")
+
+        UploadJournal(self.journal_path)
+
+        with open(self.journal_path, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
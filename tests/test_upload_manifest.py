@@ -0,0 +1,85 @@
+"""Unit tests for UploadManifest."""
+
+import unittest
+from pathlib import Path
+import sys
+import tempfile
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from upload_manifest import UploadManifest
+
+
+class TestUploadManifest(unittest.TestCase):
+    """Test cases for UploadManifest."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.tmpdir.name, "state", "manifest.jsonl")
+        self.source = os.path.join(self.tmpdir.name, "note.md")
+        Path(self.source).write_text("# Note", encoding="utf-8")
+        self.target = UploadManifest.target_key(parent_page_id="parent-id")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.tmpdir.cleanup()
+
+    def test_hash_file_matches_content(self):
+        """Test file hashes change with content."""
+        first = UploadManifest.hash_file(self.source)
+        Path(self.source).write_text("# Changed", encoding="utf-8")
+
+        self.assertNotEqual(first, UploadManifest.hash_file(self.source))
+        self.assertEqual(len(first), 64)
+
+    def test_lookup_requires_matching_hash_version_and_target(self):
+        """Test a record only matches the same content, parser version and target."""
+        manifest = UploadManifest(self.manifest_path)
+        manifest.record(self.source, "hash-1", "1", self.target, "page-1")
+
+        self.assertEqual(manifest.lookup(self.source, "hash-1", "1", self.target), "page-1")
+        self.assertIsNone(manifest.lookup(self.source, "hash-2", "1", self.target))
+        self.assertIsNone(manifest.lookup(self.source, "hash-1", "2", self.target))
+        self.assertIsNone(manifest.lookup(
+            self.source, "hash-1", "1", UploadManifest.target_key(database_id="db")
+        ))
+
+    def test_records_persist_across_instances(self):
+        """Test the manifest is reloaded from disk with the latest record winning."""
+        manifest = UploadManifest(self.manifest_path)
+        manifest.record(self.source, "hash-1", "1", self.target, "page-1")
+        manifest.record(self.source, "hash-2", "1", self.target, "page-2")
+
+        reloaded = UploadManifest(self.manifest_path)
+
+        self.assertEqual(len(reloaded), 1)
+        self.assertEqual(reloaded.get(self.source)["page_id"], "page-2")
+
+    def test_torn_line_is_ignored(self):
+        """Test an interrupted write does not corrupt the manifest."""
+        manifest = UploadManifest(self.manifest_path)
+        manifest.record(self.source, "hash-1", "1", self.target, "page-1")
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            f.write('{"source": "/tmp/other.md", "ha')
+
+        reloaded = UploadManifest(self.manifest_path)
+
+        self.assertEqual(reloaded.lookup(self.source, "hash-1", "1", self.target), "page-1")
+
+    def test_superseded_lines_are_compacted(self):
+        """Test loading compacts a manifest dominated by stale records."""
+        manifest = UploadManifest(self.manifest_path)
+        for i in range(150):
+            manifest.record(self.source, f"hash-{i}", "1", self.target, f"page-{i}")
+
+        UploadManifest(self.manifest_path)
+
+        with open(self.manifest_path, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()